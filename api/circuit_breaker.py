@@ -0,0 +1,139 @@
+"""
+Circuit breaker for calls to a degraded dependency (the extraction model provider).
+
+closed     calls go through; outcomes are kept for `window_seconds`. Once at least
+           `min_calls` are in the window and the share of failures reaches
+           `error_rate`, the circuit opens.
+open       calls fail immediately (CircuitOpenError with a retry-after) for
+           `open_seconds`, instead of each waiting out the provider's timeout.
+half_open  after that, one probe call goes through; its success closes the circuit,
+           its failure opens it again. Other calls are rejected while it runs.
+
+Callers report each permitted call with `release(probe, ok)`; ok=None means the
+outcome says nothing about the dependency's health (a rejected request, a cancelled
+call) and is not counted. Breakers are used from the event loop and are not thread-safe.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+STATES = (CLOSED, HALF_OPEN, OPEN)
+
+# Suggested retry-after while a half-open probe is in flight.
+PROBE_RETRY_AFTER_SECONDS = 1.0
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"Circuit {name!r} is open; retry after {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float = 30.0,
+        min_calls: int = 20,
+        error_rate: float = 0.5,
+        open_seconds: float = 15.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.clock = clock
+        self.configure(window_seconds, min_calls, error_rate, open_seconds)
+        self.state = CLOSED
+        self.transitions: Dict[str, int] = {state: 0 for state in STATES}
+        self.rejected = 0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        _BREAKERS[name] = self
+
+    def configure(self, window_seconds: float, min_calls: int, error_rate: float, open_seconds: float) -> None:
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.open_seconds = open_seconds
+
+    def acquire(self) -> bool:
+        """Permit a call, or raise CircuitOpenError. Returns True when the call is the half-open probe."""
+        if self.state == OPEN:
+            wait = self._opened_at + self.open_seconds - self.clock()
+            if wait > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, wait)
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self._probing:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, PROBE_RETRY_AFTER_SECONDS)
+            self._probing = True
+            return True
+        return False
+
+    def release(self, probe: bool, ok: Optional[bool]) -> None:
+        """Report how a permitted call ended (ok=None: no verdict on the dependency)."""
+        if probe:
+            self._probing = False
+            if ok is not None:
+                self._transition(CLOSED if ok else OPEN)
+            return
+        if ok is None or self.state != CLOSED:
+            return  # calls that started before the circuit opened don't count afterwards
+        now = self.clock()
+        self._outcomes.append((now, ok))
+        self._failures += not ok
+        while self._outcomes and self._outcomes[0][0] < now - self.window_seconds:
+            self._failures -= not self._outcomes.popleft()[1]
+        calls = len(self._outcomes)
+        if not ok and calls >= self.min_calls and self._failures >= self.error_rate * calls:
+            self._transition(OPEN)
+
+    def window_error_rate(self) -> float:
+        return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+    def reset(self) -> None:
+        self.state = CLOSED
+        self._outcomes.clear()
+        self._failures = 0
+        self._probing = False
+
+    def _transition(self, state: str) -> None:
+        self.state = state
+        self.transitions[state] += 1
+        if state == OPEN:
+            self._opened_at = self.clock()
+        self._outcomes.clear()
+        self._failures = 0
+
+
+# ── Registry (metrics, tests) ─────────────────────────────────────
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+
+def circuit_breaker_metrics() -> Dict[str, Dict[str, object]]:
+    return {
+        name: {
+            "state": breaker.state,
+            "transitions": dict(breaker.transitions),
+            "rejected": breaker.rejected,
+            "window_calls": len(breaker._outcomes),
+            "window_error_rate": breaker.window_error_rate(),
+        }
+        for name, breaker in _BREAKERS.items()
+    }
+
+
+def reset_circuit_breakers() -> None:
+    for breaker in _BREAKERS.values():
+        breaker.reset()
@@ -0,0 +1,194 @@
+"""
+Negotiated response compression (pure ASGI).
+
+Complete responses of a compressible type and at least SOFICCA_COMPRESSION_MIN_BYTES
+(default 1024) are compressed with brotli when the client accepts it and the `brotli`
+package is installed, gzip otherwise. Everything else passes through untouched:
+
+- streamed bodies (NDJSON batch reports, SSE, large files): compressing them would hold
+  records back in the compressor until a block fills up;
+- responses that already carry a Content-Encoding (precompressed static assets);
+- small bodies, where the framing costs more than it saves.
+
+A compressed body is a different representation from the identity one, so it must
+not share its strong validator (RFC 9110 §8.8.3): its ETag gets the coding as a
+suffix (`"<hash>-gzip"`). A 304 answering a suffixed If-None-Match repeats the
+suffixed ETag, and `identity_etag` lets validators compare either form.
+
+Set SOFICCA_COMPRESSION_MIN_BYTES=0 to compress every eligible body, or
+SOFICCA_COMPRESSION=0 to disable the middleware.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+from typing import Dict, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None  # type: ignore[assignment]
+
+COMPRESSION_ENV = "SOFICCA_COMPRESSION"
+COMPRESSION_MIN_BYTES_ENV = "SOFICCA_COMPRESSION_MIN_BYTES"
+DEFAULT_MIN_BYTES = 1024
+
+# Dynamic responses favour speed over ratio; static assets are compressed at build time.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+ENCODING_BROTLI = "br"
+ENCODING_GZIP = "gzip"
+
+COMPRESSIBLE_TYPES: Tuple[str, ...] = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+# Streaming formats, never buffered for compression even when sent in one message.
+STREAMING_TYPES: Tuple[str, ...] = ("application/x-ndjson", "text/event-stream")
+
+
+def compression_enabled() -> bool:
+    return os.environ.get(COMPRESSION_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def compression_min_bytes() -> int:
+    raw = os.environ.get(COMPRESSION_MIN_BYTES_ENV, "").strip()
+    return int(raw) if raw else DEFAULT_MIN_BYTES
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Server preference order."""
+    return (ENCODING_BROTLI, ENCODING_GZIP) if brotli is not None else (ENCODING_GZIP,)
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Sequence[str]) -> Optional[str]:
+    """Pick the accepted encoding with the highest q-value; ties go to server preference."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+    best: Optional[str] = None
+    best_q = 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == ENCODING_BROTLI:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    if content_type.startswith(STREAMING_TYPES):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """The ETag of the `encoding`-coded representation: "abc" -> "abc-gzip", W/"abc" -> W/"abc-gzip"."""
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def identity_etag(etag: str) -> str:
+    """Undo `encoded_etag`, so a coded representation's validator matches its source."""
+    for encoding in (ENCODING_BROTLI, ENCODING_GZIP):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if vary is None:
+        headers["vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None) -> None:
+        self.app = app
+        self.enabled = compression_enabled()
+        self.minimum_size = compression_min_bytes() if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding"), available_encodings())
+        if_none_match = request_headers.get("if-none-match", "")
+        start: Optional[Message] = None
+        # Set once the start message has gone out; later messages are forwarded as-is.
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=list(message.get("headers", [])))
+                if message["status"] == 304 and encoding is not None and "etag" in headers:
+                    # Revalidating the coded representation: answer with its validator.
+                    coded = encoded_etag(headers["etag"], encoding)
+                    if coded.removeprefix("W/") in if_none_match:
+                        headers["etag"] = coded
+                        message = {**message, "headers": headers.raw}
+                if "content-encoding" in headers or not is_compressible(headers.get("content-type", "")):
+                    passthrough = True
+                    await send(message)
+                    return
+                _add_vary(headers)
+                start = {**message, "headers": headers.raw}
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            assert start is not None
+            body = message.get("body", b"")
+            passthrough = True
+            if encoding is None or message.get("more_body", False) or len(body) < self.minimum_size:
+                await send(start)
+                await send(message)
+                return
+            compressed = compress(body, encoding)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(compressed))
+            if "etag" in headers:
+                headers["etag"] = encoded_etag(headers["etag"], encoding)
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+        if start is not None and not passthrough:
+            # Handler finished without a body message.
+            await send(start)
@@ -0,0 +1,56 @@
+"""
+Per-request deadline budgets for AI extraction.
+
+A client can say how long it is willing to wait with `X-Soficca-Deadline-Ms`; without
+the header, SOFICCA_EXTRACTION_DEADLINE_SECONDS applies (0 = no budget, only the
+per-call OpenAI timeout). The header can shorten the configured budget but never
+extend it.
+
+The deadline is absolute (time.monotonic) and travels with the request in a
+ContextVar, so every model call made for it (segments, batch items) draws on the same
+budget: waiting for an OpenAI slot and the call itself are both cut off when it runs
+out, and a call is not started at all once it has.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+DEADLINE_HEADER = "X-Soficca-Deadline-Ms"
+DEADLINE_ENV = "SOFICCA_EXTRACTION_DEADLINE_SECONDS"
+DEFAULT_DEADLINE_SECONDS = 0.0
+
+_deadline: ContextVar[Optional[float]] = ContextVar("soficca_extraction_deadline", default=None)
+
+
+def extraction_deadline_seconds() -> float:
+    raw = os.environ.get(DEADLINE_ENV, "").strip()
+    return max(0.0, float(raw)) if raw else DEFAULT_DEADLINE_SECONDS
+
+
+def deadline_after(header_ms: Optional[int]) -> Optional[float]:
+    """Absolute deadline for a request arriving now, or None when it has no budget."""
+    budgets = [extraction_deadline_seconds()]
+    if header_ms is not None:
+        budgets.append(header_ms / 1000)
+    budgets = [seconds for seconds in budgets if seconds > 0]
+    return time.monotonic() + min(budgets) if budgets else None
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_seconds() -> Optional[float]:
+    """Budget left for the current request (may be negative), or None when unbounded."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
@@ -0,0 +1,186 @@
+"""
+Response encoding for the API.
+
+`FastJSONResponse` encodes straight to bytes: pydantic models through their compiled
+serializer, everything else through orjson when it is installed (pydantic_core's
+encoder otherwise). `FastJSONRoute` lets endpoints skip FastAPI's per-response work
+when it would not change the output:
+
+- endpoints without a response model (or annotated as a plain dict) skip the
+  `jsonable_encoder` walk;
+- endpoints returning an instance of exactly their response model skip the
+  dump / re-validate / serialize round-trip (the instance is already validated).
+
+Anything else (e.g. a dict returned for a model response) still goes through
+FastAPI's validation. `api.main` and every router in `api/routers` use both.
+`FastJSONRoute` rebuilds the handler with `get_request_handler` and reads route
+internals (`secure_cloned_response_field`, `_embed_body_fields`, the `Dependant`
+dataclass) that are only stable within a FastAPI minor release, which is why
+requirements.txt pins FastAPI to 0.115.x.
+
+The bytes match what FastAPI's default path produced: values outside pydantic models
+use `jsonable_encoder`'s per-type encoders (`Decimal` as a number, `timedelta` as
+seconds), and NaN/Infinity raise ValueError (like `JSONResponse`)
+instead of becoming `null`. `api/json_cache.py`, `api/sse.py` and `api/ndjson.py` use
+the same `encode_json`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import functools
+import json
+import math
+import typing
+from typing import Any, Callable, Coroutine, Optional
+
+import pydantic_core
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import ENCODERS_BY_TYPE
+from fastapi.routing import APIRoute, get_request_handler
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    # Same per-type encoders as jsonable_encoder (e.g. Decimal -> number, timedelta -> seconds).
+    for cls in type(obj).__mro__[:-1]:
+        encoder = ENCODERS_BY_TYPE.get(cls)
+        if encoder is not None:
+            return encoder(obj)
+    return pydantic_core.to_jsonable_python(obj)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return any(_has_non_finite(value) for value in obj)
+    if isinstance(obj, BaseModel):
+        extra = obj.__pydantic_extra__ or {}
+        return _has_non_finite(obj.__dict__) or _has_non_finite(extra)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _has_non_finite(vars(obj))
+    return False
+
+
+def _stdlib_json(content: Any) -> bytes:
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def encode_json(content: Any) -> bytes:
+    """Compact UTF-8 JSON; pydantic models are serialized by alias, like response models.
+
+    Raises ValueError for NaN/Infinity, as `JSONResponse` does.
+    """
+    if isinstance(content, BaseModel):
+        body = content.__pydantic_serializer__.to_json(content, by_alias=True)
+    elif orjson is not None:
+        try:
+            body = orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _stdlib_json(content)  # e.g. ints beyond 64 bits
+    else:
+        return _stdlib_json(content)
+    # orjson and pydantic write NaN/Infinity as null; only bodies with a null need the walk.
+    if b"null" in body and _has_non_finite(content):
+        raise ValueError("Out of range float values are not JSON compliant")
+    return body
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
+def _is_plain_mapping(annotation: Any) -> bool:
+    if annotation is dict:
+        return True
+    if typing.get_origin(annotation) is dict:
+        return typing.get_args(annotation)[1:] in ((), (Any,))
+    return False
+
+
+class FastJSONRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        dependant = self.dependant
+        if self._can_encode_directly():
+            dependant = dataclasses.replace(dependant, call=self._encoding_call(dependant.call))
+        return get_request_handler(
+            dependant=dependant,
+            body_field=self.body_field,
+            status_code=self.status_code,
+            response_class=self.response_class,
+            response_field=self.secure_cloned_response_field,
+            response_model_include=self.response_model_include,
+            response_model_exclude=self.response_model_exclude,
+            response_model_by_alias=self.response_model_by_alias,
+            response_model_exclude_unset=self.response_model_exclude_unset,
+            response_model_exclude_defaults=self.response_model_exclude_defaults,
+            response_model_exclude_none=self.response_model_exclude_none,
+            dependency_overrides_provider=self.dependency_overrides_provider,
+            embed_body_fields=self._embed_body_fields,
+        )
+
+    def _response_class(self) -> type:
+        response_class = self.response_class
+        return response_class.value if isinstance(response_class, DefaultPlaceholder) else response_class
+
+    def _can_encode_directly(self) -> bool:
+        # Injected `response: Response` parameters carry headers/status FastAPI would merge.
+        return (
+            issubclass(self._response_class(), FastJSONResponse)
+            and self.dependant.response_param_name is None
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and self.response_model_by_alias
+            and not (
+                self.response_model_exclude_unset
+                or self.response_model_exclude_defaults
+                or self.response_model_exclude_none
+            )
+        )
+
+    def _encoding_call(self, call: Optional[Callable[..., Any]]) -> Callable[..., Any]:
+        assert call is not None
+        response_class = self._response_class()
+        status_code = self.status_code
+        model = self.response_model
+        plain = model is None or _is_plain_mapping(model)
+
+        def encode(result: Any) -> Any:
+            if isinstance(result, Response):
+                return result
+            if plain or type(result) is model:
+                if status_code is None:
+                    return response_class(result)
+                return response_class(result, status_code=status_code)
+            return result
+
+        if asyncio.iscoroutinefunction(call):
+
+            @functools.wraps(call)
+            async def async_wrapper(**values: Any) -> Any:
+                return encode(await call(**values))
+
+            return async_wrapper
+
+        @functools.wraps(call)
+        def wrapper(**values: Any) -> Any:
+            return encode(call(**values))
+
+        return wrapper
+
@@ -0,0 +1,146 @@
+"""
+Process pool for CPU-bound engine work.
+
+Engine handlers are sync and run in Starlette's thread pool, where they share the GIL
+with the event loop. Large batches are instead split into chunks and evaluated in
+worker processes; the handler thread only waits on the results. Small requests stay
+inline, where a process round-trip would cost more than the evaluation itself.
+
+Configuration (environment):
+    SOFICCA_ENGINE_WORKERS          worker processes; 0 (default) disables the pool
+    SOFICCA_ENGINE_POOL_MIN_ITEMS   smallest batch sent to the pool (default 64)
+
+Workers are started with "spawn" (safe alongside the server's threads) and warmed by
+importing the engines, which compiles their rulesets and journey templates, and by
+running one evaluation per engine. `start_engine_pool` waits until every worker has
+warmed up: each startup ping blocks on a barrier shared by all workers, so one fast
+worker cannot answer for the others. Does NOT start any process at import time.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from cardio_triage_v1.validation import evaluate_readiness as evaluate_cardio_report
+from soficca_core.engine import evaluate as evaluate_decision
+
+ENGINE_WORKERS_ENV = "SOFICCA_ENGINE_WORKERS"
+POOL_MIN_ITEMS_ENV = "SOFICCA_ENGINE_POOL_MIN_ITEMS"
+DEFAULT_POOL_MIN_ITEMS = 64
+# Chunks per worker: enough to balance uneven items without paying per-item IPC.
+CHUNKS_PER_WORKER = 4
+STARTUP_TIMEOUT_SECONDS = 120.0
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        raise RuntimeError(f"{name} must be an integer, got {raw!r}")
+
+
+def configured_workers() -> int:
+    return _env_int(ENGINE_WORKERS_ENV, 0)
+
+
+def pool_min_items() -> int:
+    return max(1, _env_int(POOL_MIN_ITEMS_ENV, DEFAULT_POOL_MIN_ITEMS))
+
+
+# Set in each worker by _warm_worker; startup pings wait on it.
+_startup_barrier: Optional[Any] = None
+
+
+def _warm_worker(barrier: Any) -> None:
+    global _startup_barrier
+    _startup_barrier = barrier
+    # Imports above already compiled the rulesets; pen templates compile on import too.
+    import pen_hair_v1.service  # noqa: F401
+
+    evaluate_decision({"state": {}, "context": {}})
+    evaluate_cardio_report({"state": {}, "context": {}})
+
+
+def _ping(_: int) -> int:
+    # Holding this worker until all have arrived makes the executor start the rest.
+    assert _startup_barrier is not None
+    _startup_barrier.wait(STARTUP_TIMEOUT_SECONDS)
+    return os.getpid()
+
+
+def get_engine_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared pool, creating it on first use; None when the pool is disabled."""
+    global _pool, _pool_workers
+    if _pool is not None:
+        return _pool
+    workers = configured_workers()
+    if workers == 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            context = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_warm_worker,
+                initargs=(context.Barrier(workers),),
+            )
+            _pool_workers = workers
+    return _pool
+
+
+def start_engine_pool() -> None:
+    """Create the pool and wait until every worker is started and warmed (call at app startup)."""
+    pool = get_engine_pool()
+    if pool is not None:
+        pids: Set[int] = set(pool.map(_ping, range(_pool_workers)))
+        if len(pids) != _pool_workers:
+            raise RuntimeError(f"engine pool started {len(pids)} of {_pool_workers} workers")
+
+
+def shutdown_engine_pool() -> None:
+    global _pool, _pool_workers
+    with _pool_lock:
+        pool, _pool, _pool_workers = _pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# ── Batch dispatch ────────────────────────────────────────────────
+
+
+def evaluate_decision_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [evaluate_decision(item) for item in items]
+
+
+def run_engine_batch(
+    func: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+    items: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Run `func` over `items`, in the process pool when the batch is large enough.
+
+    `func` must be a module-level function (it is pickled by name) that maps a list of
+    items to a list of results of the same length. Result order matches `items`.
+    Blocks the calling thread; call it from a sync handler, not the event loop.
+    """
+    pool = get_engine_pool() if len(items) >= pool_min_items() else None
+    if pool is None:
+        return func(items)
+    chunk_size = math.ceil(len(items) / (max(1, _pool_workers) * CHUNKS_PER_WORKER))
+    chunks = [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+    results: List[Dict[str, Any]] = []
+    for chunk_results in pool.map(func, chunks):
+        results.extend(chunk_results)
+    return results
@@ -0,0 +1,169 @@
+"""
+Content-addressed cache for AI extraction results.
+
+The key hashes everything that determines an extraction: the whitespace-normalized
+case text, the model, the language hint and a fingerprint of the prompts. Editing
+SYSTEM_INSTRUCTION or USER_PROMPT_TEMPLATE therefore changes every key, and stale
+results are never served.
+
+Two tiers:
+- in memory: LRU of SOFICCA_EXTRACTION_CACHE_SIZE entries (default 512, 0 disables);
+- on disk (optional): one JSON file per key under SOFICCA_EXTRACTION_CACHE_DIR, shared
+  across processes and restarts. Disk hits are promoted to memory. Disk errors never
+  fail an extraction: unreadable files are misses, failed writes are logged and skipped.
+
+Only successful extractions are stored. Values are JSON-compatible dicts and are copied
+on the way in and out, so callers may mutate what they get.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+CACHE_SIZE_ENV = "SOFICCA_EXTRACTION_CACHE_SIZE"
+CACHE_DIR_ENV = "SOFICCA_EXTRACTION_CACHE_DIR"
+DEFAULT_CACHE_SIZE = 512
+
+logger = logging.getLogger("soficca.extraction_cache")
+
+_CACHES: List["ExtractionCache"] = []
+
+
+def normalize_case_text(case_text: str) -> str:
+    return " ".join(case_text.split())
+
+
+def prompt_fingerprint(*prompts: str) -> str:
+    return hashlib.sha256("\0".join(prompts).encode("utf-8")).hexdigest()
+
+
+def extraction_cache_key(case_text: str, model: str, language: str, prompts_fingerprint: str) -> str:
+    material = "\0".join((normalize_case_text(case_text), model, language, prompts_fingerprint))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _env_cache_size() -> int:
+    raw = os.environ.get(CACHE_SIZE_ENV, "").strip()
+    return max(0, int(raw)) if raw else DEFAULT_CACHE_SIZE
+
+
+def _env_cache_dir() -> Optional[Path]:
+    raw = os.environ.get(CACHE_DIR_ENV, "").strip()
+    return Path(raw) if raw else None
+
+
+class ExtractionCache:
+    def __init__(self, name: str, max_size: Optional[int] = None, directory: Optional[Path] = None) -> None:
+        self.name = name
+        self.max_size = _env_cache_size() if max_size is None else max_size
+        self.directory = _env_cache_dir() if directory is None else directory
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        _CACHES.append(self)
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(value)
+        if self.directory is not None:
+            try:
+                value = json.loads(self._path(key).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                value = None
+            if value is not None:
+                self._remember(key, value)
+                with self._lock:
+                    self.disk_hits += 1
+                return copy.deepcopy(value)
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        value = copy.deepcopy(value)
+        self._remember(key, value)
+        if self.directory is not None:
+            self._write(key, value)
+
+    def _write(self, key: str, value: Dict[str, Any]) -> None:
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(value, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as exc:
+            # Full disk or unwritable directory: the result is still served (and kept in memory).
+            logger.warning("extraction_cache_write_failed | cache=%s path=%s error=%s", self.name, path, exc)
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """`get` for async handlers: disk reads go to the thread pool."""
+        if self.directory is None:
+            return self.get(key)
+        return await run_in_threadpool(self.get, key)
+
+    async def aput(self, key: str, value: Dict[str, Any]) -> None:
+        if self.directory is None:
+            self.put(key, value)
+        else:
+            await run_in_threadpool(self.put, key, value)
+
+    def clear(self) -> None:
+        """Drop the memory tier (files on disk are left alone)."""
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "persistent": self.directory is not None,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+
+def extraction_cache_metrics() -> Dict[str, Dict[str, Any]]:
+    return {cache.name: cache.metrics() for cache in _CACHES}
+
+
+def clear_extraction_caches() -> None:
+    for cache in _CACHES:
+        cache.clear()
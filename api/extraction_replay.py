@@ -0,0 +1,253 @@
+"""
+Record/replay provider for the extraction model call (cassettes).
+
+Recording: with SOFICCA_EXTRACTION_RECORD=<file.jsonl>, every successful model call
+appends `{"key", "model", "output", "latency_s"}` to the file. The key hashes the
+whitespace-normalized narrative and model, so the narrative itself is not written. The
+model output can quote it, though, so the text fields that do (the summary, evidence
+`source_text`, PII warnings) are replaced with "[redacted]" before recording. Structured
+field values are kept, which is what replay needs.
+
+Replay: with SOFICCA_EXTRACTION_REPLAY=<file.jsonl>, `_call_openai` returns recorded
+outputs instead of calling the provider, still through the OpenAI concurrency slot, so
+the rest of the pipeline (validation, safety filter, merging, response building) and
+the concurrency limits behave as in production. Narratives without a recording get a
+502, unless SOFICCA_EXTRACTION_REPLAY_SYNTHETIC=1 (load tests only) substitutes a
+recording chosen deterministically from their key: another narrative's fields.
+Replayed outputs carry a warning, report `replay:<cassette>` as their model, and are
+never written to the extraction cache, so nothing replayed outlives the replay.
+
+Latency (SOFICCA_EXTRACTION_REPLAY_LATENCY, seconds), sampled per call:
+    0 | fixed:2.5 | uniform:1,4 | lognormal:<median>,<sigma> | recorded
+with SOFICCA_EXTRACTION_REPLAY_SEED for repeatable runs. SOFICCA_EXTRACTION_REPLAY_ERROR_RATE
+(0-1) makes that share of calls fail with a provider 500 after their latency, to
+exercise the circuit breaker and hedging (api/circuit_breaker.py, api/hedging.py).
+
+Offline load test: scripts/loadtest_extraction.py.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from api.extraction_cache import normalize_case_text
+
+logger = logging.getLogger("cardio_extract")
+
+REPLAY_ENV = "SOFICCA_EXTRACTION_REPLAY"
+RECORD_ENV = "SOFICCA_EXTRACTION_RECORD"
+LATENCY_ENV = "SOFICCA_EXTRACTION_REPLAY_LATENCY"
+SEED_ENV = "SOFICCA_EXTRACTION_REPLAY_SEED"
+SYNTHETIC_ENV = "SOFICCA_EXTRACTION_REPLAY_SYNTHETIC"
+ERROR_RATE_ENV = "SOFICCA_EXTRACTION_REPLAY_ERROR_RATE"
+
+REPLAY_WARNING = "Replayed from a recorded extraction (SOFICCA_EXTRACTION_REPLAY); no AI model was called."
+
+# Sampled latency in seconds, given the recorded latency when there is one.
+LatencySampler = Callable[[Optional[float]], float]
+
+
+def recording_key(case_text: str, model: str) -> str:
+    return hashlib.sha256(f"{normalize_case_text(case_text)}\0{model}".encode("utf-8")).hexdigest()
+
+
+def parse_latency(spec: str, rng: random.Random) -> LatencySampler:
+    """Latency sampler for a spec such as `fixed:2.5`, `uniform:1,4` or `lognormal:3,0.5`."""
+    kind, _, raw_args = spec.strip().partition(":")
+    args = [float(arg) for arg in raw_args.split(",") if arg.strip()]
+    if kind in ("", "0", "none"):
+        return lambda recorded: 0.0
+    if kind == "fixed" and len(args) == 1:
+        return lambda recorded: args[0]
+    if kind == "uniform" and len(args) == 2:
+        return lambda recorded: rng.uniform(args[0], args[1])
+    if kind == "lognormal" and len(args) == 2:
+        # Parameterized by the median, which is what dashboards show.
+        mu = math.log(args[0])
+        return lambda recorded: rng.lognormvariate(mu, args[1])
+    if kind == "recorded" and not args:
+        return lambda recorded: recorded or 0.0
+    raise ValueError(f"Unsupported {LATENCY_ENV} value: {spec!r}")
+
+
+@dataclass(frozen=True)
+class Recording:
+    key: str
+    model: str
+    output: Dict[str, Any]
+    latency_s: Optional[float] = None
+
+
+def load_cassette(path: Path) -> List[Recording]:
+    recordings: List[Recording] = []
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                data = json.loads(line)
+                recordings.append(
+                    Recording(data["key"], data.get("model", ""), data["output"], data.get("latency_s"))
+                )
+    if not recordings:
+        raise ValueError(f"Cassette {path} has no recordings")
+    return recordings
+
+
+class ReplayProvider:
+    def __init__(
+        self,
+        recordings: List[Recording],
+        latency: LatencySampler,
+        synthetic: bool = False,
+        source: str = "replay",
+        error_rate: float = 0.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.recordings = recordings
+        self.latency = latency
+        self.allow_synthetic = synthetic
+        self.source = source
+        self.error_rate = error_rate
+        self.rng = rng or random.Random()
+        self._by_key = {recording.key: recording for recording in recordings}
+        self.replayed = 0
+        self.synthetic = 0
+        self.failed = 0
+
+    def find(self, case_text: str, model: str) -> Optional[Recording]:
+        """The recording for this narrative, a deterministic stand-in when synthetic, or None."""
+        key = recording_key(case_text, model)
+        recording = self._by_key.get(key)
+        if recording is not None:
+            self.replayed += 1
+            return recording
+        if not self.allow_synthetic:
+            return None
+        self.synthetic += 1
+        return self.recordings[int(key[:8], 16) % len(self.recordings)]
+
+    async def replay(
+        self,
+        recording: Recording,
+        on_partial: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """Wait out the sampled latency and return a copy of the recorded output.
+
+        With `on_partial`, the latency is spread over one step per field, reporting the
+        fields completed so far as a streamed completion would.
+        """
+        delay = max(0.0, self.latency(recording.latency_s))
+        output = json.loads(json.dumps(recording.output))
+        fields = [(name, value) for name, value in output.get("fields", {}).items() if value is not None]
+        if on_partial is None or not fields:
+            await asyncio.sleep(delay)
+        else:
+            step = delay / (len(fields) + 1)
+            for count in range(1, len(fields) + 1):
+                await asyncio.sleep(step)
+                await on_partial(dict(fields[:count]))
+            await asyncio.sleep(step)
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.failed += 1
+            raise _injected_error()
+        output["warnings"] = list(output.get("warnings", [])) + [REPLAY_WARNING]
+        return output
+
+
+def _injected_error() -> Exception:
+    import httpx
+    from openai import InternalServerError
+
+    request = httpx.Request("POST", "http://replay.invalid/v1/chat/completions")
+    return InternalServerError(
+        "Injected replay error", response=httpx.Response(500, request=request), body=None
+    )
+
+
+REDACTED_TEXT = "[redacted]"
+
+
+def redact_recorded_output(output: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a model output without the free text that may quote the narrative."""
+    redacted = dict(output)
+    if "structured_clinical_summary" in redacted:
+        redacted["structured_clinical_summary"] = REDACTED_TEXT
+    if isinstance(redacted.get("field_evidence"), list):
+        redacted["field_evidence"] = [
+            {**item, "source_text": REDACTED_TEXT} if isinstance(item, dict) and "source_text" in item else item
+            for item in redacted["field_evidence"]
+        ]
+    if isinstance(redacted.get("pii_warnings"), list):
+        redacted["pii_warnings"] = [REDACTED_TEXT for _ in redacted["pii_warnings"]]
+    return redacted
+
+
+class CassetteRecorder:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _append(self, line: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line)
+
+    async def record(self, case_text: str, model: str, output: Dict[str, Any], latency_s: float) -> None:
+        line = json.dumps(
+            {
+                "key": recording_key(case_text, model),
+                "model": model,
+                "output": redact_recorded_output(output),
+                "latency_s": round(latency_s, 4),
+            },
+            ensure_ascii=False,
+        )
+        await run_in_threadpool(self._append, line + "\n")
+
+
+# ── Process-wide configuration ────────────────────────────────────
+
+_replay: Optional[Tuple[Tuple[str, ...], ReplayProvider]] = None
+
+
+def get_replay_provider() -> Optional[ReplayProvider]:
+    """The provider for the current SOFICCA_EXTRACTION_REPLAY settings (reloaded when they change)."""
+    global _replay
+    path = os.environ.get(REPLAY_ENV, "").strip()
+    if not path:
+        return None
+    config = (
+        path,
+        os.environ.get(LATENCY_ENV, "0"),
+        os.environ.get(SEED_ENV, ""),
+        os.environ.get(SYNTHETIC_ENV, ""),
+        os.environ.get(ERROR_RATE_ENV, ""),
+    )
+    if _replay is None or _replay[0] != config:
+        seed = config[2].strip()
+        rng = random.Random(int(seed)) if seed else random.Random()
+        provider = ReplayProvider(
+            load_cassette(Path(path)),
+            parse_latency(config[1], rng),
+            synthetic=config[3].strip().lower() in ("1", "true", "yes", "on"),
+            error_rate=float(config[4]) if config[4].strip() else 0.0,
+            rng=rng,
+            source=f"replay:{Path(path).name}",
+        )
+        logger.warning("extraction_replay_enabled | cassette=%s recordings=%d", path, len(provider.recordings))
+        _replay = (config, provider)
+    return _replay[1]
+
+
+def get_recorder() -> Optional[CassetteRecorder]:
+    path = os.environ.get(RECORD_ENV, "").strip()
+    return CassetteRecorder(Path(path)) if path else None
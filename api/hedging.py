@@ -0,0 +1,85 @@
+"""
+Hedged calls: when an attempt is slower than usual, start a second one and take
+whichever answers first.
+
+The hedge delay is a high quantile (p95 by default) of recent successful call
+latencies, so roughly one call in twenty gets a second attempt and the tail is cut to
+about twice the delay instead of the provider's worst case. Until enough latencies
+have been seen there is no delay and no hedging. A hedge is only started when
+`may_hedge()` allows it (the caller checks for a free slot and a closed circuit);
+the losing attempt is cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+LATENCY_SAMPLES = 500
+
+HEDGE_LAUNCHED = "launched"
+HEDGE_WON = "won"
+HEDGE_WASTED = "wasted"
+HEDGE_SKIPPED = "skipped"
+
+
+class LatencyTracker:
+    """The last LATENCY_SAMPLES successful call latencies, in seconds."""
+
+    def __init__(self, size: int = LATENCY_SAMPLES) -> None:
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float, min_samples: int) -> Optional[float]:
+        if len(self._samples) < max(1, min_samples):
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+
+async def hedged(
+    primary: Callable[[], Awaitable[T]],
+    secondary: Callable[[], Awaitable[T]],
+    delay: Optional[float],
+    may_hedge: Callable[[], bool],
+    on_event: Callable[[str], None] = lambda event: None,
+) -> T:
+    """Run `primary()`; if it has not finished after `delay` seconds, also run `secondary()`.
+
+    Returns the first successful result. If every attempt fails, the primary's error is
+    raised. `on_event` receives "launched", "skipped" (delay passed, hedge not allowed),
+    and then "won" (the hedge answered first) or "wasted" (the primary did).
+    """
+    if delay is None:
+        return await primary()
+    first = asyncio.ensure_future(primary())
+    tasks: List["asyncio.Future[T]"] = [first]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            if may_hedge():
+                tasks.append(asyncio.ensure_future(secondary()))
+                on_event(HEDGE_LAUNCHED)
+            else:
+                on_event(HEDGE_SKIPPED)
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task in done and task.exception() is None:
+                    if len(tasks) > 1:
+                        on_event(HEDGE_WASTED if task is first else HEDGE_WON)
+                    return task.result()
+        return first.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
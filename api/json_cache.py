@@ -0,0 +1,78 @@
+"""Pre-encoded JSON payloads served with strong ETags and conditional 304s."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from starlette.requests import Request
+
+from starlette.responses import Response
+
+from api.compression import identity_etag
+from api.encoding import encode_json
+
+CONTRACT_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+FIXTURE_CACHE_CONTROL = "public, no-cache"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison (RFC 9110 §13.1.2); a compressed copy's
+    # validator ("<hash>-gzip", api/compression.py) matches the body it was made from.
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate == "*" or identity_etag(candidate.removeprefix("W/")) == etag for candidate in candidates)
+
+
+class PrecomputedJSON:
+    """A JSON payload encoded once, with a strong ETag derived from its bytes."""
+
+    def __init__(self, payload: Any, cache_control: str = CONTRACT_CACHE_CONTROL) -> None:
+        self.payload = payload
+        self.body = encode_json(payload)
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+        self.cache_control = cache_control
+
+    def headers(self) -> Dict[str, str]:
+        return {"ETag": self.etag, "Cache-Control": self.cache_control}
+
+    def response(self, request: Request) -> Response:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, self.etag):
+            return Response(status_code=304, headers=self.headers())
+        return Response(content=self.body, media_type="application/json", headers=self.headers())
+
+
+class FileBackedJSON:
+    """A JSON file served as PrecomputedJSON, re-read only when its mtime or size changes.
+
+    Each access costs one stat(); the file is parsed and encoded again only after it
+    changes on disk, so edits to fixtures show up without a restart.
+    """
+
+    def __init__(self, path: Path, cache_control: str = FIXTURE_CACHE_CONTROL) -> None:
+        self.path = path
+        self.cache_control = cache_control
+        self._lock = threading.Lock()
+        # (mtime_ns, size) and the payload encoded from that version of the file.
+        self._entry: Optional[Tuple[Tuple[int, int], PrecomputedJSON]] = None
+
+    def get(self) -> PrecomputedJSON:
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entry
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        with self._lock:
+            entry = self._entry
+            if entry is None or entry[0] != signature:
+                with self.path.open("r", encoding="utf-8") as handle:
+                    entry = (signature, PrecomputedJSON(json.load(handle), cache_control=self.cache_control))
+                self._entry = entry
+            return entry[1]
+
+    def response(self, request: Request) -> Response:
+        return self.get().response(request)
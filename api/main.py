@@ -12,21 +12,44 @@ This is a thin FastAPI adapter over the deterministic engine.
 
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
-from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, ConfigDict, Field
+from fastapi.responses import RedirectResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from cardio_triage_v1.decision_contract import assert_valid_report
 from cardio_triage_v1.schema import CardioReport
 from cardio_triage_v1.validation import evaluate_readiness as evaluate_cardio_report
 from soficca_core.engine import evaluate as evaluate_decision
+from soficca_core.errors import make_error
+from soficca_core.timing import STAGE_CONTRACT, current_stage_timings
+
+from api.compression import CompressionMiddleware
+from api.encoding import FastJSONResponse, FastJSONRoute
+from api.extraction_cache import extraction_cache_metrics
+from api.engine_pool import evaluate_decision_items, run_engine_batch, shutdown_engine_pool, start_engine_pool
+from api.json_cache import FileBackedJSON, PrecomputedJSON
+from api.metrics import PROMETHEUS_CONTENT_TYPE, REGISTRY, MetricsMiddleware, record_decision_report
+from api.openai_client import close_openai_client
+from api.profiling import ProfilingMiddleware, profiled, start_sampler_from_env, stop_sampler
+from api.timing import StageTimingMiddleware
+from api.single_flight import SingleFlight, canonical_key, single_flight_metrics
+from api.static_assets import MANIFEST_NAME, PrecompressedStaticFiles
+from api.ndjson import (
+    NDJSON_MEDIA_TYPE,
+    MAX_NDJSON_LINE_BYTES,
+    NdjsonLine,
+    NdjsonStreamingResponse,
+    iter_ndjson_line_batches,
+    ndjson_dumps,
+)
 
+from api.routers.admin_router import router as admin_router
 from api.routers.dermatology_router import router as dermatology_router
 from api.routers.pen_router import router as pen_router
 from api.routers.cardio_pilot_router import router as cardio_pilot_router
@@ -225,10 +248,30 @@ class CardioReportRequest(BaseModel):
     context: Dict[str, Any] = Field(default_factory=dict)
 
 
+# -----------------------------
+# Fixtures (resolved from the repository, not the working directory)
+# -----------------------------
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES_DIR = PROJECT_ROOT / "examples"
+CARDIO_DEMO_DIR = PROJECT_ROOT / "ui" / "cardio-demo"
+# Output of scripts/build_demo_assets.py (hashed + precompressed); served when present.
+CARDIO_DEMO_BUILD_DIR = Path(os.environ.get("SOFICCA_DEMO_BUILD_DIR") or PROJECT_ROOT / "build" / "cardio-demo")
+
+_CARDIO_MANUAL_REQUESTS = FileBackedJSON(EXAMPLES_DIR / "cardio_v1_manual_requests.json")
+_CARDIO_SCENARIOS = FileBackedJSON(EXAMPLES_DIR / "cardio_v1_scenarios.json")
+DEMO_EXAMPLES: Dict[str, FileBackedJSON] = {
+    "missing_info": FileBackedJSON(EXAMPLES_DIR / "01_missing_info.json"),
+    "decided_safe": FileBackedJSON(EXAMPLES_DIR / "02_decided_safe.json"),
+    "decided_safe_output": FileBackedJSON(EXAMPLES_DIR / "02_decided_safe_output.json"),
+    "safety_escalation": FileBackedJSON(EXAMPLES_DIR / "03_safety_escalation.json"),
+}
+
+
 # -----------------------------
 # App
 # -----------------------------
-app = FastAPI(title="Soficca Core API (Decision-First)", version="0.3.0")
+app = FastAPI(title="Soficca Core API (Decision-First)", version="0.3.0", default_response_class=FastJSONResponse)
+app.router.route_class = FastJSONRoute
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Permite que el repo 'pen' se conecte desde cualquier Codespace o localhost
@@ -236,7 +279,25 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.mount("/demo/cardio", StaticFiles(directory="ui/cardio-demo", html=True), name="cardio-demo")
+app.add_middleware(StageTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(ProfilingMiddleware)
+# Outermost, so the profiling wrapper and timing headers see uncompressed bodies.
+app.add_middleware(CompressionMiddleware)
+# Large batches go to a process pool when SOFICCA_ENGINE_WORKERS > 0 (see api/engine_pool.py).
+app.add_event_handler("startup", start_engine_pool)
+app.add_event_handler("shutdown", shutdown_engine_pool)
+app.add_event_handler("startup", start_sampler_from_env)
+app.add_event_handler("shutdown", stop_sampler)
+app.add_event_handler("shutdown", close_openai_client)
+app.mount(
+    "/demo/cardio",
+    PrecompressedStaticFiles(
+        directory=CARDIO_DEMO_BUILD_DIR if (CARDIO_DEMO_BUILD_DIR / MANIFEST_NAME).is_file() else CARDIO_DEMO_DIR,
+        html=True,
+    ),
+    name="cardio-demo",
+)
 
 
 @app.get("/")
@@ -256,31 +317,76 @@ def healthz() -> Dict[str, Any]:
     return {"ok": True, "service": "Soficca Core API", "mode": "decision_first"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics() -> Response:
+    return Response(content=REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.get("/demo")
 def demo_index() -> RedirectResponse:
     return RedirectResponse(url="/demo/cardio")
 
 
+# Contract schemas never change while the process runs: encode them once.
+_DECISION_REPORT_CONTRACT = PrecomputedJSON(DECISION_REPORT_V0_3_SCHEMA)
+_CARDIO_CONTRACT = PrecomputedJSON(CardioReport.model_json_schema())
+
+
 @app.get("/contract")
-def contract() -> Dict[str, Any]:
+def contract(request: Request) -> Response:
     # Returns the canonical Decision Report schema (v0.3)
-    return DECISION_REPORT_V0_3_SCHEMA
+    return _DECISION_REPORT_CONTRACT.response(request)
+
 
-@app.get("/v1/cardio/contract")
 def cardio_contract() -> Dict[str, Any]:
-    return CardioReport.model_json_schema()
+    """Cardio report JSON schema (the payload served by /v1/cardio/contract)."""
+    return _CARDIO_CONTRACT.payload
+
+
+@app.get("/v1/cardio/contract")
+def cardio_contract_endpoint(request: Request) -> Response:
+    return _CARDIO_CONTRACT.response(request)
 
 
 @app.get("/v1/cardio/manual-requests")
-def cardio_manual_requests() -> Dict[str, Any]:
-    payload_path = Path("examples/cardio_v1_manual_requests.json")
-    with payload_path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+def cardio_manual_requests(request: Request) -> Response:
+    return _CARDIO_MANUAL_REQUESTS.response(request)
+
+
+@app.get("/v1/cardio/scenarios")
+def cardio_scenarios(request: Request) -> Response:
+    return _CARDIO_SCENARIOS.response(request)
+
+
+@app.get("/v1/examples/{name}")
+def demo_example(name: str, request: Request) -> Response:
+    example = DEMO_EXAMPLES.get(name)
+    if example is None:
+        raise HTTPException(status_code=404, detail=f"Unknown example: {name}")
+    return example.response(request)
+
+
+# Identical concurrent payloads (retries, double submits) share one evaluation.
+_EVALUATE_FLIGHT = SingleFlight("evaluate")
+_CARDIO_REPORT_FLIGHT = SingleFlight("cardio_report")
+
+
+@app.get("/v1/metrics")
+def v1_metrics() -> Dict[str, Any]:
+    return {"single_flight": single_flight_metrics(), "extraction_cache": extraction_cache_metrics()}
 
 
 @app.post("/v1/evaluate")
+@profiled
 def v1_evaluate(payload: EvaluateRequest) -> Dict[str, Any]:
-    report = evaluate_decision({"state": payload.state, "context": payload.context})
+    input_data = {"state": payload.state, "context": payload.context}
+    report = _EVALUATE_FLIGHT.run(canonical_key(input_data), _evaluate_report, input_data)
+    record_decision_report("soficca_core", report)
+    return report
+
+
+def _evaluate_report(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    report = evaluate_decision(input_data)
 
     # Adapter invariant enforcement (demo-safe)
     decision = report.get("decision", {})
@@ -295,17 +401,79 @@ def v1_evaluate(payload: EvaluateRequest) -> Dict[str, Any]:
 
 
 @app.post("/v1/evaluate/batch", response_model=BatchEvaluateResponse)
+@profiled
 def v1_evaluate_batch(payload: BatchEvaluateRequest) -> BatchEvaluateResponse:
-    results: List[Dict[str, Any]] = []
-    for item in payload.items:
-        results.append(evaluate_decision({"state": item.state, "context": item.context}))
+    items = [{"state": item.state, "context": item.context} for item in payload.items]
+    results = run_engine_batch(evaluate_decision_items, items)
+    for report in results:
+        record_decision_report("soficca_core", report)
     return BatchEvaluateResponse(results=results)
 
+
+def _evaluate_ndjson_lines(lines: List[NdjsonLine]) -> bytes:
+    """Evaluate one received chunk of NDJSON items; every line yields exactly one output line."""
+    output = bytearray()
+    for line_number, raw in lines:
+        if raw is None:
+            error = make_error("LINE_TOO_LONG", f"NDJSON line exceeds {MAX_NDJSON_LINE_BYTES} bytes.")
+            output += ndjson_dumps({"line": line_number, "error": error})
+            continue
+        try:
+            item = EvaluateRequest.model_validate_json(raw)
+        except ValidationError as e:
+            first = e.errors(include_url=False)[0]
+            code = "INVALID_JSON" if first["type"] == "json_invalid" else "INVALID_ITEM"
+            path = "$" + "".join(f"[{loc}]" if isinstance(loc, int) else f".{loc}" for loc in first["loc"])
+            error = make_error(code, first["msg"], path=path)
+            output += ndjson_dumps({"line": line_number, "error": error})
+            continue
+        report = evaluate_decision({"state": item.state, "context": item.context})
+        record_decision_report("soficca_core", report)
+        output += ndjson_dumps({"line": line_number, "report": report})
+    return bytes(output)
+
+
+async def _stream_batch_reports(request: Request) -> AsyncIterator[bytes]:
+    # Pull-based: the next body chunk is only read after the previous output was sent.
+    async for lines in iter_ndjson_line_batches(request.stream()):
+        yield await run_in_threadpool(_evaluate_ndjson_lines, lines)
+
+
+@app.post(
+    "/v1/evaluate/batch/stream",
+    response_class=NdjsonStreamingResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"$ref": "#/components/schemas/EvaluateRequest"}}},
+        }
+    },
+)
+async def v1_evaluate_batch_stream(request: Request) -> NdjsonStreamingResponse:
+    """Streaming batch: one EvaluateRequest per NDJSON line in, one NDJSON line out per item.
+
+    Output lines are `{"line": n, "report": {...}}` or `{"line": n, "error": {code, message, path, meta}}`;
+    blank lines are skipped. Results are written as soon as each received chunk is evaluated.
+    """
+    return NdjsonStreamingResponse(_stream_batch_reports(request))
+
+
 @app.post("/v1/cardio/report")
+@profiled
 def v1_cardio_report(payload: CardioReportRequest) -> Dict[str, Any]:
-    raw_report = evaluate_cardio_report({"state": payload.state, "context": payload.context})
-    return assert_valid_report(raw_report).model_dump(mode="json")
+    input_data = {"state": payload.state, "context": payload.context}
+    report = _CARDIO_REPORT_FLIGHT.run(canonical_key(input_data), _cardio_report, input_data)
+    record_decision_report("cardio_triage_v1", report)
+    return report
+
+
+def _cardio_report(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    raw_report = evaluate_cardio_report(input_data)
+    report = assert_valid_report(raw_report).model_dump(mode="json")
+    current_stage_timings().mark(STAGE_CONTRACT)
+    return report
 
+app.include_router(admin_router)
 app.include_router(dermatology_router)
 app.include_router(pen_router)
 app.include_router(cardio_pilot_router)
@@ -0,0 +1,410 @@
+"""
+Prometheus text metrics for the API (served at GET /metrics).
+
+Counters, up/down gauges and histograms are aggregated per thread: every thread writes
+only to its own shard (a plain dict), so recording takes no lock, and a scrape sums the
+shards. Shards of threads that have exited (e.g. retired threadpool workers) are folded
+into one retired shard, so their number stays bounded by the live threads. Values that already live elsewhere (pen decision caches, single-flight groups,
+the extraction cache, the DB pool) are read by collectors at scrape time.
+
+Label values must come from bounded sets (route templates, rule IDs, statuses).
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from pen_hair_v1.metrics import decision_cache_metrics
+
+from api.circuit_breaker import STATES, circuit_breaker_metrics
+from api.extraction_cache import extraction_cache_metrics
+from api.single_flight import single_flight_metrics
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+OPENAI_LATENCY_BUCKETS: Tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0)
+
+Labels = Tuple[str, ...]
+# (metric name, label values) -> value, or [bucket counts..., count, sum] for histograms
+_Shard = Dict[Tuple[str, Labels], Any]
+# (name, type, help, [(labels, value)]) produced by scrape-time collectors
+Family = Tuple[str, str, str, List[Tuple[Mapping[str, str], float]]]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, _Shard]] = []
+        self._retired: _Shard = {}
+        self._shards_lock = threading.Lock()
+        self._metrics: List["_Metric"] = []
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: _Shard = {}
+            with self._shards_lock:
+                self._retire_dead_shards()
+                self._shards.append((threading.current_thread(), shard))
+            self._local.shard = shard
+            return shard
+
+    def register(self, metric: "_Metric") -> None:
+        self._metrics.append(metric)
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        self._collectors.append(collector)
+
+    def shard_count(self) -> int:
+        with self._shards_lock:
+            self._retire_dead_shards()
+            return len(self._shards)
+
+    def _retire_dead_shards(self) -> None:
+        # Caller holds _shards_lock. A dead thread no longer writes to its shard.
+        live: List[Tuple[threading.Thread, _Shard]] = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                _fold(self._retired, shard)
+        self._shards = live
+
+    def _merged(self) -> Dict[Tuple[str, Labels], Any]:
+        merged: Dict[Tuple[str, Labels], Any] = {}
+        with self._shards_lock:
+            self._retire_dead_shards()
+            shards = [shard for _, shard in self._shards]
+            _fold(merged, self._retired)
+        for shard in shards:
+            # dict.copy() is atomic under the GIL, so owners can keep writing meanwhile.
+            _fold(merged, shard.copy())
+        return merged
+
+    def render(self) -> str:
+        merged = self._merged()
+        lines: List[str] = []
+        for metric in self._metrics:
+            metric.render(lines, merged)
+        for collector in self._collectors:
+            for name, kind, help_text, samples in collector():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _fold(target: _Shard, shard: _Shard) -> None:
+    for key, value in shard.items():
+        if isinstance(value, list):
+            total = target.get(key)
+            target[key] = list(value) if total is None else [a + b for a, b in zip(total, value)]
+        else:
+            target[key] = target.get(key, 0) + value
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, registry: MetricsRegistry, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.registry = registry
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        registry.register(self)
+
+    def _header(self, lines: List[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+
+    def _samples(self, merged: Dict[Tuple[str, Labels], Any]) -> List[Tuple[Labels, Any]]:
+        return sorted((labels, value) for (name, labels), value in merged.items() if name == self.name)
+
+    def render(self, lines: List[str], merged: Dict[Tuple[str, Labels], Any]) -> None:
+        self._header(lines)
+        for labels, value in self._samples(merged):
+            lines.append(f"{self.name}{_format_labels(dict(zip(self.labelnames, labels)))} {_format_value(value)}")
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        shard = self.registry.shard()
+        key = (self.name, labels)
+        shard[key] = shard.get(key, 0) + amount
+
+
+class Gauge(Counter):
+    """Up/down gauge; inc and dec may happen on different threads (shards are summed)."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(registry, name, help_text, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self.registry.shard()
+        key = (self.name, labels)
+        state = shard.get(key)
+        if state is None:
+            # one slot per bucket plus +Inf, then count and sum
+            state = shard[key] = [0] * (len(self.buckets) + 3)
+        state[bisect_left(self.buckets, value)] += 1
+        state[-2] += 1
+        state[-1] += value
+
+    def render(self, lines: List[str], merged: Dict[Tuple[str, Labels], Any]) -> None:
+        self._header(lines)
+        for labels, state in self._samples(merged):
+            base = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), state):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels({**base, 'le': _format_value(bound)})} {cumulative}")
+            lines.append(f"{self.name}_count{_format_labels(base)} {state[-2]}")
+            lines.append(f"{self.name}_sum{_format_labels(base)} {_format_value(state[-1])}")
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = Histogram(
+    REGISTRY,
+    "soficca_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(REGISTRY, "soficca_http_requests_in_flight", "HTTP requests being served.", ("method",))
+DECISIONS = Counter(REGISTRY, "soficca_decisions_total", "Engine decisions by status.", ("engine", "status"))
+RULE_TRIGGERS = Counter(REGISTRY, "soficca_rule_triggers_total", "Rules triggered, from rules_triggered.", ("engine", "rule_id"))
+POLICY_TRIGGERS = Counter(
+    REGISTRY, "soficca_policy_triggers_total", "Safety policies triggered, from the policy trace.", ("engine", "policy_id")
+)
+OPENAI_EXTRACTION_SECONDS = Histogram(
+    REGISTRY,
+    "soficca_openai_extraction_duration_seconds",
+    "OpenAI extraction call latency by outcome.",
+    ("model", "outcome"),
+    buckets=OPENAI_LATENCY_BUCKETS,
+)
+EXTRACTIONS = Counter(
+    REGISTRY, "soficca_extractions_total", "Extraction requests by where the result came from.", ("source",)
+)
+OPENAI_CALLS_REJECTED = Counter(
+    REGISTRY,
+    "soficca_openai_calls_rejected_total",
+    "Extraction model calls refused before reaching the provider (circuit_open, deadline).",
+    ("reason",),
+)
+OPENAI_HEDGES = Counter(
+    REGISTRY, "soficca_openai_hedges_total", "Hedged extraction model calls by outcome.", ("outcome",)
+)
+
+
+# ── Recording helpers ─────────────────────────────────────────────
+
+
+def record_decision(engine: str, status: Any, rules_triggered: Iterable[str] = (), policies_triggered: Iterable[str] = ()) -> None:
+    DECISIONS.inc(engine, str(getattr(status, "value", status)))
+    for rule_id in rules_triggered:
+        RULE_TRIGGERS.inc(engine, rule_id)
+    for policy_id in policies_triggered:
+        POLICY_TRIGGERS.inc(engine, policy_id)
+
+
+def record_decision_report(engine: str, report: Mapping[str, Any]) -> None:
+    """Record a soficca_core / cardio report dict (decision.status, rules and policy trace)."""
+    trace = report.get("trace") or {}
+    record_decision(
+        engine,
+        (report.get("decision") or {}).get("status"),
+        trace.get("rules_triggered") or (),
+        (trace.get("policy_trace") or {}).get("triggered") or (),
+    )
+
+
+# ── Scrape-time collectors ────────────────────────────────────────
+
+
+def _cache_families() -> List[Family]:
+    caches = decision_cache_metrics()
+    return [
+        ("soficca_cache_hits_total", "counter", "Decision cache hits.", [({"cache": name}, m["hits"]) for name, m in caches.items()]),
+        ("soficca_cache_misses_total", "counter", "Decision cache misses.", [({"cache": name}, m["misses"]) for name, m in caches.items()]),
+        ("soficca_cache_hit_ratio", "gauge", "Decision cache hit ratio.", [({"cache": name}, m["hit_rate"]) for name, m in caches.items()]),
+        ("soficca_cache_entries", "gauge", "Decision cache entries.", [({"cache": name}, m["size"]) for name, m in caches.items()]),
+    ]
+
+
+def _single_flight_families() -> List[Family]:
+    groups = single_flight_metrics()
+    return [
+        (
+            f"soficca_single_flight_{counter}_total",
+            "counter",
+            f"Single-flight {counter} per group.",
+            [({"group": name}, values[counter]) for name, values in groups.items()],
+        )
+        for counter in ("calls", "executions", "coalesced")
+    ] + [
+        (
+            "soficca_single_flight_in_flight",
+            "gauge",
+            "Single-flight in_flight per group.",
+            [({"group": name}, values["in_flight"]) for name, values in groups.items()],
+        )
+    ]
+
+
+def _extraction_cache_families() -> List[Family]:
+    caches = extraction_cache_metrics()
+    return [
+        (
+            f"soficca_extraction_cache_{counter}_total",
+            "counter",
+            f"AI extraction cache {counter.replace('_', ' ')}.",
+            [({"cache": name}, values[counter]) for name, values in caches.items()],
+        )
+        for counter in ("hits", "disk_hits", "misses")
+    ] + [
+        (
+            "soficca_extraction_cache_size",
+            "gauge",
+            "AI extraction cache size.",
+            [({"cache": name}, values["size"]) for name, values in caches.items()],
+        )
+    ]
+
+
+def _circuit_breaker_families() -> List[Family]:
+    breakers = circuit_breaker_metrics()
+    return [
+        (
+            "soficca_circuit_breaker_state",
+            "gauge",
+            "Circuit breaker state (1 for the current one).",
+            [
+                ({"breaker": name, "state": state}, int(values["state"] == state))
+                for name, values in breakers.items()
+                for state in STATES
+            ],
+        ),
+        (
+            "soficca_circuit_breaker_transitions_total",
+            "counter",
+            "Circuit breaker transitions into each state.",
+            [
+                ({"breaker": name, "state": state}, values["transitions"][state])
+                for name, values in breakers.items()
+                for state in STATES
+            ],
+        ),
+        (
+            "soficca_circuit_breaker_rejected_total",
+            "counter",
+            "Calls the circuit breaker rejected.",
+            [({"breaker": name}, values["rejected"]) for name, values in breakers.items()],
+        ),
+        (
+            "soficca_circuit_breaker_window_error_rate",
+            "gauge",
+            "Failure share of the calls in the circuit breaker's window.",
+            [({"breaker": name}, values["window_error_rate"]) for name, values in breakers.items()],
+        ),
+    ]
+
+
+def _db_pool_families() -> List[Family]:
+    # Only report a pool the app created; never import asyncpg just to scrape.
+    db_pool = sys.modules.get("db.pool")
+    pool = getattr(db_pool, "_pool", None) if db_pool is not None else None
+    if pool is None:
+        return []
+    return [
+        ("soficca_db_pool_size", "gauge", "DB pool connections open.", [({}, pool.get_size())]),
+        ("soficca_db_pool_idle", "gauge", "DB pool connections idle.", [({}, pool.get_idle_size())]),
+        ("soficca_db_pool_max_size", "gauge", "DB pool maximum size.", [({}, pool.get_max_size())]),
+    ]
+
+
+REGISTRY.add_collector(_cache_families)
+REGISTRY.add_collector(_single_flight_families)
+REGISTRY.add_collector(_extraction_cache_families)
+REGISTRY.add_collector(_circuit_breaker_families)
+REGISTRY.add_collector(_db_pool_families)
+
+
+# ── Middleware ────────────────────────────────────────────────────
+
+
+class MetricsMiddleware:
+    """Request latency by route template and in-flight requests (pure ASGI, streaming-safe)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc(method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec(method)
+            # FastAPI sets scope["route"] once routed; unmatched paths share one label.
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, method, route, str(status))
@@ -0,0 +1,92 @@
+"""
+Splitting long narratives into overlapping segments for parallel extraction.
+
+Segments end at a sentence (or failing that, word) boundary in their last half and the
+next one starts up to `overlap_chars` earlier, at a sentence or word start, so a finding
+cut by one boundary is read whole by the neighbouring segment. Offsets always refer to
+the original text.
+
+Configuration (environment):
+    SOFICCA_EXTRACTION_SEGMENT_CHARS          segment length; longer narratives are split (default 6000, 0 = never)
+    SOFICCA_EXTRACTION_SEGMENT_OVERLAP_CHARS  overlap between neighbours (default 300)
+    SOFICCA_EXTRACTION_MAX_SEGMENTS           segments are lengthened to stay under this (default 8)
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+from dataclasses import dataclass
+from typing import List
+
+SEGMENT_CHARS_ENV = "SOFICCA_EXTRACTION_SEGMENT_CHARS"
+SEGMENT_OVERLAP_ENV = "SOFICCA_EXTRACTION_SEGMENT_OVERLAP_CHARS"
+MAX_SEGMENTS_ENV = "SOFICCA_EXTRACTION_MAX_SEGMENTS"
+DEFAULT_SEGMENT_CHARS = 6000
+DEFAULT_SEGMENT_OVERLAP_CHARS = 300
+DEFAULT_MAX_SEGMENTS = 8
+
+_SENTENCE_END = re.compile(r"[.!?;]\s+|\n\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class NarrativeSegment:
+    index: int
+    start: int
+    end: int
+    text: str
+
+
+def segment_chars() -> int:
+    raw = os.environ.get(SEGMENT_CHARS_ENV, "").strip()
+    return max(0, int(raw)) if raw else DEFAULT_SEGMENT_CHARS
+
+
+def segment_overlap_chars() -> int:
+    raw = os.environ.get(SEGMENT_OVERLAP_ENV, "").strip()
+    return max(0, int(raw)) if raw else DEFAULT_SEGMENT_OVERLAP_CHARS
+
+
+def max_segments() -> int:
+    raw = os.environ.get(MAX_SEGMENTS_ENV, "").strip()
+    return max(1, int(raw)) if raw else DEFAULT_MAX_SEGMENTS
+
+
+def _cut_before(text: str, low: int, high: int) -> int:
+    """Last sentence end in text[low:high], else last whitespace, else high."""
+    cut = None
+    for match in _SENTENCE_END.finditer(text, low, high):
+        cut = match.end()
+    if cut is None:
+        for match in _WHITESPACE.finditer(text, low, high):
+            cut = match.end()
+    return cut if cut is not None else high
+
+
+def _start_after(text: str, low: int, high: int) -> int:
+    """First sentence start in text[low:high], else first word start, else low."""
+    for pattern in (_SENTENCE_END, _WHITESPACE):
+        match = pattern.search(text, low, high)
+        if match is not None and match.end() < high:
+            return match.end()
+    return low
+
+
+def split_narrative(text: str, max_chars: int, overlap_chars: int, limit: int = DEFAULT_MAX_SEGMENTS) -> List[NarrativeSegment]:
+    """Overlapping segments covering `text`; a single segment when it fits in `max_chars` (or max_chars is 0)."""
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [NarrativeSegment(0, 0, len(text), text)]
+    # Very long texts get longer segments rather than more model calls.
+    max_chars = max(max_chars, math.ceil(len(text) / limit) + overlap_chars)
+    overlap_chars = min(overlap_chars, max_chars // 4)
+
+    segments: List[NarrativeSegment] = []
+    start = 0
+    while True:
+        end = len(text) if len(text) - start <= max_chars else _cut_before(text, start + max_chars // 2, start + max_chars)
+        segments.append(NarrativeSegment(len(segments), start, end, text[start:end]))
+        if end >= len(text):
+            return segments
+        start = max(_start_after(text, end - overlap_chars, end), start + 1)
@@ -0,0 +1,82 @@
+"""NDJSON helpers for streaming endpoints.
+
+Request bodies are read incrementally and split into lines, so memory is bounded by the
+transport chunk size plus `MAX_NDJSON_LINE_BYTES`, independent of how many lines arrive.
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterable, AsyncIterator, List, Optional, Tuple
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from api.encoding import encode_json
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MAX_NDJSON_LINE_BYTES = 1_048_576
+
+# (1-based line number, raw line or None when the line exceeded the size limit)
+NdjsonLine = Tuple[int, Optional[bytes]]
+
+
+def ndjson_dumps(obj: Any) -> bytes:
+    return encode_json(obj) + b"\n"
+
+
+async def iter_ndjson_line_batches(
+    chunks: AsyncIterable[bytes],
+    max_line_bytes: int = MAX_NDJSON_LINE_BYTES,
+) -> AsyncIterator[List[NdjsonLine]]:
+    """Yield the complete, non-blank lines found in each received chunk.
+
+    Oversized lines are reported as None (their content is discarded while scanning
+    for the next newline) so the caller can emit a per-line error and continue.
+    """
+    buffer = bytearray()
+    overflow = False
+    line_number = 0
+
+    async for chunk in chunks:
+        batch: List[NdjsonLine] = []
+        start = 0
+        while True:
+            newline = chunk.find(b"\n", start)
+            end = len(chunk) if newline == -1 else newline
+            if not overflow:
+                buffer += chunk[start:end]
+                if len(buffer) > max_line_bytes:
+                    overflow = True
+                    buffer.clear()
+            if newline == -1:
+                break
+            line_number += 1
+            if overflow:
+                batch.append((line_number, None))
+            elif buffer.strip():
+                batch.append((line_number, bytes(buffer)))
+            buffer.clear()
+            overflow = False
+            start = newline + 1
+        if batch:
+            yield batch
+
+    if overflow or buffer.strip():
+        yield [(line_number + 1, None if overflow else bytes(buffer))]
+
+
+class NdjsonStreamingResponse(StreamingResponse):
+    """Streaming response for endpoints that also stream the request body.
+
+    Starlette's StreamingResponse listens for disconnects by reading `receive`, which
+    would consume request body messages still being read by the endpoint. Here the body
+    iterator owns `receive`; a client disconnect surfaces from `request.stream()`.
+    Each yielded chunk is awaited through `send`, so a slow client pauses reading.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
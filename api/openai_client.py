@@ -0,0 +1,195 @@
+"""
+Shared async OpenAI client for AI extraction.
+
+One `AsyncOpenAI` client is kept for the app's lifetime: its httpx pool keeps TLS
+connections alive across extractions instead of handshaking on every request. A
+semaphore caps concurrent calls per process, so a burst of extractions queues here
+(on the event loop, holding no threads) rather than opening unbounded upstream
+connections.
+
+Configuration (environment):
+    OPENAI_API_KEY                    required for extraction
+    OPENAI_BASE_URL                   optional; e.g. a local stand-in server for tests
+    SOFICCA_OPENAI_TIMEOUT_SECONDS    per-call timeout (default 30)
+    SOFICCA_OPENAI_MAX_CONCURRENCY    concurrent calls, also the connection pool size (default 16)
+    SOFICCA_OPENAI_MAX_RETRIES        SDK retries of connection errors, 429 and 5xx (default 2)
+
+Circuit breaker (api/circuit_breaker.py), one per process:
+    SOFICCA_OPENAI_BREAKER_WINDOW_SECONDS   outcomes considered (default 30)
+    SOFICCA_OPENAI_BREAKER_MIN_CALLS        calls in the window before it can open (default 20)
+    SOFICCA_OPENAI_BREAKER_ERROR_RATE       failure share that opens it (default 0.5)
+    SOFICCA_OPENAI_BREAKER_OPEN_SECONDS     fail-fast period before a probe (default 15)
+
+Hedging (api/hedging.py), off by default:
+    SOFICCA_OPENAI_HEDGE                    1 to start a second attempt for slow calls
+    SOFICCA_OPENAI_HEDGE_QUANTILE           latency quantile used as the delay (default 0.95)
+    SOFICCA_OPENAI_HEDGE_MIN_SAMPLES        latencies needed before hedging starts (default 20)
+
+The client and semaphore belong to the event loop that created them; a call from a
+different loop (e.g. a new test client) gets fresh ones, and the replaced client is
+closed on its own loop while that loop still runs (best effort otherwise) so its pool
+does not leak. Does NOT create a client at import time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from typing import TYPE_CHECKING, Optional, Set, Tuple
+
+from api.circuit_breaker import CircuitBreaker
+from api.hedging import LatencyTracker
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+TIMEOUT_ENV = "SOFICCA_OPENAI_TIMEOUT_SECONDS"
+MAX_CONCURRENCY_ENV = "SOFICCA_OPENAI_MAX_CONCURRENCY"
+MAX_RETRIES_ENV = "SOFICCA_OPENAI_MAX_RETRIES"
+DEFAULT_TIMEOUT_SECONDS = 30.0
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_RETRIES = 2
+
+BREAKER_WINDOW_ENV = "SOFICCA_OPENAI_BREAKER_WINDOW_SECONDS"
+BREAKER_MIN_CALLS_ENV = "SOFICCA_OPENAI_BREAKER_MIN_CALLS"
+BREAKER_ERROR_RATE_ENV = "SOFICCA_OPENAI_BREAKER_ERROR_RATE"
+BREAKER_OPEN_ENV = "SOFICCA_OPENAI_BREAKER_OPEN_SECONDS"
+DEFAULT_BREAKER_WINDOW_SECONDS = 30.0
+DEFAULT_BREAKER_MIN_CALLS = 20
+DEFAULT_BREAKER_ERROR_RATE = 0.5
+DEFAULT_BREAKER_OPEN_SECONDS = 15.0
+
+HEDGE_ENV = "SOFICCA_OPENAI_HEDGE"
+HEDGE_QUANTILE_ENV = "SOFICCA_OPENAI_HEDGE_QUANTILE"
+HEDGE_MIN_SAMPLES_ENV = "SOFICCA_OPENAI_HEDGE_MIN_SAMPLES"
+DEFAULT_HEDGE_QUANTILE = 0.95
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+
+# (event loop, api key, client, concurrency limiter)
+_State = Tuple[asyncio.AbstractEventLoop, str, "AsyncOpenAI", asyncio.Semaphore]
+_state: Optional[_State] = None
+# Closes of replaced clients scheduled on the current loop (held so they are not collected mid-close).
+_closing: Set["asyncio.Task[None]"] = set()
+
+
+def openai_timeout_seconds() -> float:
+    raw = os.environ.get(TIMEOUT_ENV, "").strip()
+    return float(raw) if raw else DEFAULT_TIMEOUT_SECONDS
+
+
+def openai_max_concurrency() -> int:
+    raw = os.environ.get(MAX_CONCURRENCY_ENV, "").strip()
+    return max(1, int(raw)) if raw else DEFAULT_MAX_CONCURRENCY
+
+
+def openai_max_retries() -> int:
+    raw = os.environ.get(MAX_RETRIES_ENV, "").strip()
+    return max(0, int(raw)) if raw else DEFAULT_MAX_RETRIES
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    return float(raw) if raw else default
+
+
+def _create_state(loop: asyncio.AbstractEventLoop, api_key: str) -> _State:
+    import httpx
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    concurrency = openai_max_concurrency()
+    client = AsyncOpenAI(
+        api_key=api_key,
+        base_url=os.environ.get("OPENAI_BASE_URL") or None,
+        timeout=openai_timeout_seconds(),
+        max_retries=openai_max_retries(),
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        ),
+    )
+    return (loop, api_key, client, asyncio.Semaphore(concurrency))
+
+
+async def _close_quietly(client: "AsyncOpenAI") -> None:
+    # A client from a closed loop cannot shut its transports down cleanly; closing it
+    # still marks it closed and releases what it can.
+    with contextlib.suppress(Exception):
+        await client.close()
+
+
+def _retire(state: _State, loop: asyncio.AbstractEventLoop) -> None:
+    """Close a replaced client: on its own loop if that loop is still running, else here."""
+    old_loop, client = state[0], state[2]
+    if old_loop is not loop and old_loop.is_running() and not old_loop.is_closed():
+        asyncio.run_coroutine_threadsafe(_close_quietly(client), old_loop)
+        return
+    task = loop.create_task(_close_quietly(client))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+def _current_state(api_key: str) -> _State:
+    global _state
+    loop = asyncio.get_running_loop()
+    state = _state
+    if state is None or state[0] is not loop or state[1] != api_key:
+        previous, state = state, _create_state(loop, api_key)
+        _state = state
+        if previous is not None:
+            _retire(previous, loop)
+    return state
+
+
+def get_openai_client(api_key: str) -> "AsyncOpenAI":
+    """Return the shared client for the running loop (created on first use)."""
+    return _current_state(api_key)[2]
+
+
+def openai_call_slot(api_key: str) -> asyncio.Semaphore:
+    """Concurrency limiter to hold (`async with`) around each call made with the shared client."""
+    return _current_state(api_key)[3]
+
+
+# ── Circuit breaker and hedging state (per process, across loops) ──
+
+_breaker = CircuitBreaker("openai")
+_latencies = LatencyTracker()
+
+
+def get_openai_breaker() -> CircuitBreaker:
+    """The provider's circuit breaker, with the current environment's thresholds."""
+    _breaker.configure(
+        window_seconds=_env_float(BREAKER_WINDOW_ENV, DEFAULT_BREAKER_WINDOW_SECONDS),
+        min_calls=max(1, int(_env_float(BREAKER_MIN_CALLS_ENV, DEFAULT_BREAKER_MIN_CALLS))),
+        error_rate=_env_float(BREAKER_ERROR_RATE_ENV, DEFAULT_BREAKER_ERROR_RATE),
+        open_seconds=_env_float(BREAKER_OPEN_ENV, DEFAULT_BREAKER_OPEN_SECONDS),
+    )
+    return _breaker
+
+
+def openai_latencies() -> LatencyTracker:
+    """Latencies of recent successful calls, the basis of the hedge delay."""
+    return _latencies
+
+
+def openai_hedge_delay() -> Optional[float]:
+    """Seconds to wait before hedging a call, or None when hedging is off or not yet calibrated."""
+    if os.environ.get(HEDGE_ENV, "").strip().lower() not in ("1", "true", "yes", "on"):
+        return None
+    quantile = _env_float(HEDGE_QUANTILE_ENV, DEFAULT_HEDGE_QUANTILE)
+    min_samples = int(_env_float(HEDGE_MIN_SAMPLES_ENV, DEFAULT_HEDGE_MIN_SAMPLES))
+    return _latencies.quantile(quantile, min_samples)
+
+
+async def close_openai_client() -> None:
+    """Close the shared client's connections (app shutdown)."""
+    global _state
+    state, _state = _state, None
+    if state is None:
+        return
+    loop = asyncio.get_running_loop()
+    if state[0] is loop:
+        await state[2].close()
+    else:
+        _retire(state, loop)
+    await asyncio.gather(*_closing)
@@ -0,0 +1,78 @@
+"""
+Compiled multi-phrase matcher for the extraction safety filter.
+
+All phrases are folded into a single regex shaped like their character trie
+(`recommend|route to|...` becomes `r(?:ecommend|oute to)...`), so each text position
+follows one branch instead of trying every phrase: one scan costs O(len(text) x longest
+phrase), independent of how many phrases are configured. Matching is case-insensitive
+substring matching, like `phrase in text.lower()`, and reports every occurrence with
+its offsets; at each start offset the longest phrase wins.
+
+The text is lowercased once and scanned with a case-sensitive pattern, which lets the
+regex engine skip positions by first character (IGNORECASE and lookaheads defeat that,
+costing ~5x). Texts whose lowercase form changes length use the IGNORECASE pattern so
+offsets always refer to the original text.
+
+    python scripts/benchmark_safety_filter.py
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Pattern
+
+
+@dataclass(frozen=True)
+class PhraseMatch:
+    phrase: str
+    start: int
+    end: int
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    terminal = "" in node
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    body = "(?:" + "|".join(branches) + ")"
+    # Greedy optional tail: continue into a longer phrase first, fall back to the shorter one.
+    return body + "?" if terminal else body
+
+
+def compile_phrases(phrases: Iterable[str], flags: int = 0) -> Pattern[str]:
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return re.compile(_trie_pattern(trie), flags)
+
+
+class PhraseMatcher:
+    """Finds every occurrence of a fixed phrase set in one pass over the text."""
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases = tuple(dict.fromkeys(phrase for phrase in phrases if phrase))
+        self._canonical = {phrase.lower(): phrase for phrase in self.phrases}
+        self._pattern = compile_phrases(self.phrases) if self.phrases else None
+        self._ignorecase_pattern = compile_phrases(self.phrases, re.IGNORECASE) if self.phrases else None
+
+    def find_all(self, text: str) -> List[PhraseMatch]:
+        if self._pattern is None:
+            return []
+        haystack = text.lower()
+        pattern = self._pattern
+        if len(haystack) != len(text):
+            haystack, pattern = text, self._ignorecase_pattern
+        matches: List[PhraseMatch] = []
+        match = pattern.search(haystack)
+        while match is not None:
+            found = match.group(0)
+            matches.append(PhraseMatch(self._canonical.get(found.lower(), found), match.start(), match.end()))
+            # Resume one character later, not at match.end(), so overlapping phrases are reported too.
+            match = pattern.search(haystack, match.start() + 1)
+        return matches
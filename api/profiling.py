@@ -0,0 +1,299 @@
+"""
+On-demand request profiling and continuous stack sampling (admin only).
+
+Per request: send `?profile=1` (or header `X-Soficca-Profile: 1`) together with
+`X-Admin-Token: $SOFICCA_ADMIN_TOKEN` to an engine endpoint. The handler runs under
+cProfile and the JSON response is wrapped as `{"response": <original>, "profile": {...}}`
+with the top frames by self time. `profile=file` keeps the response unchanged and
+writes a pstats dump to SOFICCA_PROFILE_DIR instead (path in `X-Soficca-Profile-File`).
+Without SOFICCA_ADMIN_TOKEN configured, profiling requests are rejected.
+
+Process-wide: `StackSampler` samples every thread's stack at a low rate and writes
+folded stacks (`frame;frame;frame count`, the input format of flamegraph.pl and
+speedscope). Start it with SOFICCA_PROFILE_SAMPLING_HZ or the admin router.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import hmac
+import inspect
+import json
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ADMIN_TOKEN_ENV = "SOFICCA_ADMIN_TOKEN"
+PROFILE_DIR_ENV = "SOFICCA_PROFILE_DIR"
+SAMPLING_HZ_ENV = "SOFICCA_PROFILE_SAMPLING_HZ"
+
+ADMIN_TOKEN_HEADER = "x-admin-token"
+PROFILE_HEADER = "x-soficca-profile"
+PROFILE_FILE_HEADER = "x-soficca-profile-file"
+
+PROFILE_MODE_INLINE = "inline"
+PROFILE_MODE_FILE = "file"
+TOP_FRAMES = 25
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def admin_token_valid(token: Optional[str]) -> bool:
+    expected = os.environ.get(ADMIN_TOKEN_ENV, "")
+    return bool(expected) and token is not None and hmac.compare_digest(token.encode(), expected.encode())
+
+
+def profile_dir() -> Path:
+    return Path(os.environ.get(PROFILE_DIR_ENV) or Path(tempfile.gettempdir()) / "soficca-profiles")
+
+
+# ── Per-request profiling ─────────────────────────────────────────
+
+
+class RequestProfile:
+    __slots__ = ("mode", "stats")
+
+    def __init__(self, mode: str) -> None:
+        self.mode = mode
+        self.stats: Optional[pstats.Stats] = None
+
+
+_requested: ContextVar[Optional[RequestProfile]] = ContextVar("soficca_request_profile", default=None)
+
+
+def profiled(func: F) -> F:
+    """Run a sync endpoint under cProfile when the current request asked for it.
+
+    cProfile only sees the thread it is enabled in, so profiling happens here, in the
+    thread-pool thread running the handler, rather than in the middleware.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        request_profile = _requested.get()
+        if request_profile is None:
+            return func(*args, **kwargs)
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            request_profile.stats = pstats.Stats(profiler)
+
+    # FastAPI resolves string annotations against the wrapper's module; hand it the
+    # endpoint's own, already evaluated, signature instead.
+    wrapper.__signature__ = inspect.signature(func, eval_str=True)  # type: ignore[attr-defined]
+    return wrapper  # type: ignore[return-value]
+
+
+def top_frames(stats: pstats.Stats, limit: int = TOP_FRAMES) -> List[Dict[str, Any]]:
+    rows = []
+    for (filename, line, name), (_, calls, self_s, cumulative_s, _) in stats.stats.items():  # type: ignore[attr-defined]
+        rows.append(
+            {
+                "frame": f"{filename}:{line}({name})",
+                "calls": calls,
+                "self_ms": round(self_s * 1000, 3),
+                "cumulative_ms": round(cumulative_s * 1000, 3),
+            }
+        )
+    rows.sort(key=lambda row: row["self_ms"], reverse=True)
+    return rows[:limit]
+
+
+def _header(scope: Scope, name: str) -> Optional[str]:
+    encoded = name.encode("latin-1")
+    for key, raw in scope.get("headers", []):
+        if key == encoded:
+            return raw.decode("latin-1")
+    return None
+
+
+def _requested_mode(scope: Scope) -> Optional[str]:
+    value = _header(scope, PROFILE_HEADER)
+    if value is None and scope.get("query_string"):
+        values = parse_qs(scope["query_string"].decode("latin-1")).get("profile")
+        value = values[-1] if values else None
+    if value is None or value.lower() in ("", "0", "false"):
+        return None
+    return PROFILE_MODE_FILE if value.lower() == PROFILE_MODE_FILE else PROFILE_MODE_INLINE
+
+
+async def _send_json(send: Send, status: int, payload: Any, extra_headers: Sequence[Tuple[bytes, bytes]] = ()) -> None:
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()), *extra_headers]
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        mode = _requested_mode(scope) if scope["type"] == "http" else None
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+        if not admin_token_valid(_header(scope, ADMIN_TOKEN_HEADER)):
+            await _send_json(send, 403, {"detail": "Profiling requires a valid admin token."})
+            return
+
+        request_profile = RequestProfile(mode)
+        token = _requested.set(request_profile)
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def buffer(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, buffer)
+        finally:
+            _requested.reset(token)
+
+        assert start is not None
+        status = start["status"]
+        headers = [(k, v) for k, v in start.get("headers", []) if k.lower() != b"content-length"]
+        body = b"".join(chunks)
+        stats = request_profile.stats
+
+        if stats is None:
+            # Endpoint is not instrumented (or a coalesced follower): pass through untouched.
+            headers.append((b"content-length", str(len(body)).encode()))
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        if mode == PROFILE_MODE_FILE:
+            directory = profile_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.prof"
+            stats.dump_stats(str(path))
+            headers += [(PROFILE_FILE_HEADER.encode(), str(path).encode()), (b"content-length", str(len(body)).encode())]
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        try:
+            original: Any = json.loads(body) if body else None
+        except ValueError:
+            original = body.decode("utf-8", errors="replace")
+        profile = {"total_ms": round(stats.total_tt * 1000, 3), "top_frames": top_frames(stats)}  # type: ignore[attr-defined]
+        passthrough = [(k, v) for k, v in headers if k.lower() != b"content-type"]
+        await _send_json(send, status, {"response": original, "profile": profile}, passthrough)
+
+
+# ── Continuous sampling ───────────────────────────────────────────
+
+
+def _folded(frame: Any) -> str:
+    names: List[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Samples all thread stacks at `hz` and rewrites `path` with cumulative folded stacks."""
+
+    def __init__(self, hz: float, path: Path, flush_seconds: float = 10.0) -> None:
+        self.hz = hz
+        self.path = path
+        self.flush_seconds = flush_seconds
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="soficca-stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def sample_once(self) -> None:
+        own = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id != own:
+                self.samples[_folded(frame)] += 1
+
+    def flush(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = [f"{stack} {count}\n" for stack, count in self.samples.most_common()]
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text("".join(lines), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def _run(self) -> None:
+        interval = 1.0 / self.hz
+        next_flush = time.monotonic() + self.flush_seconds
+        while not self._stop.wait(interval):
+            self.sample_once()
+            if time.monotonic() >= next_flush:
+                self.flush()
+                next_flush = time.monotonic() + self.flush_seconds
+
+
+_sampler: Optional[StackSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def sampler_status() -> Dict[str, Any]:
+    sampler = _sampler
+    if sampler is None or not sampler.running:
+        return {"running": False}
+    return {"running": True, "hz": sampler.hz, "path": str(sampler.path), "stacks": len(sampler.samples)}
+
+
+def start_sampler(hz: float, path: Optional[Path] = None) -> Dict[str, Any]:
+    global _sampler
+    with _sampler_lock:
+        if _sampler is not None:
+            _sampler.stop()
+        _sampler = StackSampler(hz, path or profile_dir() / "stacks.folded")
+        _sampler.start()
+    return sampler_status()
+
+
+def stop_sampler() -> Dict[str, Any]:
+    global _sampler
+    with _sampler_lock:
+        if _sampler is not None:
+            _sampler.stop()
+            _sampler = None
+    return sampler_status()
+
+
+def start_sampler_from_env() -> None:
+    raw = os.environ.get(SAMPLING_HZ_ENV, "").strip()
+    if raw and float(raw) > 0:
+        start_sampler(float(raw))
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from pydantic import BaseModel, ConfigDict, Field
+
+from api.encoding import FastJSONResponse, FastJSONRoute
+from api.profiling import admin_token_valid, sampler_status, start_sampler, stop_sampler
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    if not admin_token_valid(x_admin_token):
+        raise HTTPException(status_code=403, detail="A valid admin token is required.")
+
+
+router = APIRouter(
+    prefix="/v1/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
+)
+
+
+class SamplerRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool
+    hz: float = Field(default=10.0, gt=0, le=1000, description="Samples per second across all threads")
+
+
+@router.get("/profiling/sampler")
+def get_sampler() -> Dict[str, Any]:
+    return sampler_status()
+
+
+@router.post("/profiling/sampler")
+def set_sampler(payload: SamplerRequest) -> Dict[str, Any]:
+    """Start (or restart at a new rate) or stop continuous stack sampling to folded-stack files."""
+    return start_sampler(payload.hz) if payload.enabled else stop_sampler()
@@ -16,19 +16,65 @@ The deterministic Soficca Cardio engine remains the only routing authority.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import os
 import time
 import uuid
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 logger = logging.getLogger("cardio_extract")
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 from pydantic import BaseModel, ConfigDict, Field
-
-router = APIRouter(prefix="/v1/cardio/pilot", tags=["cardio-pilot-extract"])
+from starlette.responses import StreamingResponse
+
+from api.circuit_breaker import CLOSED, CircuitOpenError
+from api.deadlines import deadline_after, deadline_scope, remaining_seconds
+from api.encoding import FastJSONResponse, FastJSONRoute
+from api.extraction_cache import ExtractionCache, extraction_cache_key, normalize_case_text, prompt_fingerprint
+from api.extraction_replay import get_recorder, get_replay_provider
+from api.hedging import hedged
+from api.metrics import EXTRACTIONS, OPENAI_CALLS_REJECTED, OPENAI_EXTRACTION_SECONDS, OPENAI_HEDGES
+from api.narrative_segments import (
+    NarrativeSegment,
+    max_segments,
+    segment_chars,
+    segment_overlap_chars,
+    split_narrative,
+)
+from api.ndjson import NDJSON_MEDIA_TYPE, ndjson_dumps
+from api.openai_client import (
+    get_openai_breaker,
+    get_openai_client,
+    openai_call_slot,
+    openai_hedge_delay,
+    openai_latencies,
+)
+from api.phrase_matcher import PhraseMatch, PhraseMatcher
+from api.pii_scan import (
+    PII_PRESCAN_BLOCK,
+    PII_PRESCAN_MASK,
+    PII_PRESCAN_OFF,
+    describe_pii,
+    mask_pii,
+    pii_prescan_mode,
+    pii_warnings,
+    scan_pii,
+)
+from api.sse import SSE_HEADERS, SSE_MEDIA_TYPE, sse_event
+from cardio_triage_v1.pre_extraction import PRE_EXTRACTOR_VERSION, PreExtraction, pre_extract
+from soficca_core.errors import make_error
+
+router = APIRouter(
+    prefix="/v1/cardio/pilot",
+    tags=["cardio-pilot-extract"],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
+)
 
 
 # ── Disallowed fields that must be stripped from AI output ─────────
@@ -56,6 +102,10 @@ class CardioPilotExtractRequest(BaseModel):
     case_text: str = Field(..., min_length=1, description="Free-text clinical narrative")
     language: str = Field(default="auto", description="Language hint (auto, en, es)")
     source: str = Field(default="free_text", description="Source identifier")
+    bypass_cache: bool = Field(
+        default=False,
+        description="Re-extract even if a cached result exists (the fresh result replaces it)",
+    )
 
 
 class CardioPilotExtractionFields(BaseModel):
@@ -97,6 +147,18 @@ class CardioFieldEvidence(BaseModel):
     confidence: float
 
 
+class CardioSourceEvidence(CardioFieldEvidence):
+    """Field evidence as returned to clients, located in the submitted case_text.
+
+    Offsets are None when the source text is not found verbatim; `segment` is set when
+    a long narrative was extracted in segments (api/narrative_segments.py).
+    """
+
+    segment: Optional[int] = None
+    source_start: Optional[int] = None
+    source_end: Optional[int] = None
+
+
 ExtractionQualityFlag = Literal[
     "low_confidence_extraction",
     "critical_missing_fields",
@@ -164,10 +226,31 @@ class CardioPilotExtractResponse(BaseModel):
     missing_information: CardioMissingInformation
     completion_questions: List[str]
     possible_conflicts: List[str]
-    field_evidence: List[CardioFieldEvidence]
+    field_evidence: List[CardioSourceEvidence]
     extraction_quality_flags: List[ExtractionQualityFlag]
     pii_warnings: List[PiiWarning]
     warnings: List[str]
+    extraction_source: Literal["ai", "pre_extractor"] = "ai"
+
+
+class CardioPilotBatchItem(BaseModel):
+    """One narrative of a batch; `id` is echoed back so callers can match results."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    id: Optional[str] = Field(default=None, max_length=200, description="Caller reference, echoed in the result line")
+    case_text: str = Field(..., min_length=1, description="Free-text clinical narrative")
+
+
+class CardioPilotBatchExtractRequest(BaseModel):
+    """Input for the batch extraction endpoint; options apply to every item."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    items: List[CardioPilotBatchItem] = Field(..., min_length=1)
+    language: str = Field(default="auto", description="Language hint (auto, en, es)")
+    source: str = Field(default="free_text", description="Source identifier")
+    bypass_cache: bool = Field(default=False, description="Re-extract even if cached results exist")
 
 
 # ── System instruction ────────────────────────────────────────────
@@ -253,6 +336,7 @@ pii_warnings:
 - Detect likely personal identifiers in the narrative: names, phone numbers, emails, ID numbers, addresses.
 - Use only these controlled values: possible_name_detected, possible_phone_detected, possible_email_detected, possible_id_number_detected, possible_address_detected.
 - Only warn. Do not transform or redact identifiers.
+- Identifiers may already be masked as [PHONE]***, [EMAIL]***, [ID]***, [ADDRESS]*** or [NAME]***; warn for those too.
 - If no identifiers detected, return empty list.
 
 Other rules:
@@ -271,6 +355,9 @@ Return ONLY the structured extraction. Do not diagnose, prescribe, or decide any
 ---
 """
 
+# Part of every extraction cache key: editing either prompt invalidates cached results.
+PROMPTS_FINGERPRINT = prompt_fingerprint(SYSTEM_INSTRUCTION, USER_PROMPT_TEMPLATE)
+
 
 # ── Safety filter ─────────────────────────────────────────────────
 
@@ -290,8 +377,38 @@ DISALLOWED_PHRASES = [
     "patient should",
     "advise the patient",
     "take the patient to",
+    # Spanish narratives get Spanish summaries and questions. Only directive wording:
+    # history ("diagnosticado con diabetes hace 10 años") and questions about current
+    # treatment ("¿Le suelen administrar nitroglicerina?") must survive.
+    "se recomienda",
+    "recomendamos",
+    "debe ser tratado",
+    "debe ser tratada",
+    "se debe prescribir",
+    "se debe administrar",
+    "derivar al paciente",
+    "derivar a la paciente",
+    "enviar a urgencias",
+    "clasificado como emergencia",
+    "clasificada como emergencia",
+    "clasificado como urgente",
+    "clasificada como urgente",
+    "el diagnóstico es",
+    "el paciente debe",
+    "la paciente debe",
+    "aconsejar al paciente",
+    "llevar al paciente a",
 ]
 
+# Compiled once; see api/phrase_matcher.py. Rebuild it if DISALLOWED_PHRASES is changed at runtime.
+DISALLOWED_PHRASE_MATCHER = PhraseMatcher(DISALLOWED_PHRASES)
+
+
+def _strip_disallowed_keys(mapping: Dict[str, Any], warnings: List[str]) -> None:
+    for key in [key for key in mapping if key in DISALLOWED_FIELDS]:
+        del mapping[key]
+        warnings.append(f"Disallowed clinical-decision field removed from extraction output: {key}")
+
 
 def strip_disallowed_fields(raw: Dict[str, Any]) -> List[str]:
     """Remove any disallowed clinical-decision fields from raw AI output.
@@ -299,40 +416,35 @@ def strip_disallowed_fields(raw: Dict[str, Any]) -> List[str]:
     warnings: List[str] = []
     fields_data = raw.get("fields", {})
     if isinstance(fields_data, dict):
-        for key in list(fields_data.keys()):
-            if key in DISALLOWED_FIELDS:
-                del fields_data[key]
-                warnings.append(
-                    f"Disallowed clinical-decision field removed from extraction output: {key}"
-                )
+        _strip_disallowed_keys(fields_data, warnings)
     # Also check top-level keys
-    for key in list(raw.keys()):
-        if key in DISALLOWED_FIELDS:
-            del raw[key]
-            warnings.append(
-                f"Disallowed clinical-decision field removed from extraction output: {key}"
-            )
+    _strip_disallowed_keys(raw, warnings)
     return warnings
 
 
+def _describe_matches(matches: List[PhraseMatch]) -> str:
+    return ", ".join(f"'{match.phrase}' at {match.start}" for match in matches)
+
+
 def sanitize_summary_and_questions(raw: Dict[str, Any]) -> List[str]:
     """Check structured_clinical_summary and completion_questions for
-    disallowed clinical-decision language. Returns warning messages."""
+    disallowed clinical-decision language. Returns warning messages.
+
+    Each text is scanned once by DISALLOWED_PHRASE_MATCHER; warnings list every
+    matched phrase with its character offset."""
     warnings: List[str] = []
 
     summary = raw.get("structured_clinical_summary", "")
     if isinstance(summary, str):
-        lower = summary.lower()
-        for phrase in DISALLOWED_PHRASES:
-            if phrase in lower:
-                raw["structured_clinical_summary"] = (
-                    "[Summary contained clinical decision language and was redacted for safety. "
-                    "See extracted fields for structured data.]"
-                )
-                warnings.append(
-                    f"structured_clinical_summary contained disallowed phrase '{phrase}' and was redacted."
-                )
-                break
+        matches = DISALLOWED_PHRASE_MATCHER.find_all(summary)
+        if matches:
+            raw["structured_clinical_summary"] = (
+                "[Summary contained clinical decision language and was redacted for safety. "
+                "See extracted fields for structured data.]"
+            )
+            warnings.append(
+                f"structured_clinical_summary contained disallowed phrase {_describe_matches(matches)} and was redacted."
+            )
 
     questions = raw.get("completion_questions", [])
     if isinstance(questions, list):
@@ -340,60 +452,325 @@ def sanitize_summary_and_questions(raw: Dict[str, Any]) -> List[str]:
         for q in questions:
             if not isinstance(q, str):
                 continue
-            lower_q = q.lower()
-            blocked = False
-            for phrase in DISALLOWED_PHRASES:
-                if phrase in lower_q:
-                    warnings.append(
-                        f"completion_question removed (contained '{phrase}'): {q[:80]}"
-                    )
-                    blocked = True
-                    break
-            if not blocked:
+            matches = DISALLOWED_PHRASE_MATCHER.find_all(q)
+            if matches:
+                warnings.append(f"completion_question removed (contained {_describe_matches(matches)}): {q[:80]}")
+            else:
                 cleaned.append(q)
         raw["completion_questions"] = cleaned
 
     return warnings
 
 
+# ── PII pre-scan ──────────────────────────────────────────────────
+
+
+def add_pii_findings(raw: Dict[str, Any], found: List[str]) -> None:
+    """Put locally detected pii_warnings (api/pii_scan.py) ahead of the model's own, and flag them."""
+    if not found:
+        return
+    raw["pii_warnings"] = _union([found, raw.get("pii_warnings", [])])
+    flags = raw.setdefault("extraction_quality_flags", [])
+    if "possible_identifier_detected" not in flags:
+        flags.append("possible_identifier_detected")
+
+
+# ── Deterministic pre-extraction ──────────────────────────────────
+
+PRE_EXTRACTION_ENV = "SOFICCA_PRE_EXTRACTION"
+PRE_EXTRACTION_MIN_CONFIDENCE_ENV = "SOFICCA_PRE_EXTRACTION_MIN_CONFIDENCE"
+DEFAULT_PRE_EXTRACTION_MIN_CONFIDENCE = 0.9
+
+# Missing fields that are context rather than routing inputs (mirrors the prompt's buckets).
+CLINICALLY_USEFUL_FIELDS = frozenset({
+    "pain_severity",
+    "exertional_chest_pain",
+    "diaphoresis",
+    "cv_risk_factors_count",
+    "current_meds_summary",
+})
+
+
+def pre_extraction_enabled() -> bool:
+    return os.environ.get(PRE_EXTRACTION_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def pre_extraction_min_confidence() -> float:
+    raw = os.environ.get(PRE_EXTRACTION_MIN_CONFIDENCE_ENV, "").strip()
+    return float(raw) if raw else DEFAULT_PRE_EXTRACTION_MIN_CONFIDENCE
+
+
+def _evidence_value(value: Any) -> str:
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def _pre_extraction_response(
+    pre: PreExtraction, extraction_id: str, language_hint: str, case_text: str, pii_found: List[str]
+) -> CardioPilotExtractResponse:
+    """Build the endpoint response from a pre-extraction that covers every core field."""
+    fields = CardioPilotExtractionFields(
+        **{name: value for name, value in pre.fields.items() if name in CardioPilotExtractionFields.model_fields}
+    )
+    values = fields.model_dump()
+    missing = [name for name, value in values.items() if value is None]
+    findings = ", ".join(f"{name}={_evidence_value(value)}" for name, value in values.items() if value is not None)
+
+    flags: List[str] = ["requires_human_confirmation"]
+    if fields.current_meds_none is None:
+        flags.append("medication_status_unclear")
+    if fields.prior_mi is None and fields.known_cad is None:
+        flags.append("cardiovascular_history_unclear")
+    if pii_found:
+        flags.append("possible_identifier_detected")
+
+    return CardioPilotExtractResponse(
+        extraction_id=extraction_id,
+        model=PRE_EXTRACTOR_VERSION,
+        language_detected=language_hint if language_hint in ("en", "es") else pre.language,
+        confidence=min(pre.confidence, 0.95),
+        fields=fields,
+        structured_clinical_summary=(
+            f"The case text states: {findings}. "
+            "Values were read directly from the text; fields not mentioned are left empty for review."
+        ),
+        missing_fields=missing,
+        missing_information=CardioMissingInformation(
+            required_for_routing=[],
+            clinically_useful=[name for name in missing if name in CLINICALLY_USEFUL_FIELDS],
+            unconfirmed=[name for name in missing if name not in CLINICALLY_USEFUL_FIELDS],
+        ),
+        completion_questions=[],
+        possible_conflicts=[],
+        field_evidence=locate_evidence(
+            [
+                CardioFieldEvidence(
+                    field=hit.field,
+                    value=_evidence_value(hit.value),
+                    source_text=hit.source_text,
+                    confidence=hit.confidence,
+                )
+                for hit in pre.evidence
+            ],
+            case_text,
+        ),
+        extraction_quality_flags=flags,
+        pii_warnings=pii_found,
+        warnings=["Structured by the deterministic pre-extractor; no AI model was called."],
+        extraction_source="pre_extractor",
+    )
+
+
+def merge_pre_extraction_hints(raw: Dict[str, Any], pre: PreExtraction, min_confidence: float) -> List[str]:
+    """Fill fields the model left null with confident pre-extracted values.
+
+    The model's values are never overwritten; disagreements are reported as warnings.
+    Returns warning messages.
+    """
+    warnings: List[str] = []
+    fields = raw.get("fields")
+    if not isinstance(fields, dict):
+        return warnings
+    filled: List[str] = []
+    for hit in pre.evidence:
+        if hit.confidence < min_confidence or hit.field not in CardioPilotExtractionFields.model_fields:
+            continue
+        current = fields.get(hit.field)
+        if current is None:
+            fields[hit.field] = hit.value
+            filled.append(hit.field)
+            raw.setdefault("field_evidence", []).append(
+                {
+                    "field": hit.field,
+                    "value": _evidence_value(hit.value),
+                    "source_text": hit.source_text,
+                    "confidence": hit.confidence,
+                }
+            )
+            warnings.append(f"{hit.field} filled from the text by deterministic pre-extraction: '{hit.source_text}'")
+        elif current != hit.value:
+            warnings.append(
+                f"Deterministic pre-extraction read {hit.field}={_evidence_value(hit.value)} from "
+                f"'{hit.source_text}'; the model returned {_evidence_value(current)}."
+            )
+    if filled:
+        raw["missing_fields"] = [name for name in raw.get("missing_fields", []) if name not in filled]
+        missing_information = raw.get("missing_information")
+        if isinstance(missing_information, dict):
+            for bucket, names in missing_information.items():
+                if isinstance(names, list):
+                    missing_information[bucket] = [name for name in names if name not in filled]
+    return warnings
+
+
 # ── OpenAI call ───────────────────────────────────────────────────
 
 
-def _call_openai(case_text: str, model: str, extraction_id: str) -> CardioAIRawOutput:
-    """Call OpenAI with structured output parsing.
+def _observe_openai_latency(model: str, outcome: str, openai_start: float) -> None:
+    OPENAI_EXTRACTION_SECONDS.observe(time.monotonic() - openai_start, model, outcome)
+
+
+PartialFieldsCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def _partial_fields(parsed: Any) -> Dict[str, Any]:
+    """Fields of a partially parsed completion that are already complete and allowed.
+
+    The last key may still be mid-value ("pain_character": "tigh"), so it is held back
+    until the next key starts.
+    """
+    fields = parsed.get("fields") if isinstance(parsed, dict) else None
+    if not isinstance(fields, dict):
+        return {}
+    keys = list(fields)[:-1]
+    return {
+        key: fields[key]
+        for key in keys
+        if key in CardioPilotExtractionFields.model_fields and key not in DISALLOWED_FIELDS
+    }
+
+
+async def _stream_completion(client: Any, request: Dict[str, Any], on_partial: PartialFieldsCallback) -> Any:
+    """The same completion as `.parse()`, read as a stream so completed fields can be reported early."""
+    reported: Dict[str, Any] = {}
+    async with client.beta.chat.completions.stream(**request) as stream:
+        async for event in stream:
+            if event.type != "content.delta":
+                continue
+            fields = _partial_fields(event.parsed)
+            if len(fields) > len(reported):
+                reported = fields
+                await on_partial(fields)
+        return await stream.get_final_completion()
+
+
+async def _call_openai(
+    case_text: str, model: str, extraction_id: str, on_partial: Optional[PartialFieldsCallback] = None
+) -> CardioAIRawOutput:
+    """Call OpenAI with structured output parsing, through the shared async client.
+
+    With `on_partial`, the completion is streamed and the callback receives the
+    extracted fields completed so far; the returned output is the same either way.
+    With SOFICCA_EXTRACTION_REPLAY set, recorded outputs stand in for the provider
+    (api/extraction_replay.py); SOFICCA_EXTRACTION_RECORD records real calls.
+
+    The call draws on the request's deadline budget (api/deadlines.py), goes through
+    the provider's circuit breaker, and a non-streamed call may be hedged with a second
+    attempt once it is slower than usual (SOFICCA_OPENAI_HEDGE).
 
     Error handling:
     - Missing key → 503
+    - Circuit open → 503 with Retry-After
     - Auth / invalid key → 503 with safe message
-    - Timeout → 504
+    - Timeout or deadline exceeded → 504
     - Bad request / schema error → 502
     - Other provider error → 502
     - Never exposes API key or sensitive data in error messages.
     """
-    from openai import OpenAI, AuthenticationError, BadRequestError, APIError, APITimeoutError
+    from openai import AuthenticationError, BadRequestError, APIError, APITimeoutError
 
     api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
+    replay = get_replay_provider()
+    recording = None
+    if replay is not None:
+        recording = replay.find(case_text, model)
+        if recording is None:
+            logger.error("[%s] replay_miss | model=%s", extraction_id, model)
+            raise HTTPException(
+                status_code=502,
+                detail="No recorded extraction for this narrative in the replay cassette.",
+            )
+    elif not api_key:
         logger.error("[%s] OPENAI_API_KEY not configured", extraction_id)
         raise HTTPException(
             status_code=503,
             detail="OPENAI_API_KEY is not configured. AI extraction is unavailable.",
         )
 
-    client = OpenAI(api_key=api_key, timeout=30.0)
+    remaining = remaining_seconds()
+    if remaining is not None and remaining <= 0:
+        OPENAI_CALLS_REJECTED.inc("deadline")
+        logger.error("[%s] deadline_exhausted | model=%s", extraction_id, model)
+        raise HTTPException(status_code=504, detail="Extraction deadline exceeded before the OpenAI call.")
 
+    breaker = get_openai_breaker()
+    try:
+        probe = breaker.acquire()
+    except CircuitOpenError as e:
+        OPENAI_CALLS_REJECTED.inc("circuit_open")
+        retry_after = max(1, math.ceil(e.retry_after))
+        logger.warning("[%s] openai_circuit_open | model=%s retry_after_s=%d", extraction_id, model, retry_after)
+        raise HTTPException(
+            status_code=503,
+            detail=f"AI extraction is failing fast after repeated OpenAI errors. Retry in {retry_after}s.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    client = None if replay is not None else get_openai_client(api_key)
+    slot = openai_call_slot(api_key or "replay")
+
+    # Calls beyond SOFICCA_OPENAI_MAX_CONCURRENCY wait here; latency is measured from the slot.
+    try:
+        await asyncio.wait_for(slot.acquire(), remaining_seconds())
+    except asyncio.TimeoutError:
+        breaker.release(probe, None)
+        OPENAI_CALLS_REJECTED.inc("deadline")
+        logger.error("[%s] deadline_exhausted_waiting | model=%s", extraction_id, model)
+        raise HTTPException(status_code=504, detail="Extraction deadline exceeded waiting for an OpenAI slot.")
+    except BaseException:
+        breaker.release(probe, None)
+        raise
+
+    request: Dict[str, Any] = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": SYSTEM_INSTRUCTION},
+            {"role": "user", "content": USER_PROMPT_TEMPLATE.format(case_text=case_text)},
+        ],
+        "response_format": CardioAIRawOutput,
+        "temperature": 0.1,
+    }
+
+    async def attempt() -> Optional[CardioAIRawOutput]:
+        if replay is not None:
+            return CardioAIRawOutput.model_validate(await replay.replay(recording, on_partial))
+        if on_partial is None:
+            return (await client.beta.chat.completions.parse(**request)).choices[0].message.parsed
+        return (await _stream_completion(client, request, on_partial)).choices[0].message.parsed
+
+    async def hedge() -> Optional[CardioAIRawOutput]:
+        async with slot:
+            return await attempt()
+
+    # None: no verdict on the provider's health (our request was wrong, cancelled, or out of budget).
+    healthy: Optional[bool] = None
     openai_start = time.monotonic()
     try:
-        completion = client.beta.chat.completions.parse(
-            model=model,
-            messages=[
-                {"role": "system", "content": SYSTEM_INSTRUCTION},
-                {"role": "user", "content": USER_PROMPT_TEMPLATE.format(case_text=case_text)},
-            ],
-            response_format=CardioAIRawOutput,
-            temperature=0.1,
+        parsed = await asyncio.wait_for(
+            hedged(
+                attempt,
+                hedge,
+                openai_hedge_delay() if on_partial is None else None,
+                may_hedge=lambda: not slot.locked() and breaker.state == CLOSED,
+                on_event=OPENAI_HEDGES.inc,
+            ),
+            remaining_seconds(),
+        )
+    except asyncio.TimeoutError:
+        # The client's budget ran out, which says nothing about the provider (its own
+        # timeout is APITimeoutError below); one impatient client must not open the circuit.
+        _observe_openai_latency(model, "deadline", openai_start)
+        openai_ms = int((time.monotonic() - openai_start) * 1000)
+        logger.error(
+            "[%s] openai_deadline_exceeded | model=%s openai_elapsed_ms=%d",
+            extraction_id, model, openai_ms,
+        )
+        raise HTTPException(
+            status_code=504,
+            detail=f"Extraction deadline exceeded after {openai_ms}ms of the OpenAI call.",
         )
     except APITimeoutError:
+        healthy = False
+        _observe_openai_latency(model, "timeout", openai_start)
         openai_ms = int((time.monotonic() - openai_start) * 1000)
         logger.error(
             "[%s] openai_timeout | model=%s openai_elapsed_ms=%d",
@@ -404,12 +781,14 @@ def _call_openai(case_text: str, model: str, extraction_id: str) -> CardioAIRawO
             detail=f"OpenAI request timed out after {openai_ms}ms. Try again.",
         )
     except AuthenticationError:
+        _observe_openai_latency(model, "auth_error", openai_start)
         logger.error("[%s] openai_auth_error | model=%s", extraction_id, model)
         raise HTTPException(
             status_code=503,
             detail="OpenAI authentication failed. Check OPENAI_API_KEY configuration.",
         )
     except BadRequestError as e:
+        _observe_openai_latency(model, "bad_request", openai_start)
         safe_msg = str(e)
         # Strip anything that might contain the key
         if "api_key" in safe_msg.lower() or "sk-" in safe_msg:
@@ -420,6 +799,10 @@ def _call_openai(case_text: str, model: str, extraction_id: str) -> CardioAIRawO
             detail=f"OpenAI bad request: {safe_msg}",
         )
     except APIError as e:
+        # Connection errors, 429 and 5xx mean the provider is degraded; other 4xx mean the request was wrong.
+        status = getattr(e, "status_code", None)
+        healthy = False if status is None or status == 429 or status >= 500 else None
+        _observe_openai_latency(model, "api_error", openai_start)
         openai_ms = int((time.monotonic() - openai_start) * 1000)
         logger.error(
             "[%s] openai_api_error | model=%s openai_elapsed_ms=%d",
@@ -430,6 +813,8 @@ def _call_openai(case_text: str, model: str, extraction_id: str) -> CardioAIRawO
             detail=f"OpenAI API error: {e.message if hasattr(e, 'message') else 'Provider error'}",
         )
     except Exception as e:
+        healthy = False
+        _observe_openai_latency(model, "error", openai_start)
         openai_ms = int((time.monotonic() - openai_start) * 1000)
         logger.error(
             "[%s] openai_unknown_error | model=%s openai_elapsed_ms=%d type=%s",
@@ -440,14 +825,20 @@ def _call_openai(case_text: str, model: str, extraction_id: str) -> CardioAIRawO
             status_code=502,
             detail="Unexpected error calling OpenAI. AI extraction is temporarily unavailable.",
         )
-
+    else:
+        healthy = True
+    finally:
+        slot.release()
+        breaker.release(probe, healthy)
+
+    _observe_openai_latency(model, "ok", openai_start)
+    openai_latencies().observe(time.monotonic() - openai_start)
     openai_ms = int((time.monotonic() - openai_start) * 1000)
     logger.info(
         "[%s] openai_ok | model=%s openai_elapsed_ms=%d",
         extraction_id, model, openai_ms,
     )
 
-    parsed = completion.choices[0].message.parsed
     if parsed is None:
         logger.error("[%s] openai_unparseable | model=%s", extraction_id, model)
         raise HTTPException(
@@ -455,36 +846,301 @@ def _call_openai(case_text: str, model: str, extraction_id: str) -> CardioAIRawO
             detail="OpenAI returned an unparseable response.",
         )
 
+    recorder = get_recorder()
+    if recorder is not None and replay is None:
+        await recorder.record(case_text, model, parsed.model_dump(mode="json"), openai_ms / 1000)
     return parsed
 
 
-# ── Endpoint ──────────────────────────────────────────────────────
+# ── Long narratives ───────────────────────────────────────────────
 
+# Evidence (field, value, source_text) -> (segment index, start, end) in the full case_text.
+EvidenceLocations = Dict[Tuple[str, str, str], Tuple[int, Optional[int], Optional[int]]]
 
-@router.post("/extract", response_model=CardioPilotExtractResponse)
-def pilot_extract(payload: CardioPilotExtractRequest) -> CardioPilotExtractResponse:
+
+def _find_source(text: str, source: str, start: int = 0, end: Optional[int] = None) -> Optional[int]:
+    if not source:
+        return None
+    position = text.find(source, start, end)
+    if position == -1:
+        lowered = text.lower()
+        # Case-insensitive fallback only where lowercasing keeps offsets aligned.
+        if len(lowered) == len(text):
+            position = lowered.find(source.lower(), start, end)
+    return None if position == -1 else position
+
+
+def locate_evidence(
+    evidence: List[Any], case_text: str, known: Optional[EvidenceLocations] = None
+) -> List[CardioSourceEvidence]:
+    """Attach offsets into case_text to each evidence item.
+
+    `known` carries segment locations found while merging a segmented extraction; other
+    items keep offsets that still point at their source text (cached results) or are
+    searched for.
     """
-    Extract structured clinical fields from a free-text narrative.
+    located: List[CardioSourceEvidence] = []
+    for item in evidence:
+        data = item.model_dump() if isinstance(item, BaseModel) else dict(item)
+        source = data["source_text"]
+        key = (data["field"], data["value"], source)
+        if known is not None and key in known:
+            data["segment"], data["source_start"], data["source_end"] = known[key]
+        else:
+            start = data.get("source_start")
+            if start is None or case_text[start:start + len(source)].lower() != source.lower():
+                start = _find_source(case_text, source)
+            data["source_start"] = start
+            data["source_end"] = None if start is None else start + len(source)
+        located.append(CardioSourceEvidence.model_validate(data))
+    return located
+
+
+def _union(lists: Iterable[Iterable[Any]]) -> List[Any]:
+    return list(dict.fromkeys(item for items in lists for item in items))
+
+
+def merge_segment_outputs(
+    outputs: List[CardioAIRawOutput], segments: List[NarrativeSegment], case_text: str
+) -> Tuple[Dict[str, Any], EvidenceLocations]:
+    """Combine per-segment extractions into one raw output, deterministically.
+
+    - A field takes the value the segments that mention it agree on; a null never
+      overrides a value, so an explicit denial (false) beats silence elsewhere.
+    - Disagreeing values leave the field null, listed in possible_conflicts and unconfirmed.
+    - current_meds_summary joins the distinct summaries; cv_risk_factors_count takes the maximum.
+    - Lists are unioned in segment order; confidence is the lowest segment confidence.
+    Returns the raw output (CardioAIRawOutput shape) and where each evidence item was found.
+    """
+    fields: Dict[str, Any] = {}
+    conflicting: List[str] = []
+    conflicts: List[str] = []
+    for name in CardioPilotExtractionFields.model_fields:
+        reported = [
+            (segment.index, getattr(output.fields, name))
+            for segment, output in zip(segments, outputs)
+            if getattr(output.fields, name) is not None
+        ]
+        distinct = list(dict.fromkeys(value for _, value in reported))
+        if len(distinct) <= 1:
+            fields[name] = distinct[0] if distinct else None
+        elif name == "current_meds_summary":
+            fields[name] = "; ".join(distinct)
+        elif name == "cv_risk_factors_count":
+            fields[name] = max(distinct)
+        else:
+            fields[name] = None
+            conflicting.append(name)
+            conflicts.append(
+                f"{name}: narrative segments disagree ("
+                + "; ".join(f"segment {index + 1}: {_evidence_value(value)}" for index, value in reported)
+                + ")"
+            )
+    filled = {name for name, value in fields.items() if value is not None}
+
+    def still_missing(names: List[str]) -> List[str]:
+        return [name for name in names if name not in filled]
+
+    required = still_missing(_union(output.missing_information.required_for_routing for output in outputs))
+    flags = _union(output.extraction_quality_flags for output in outputs)
+    if not required and "critical_missing_fields" in flags:
+        flags.remove("critical_missing_fields")
+    if conflicts and "contradictory_narrative" not in flags:
+        flags.append("contradictory_narrative")
+
+    evidence: List[Dict[str, Any]] = []
+    locations: EvidenceLocations = {}
+    for segment, output in zip(segments, outputs):
+        for item in output.field_evidence:
+            key = (item.field, item.value, item.source_text)
+            if key in locations:
+                continue  # the same statement read again in the overlap
+            start = _find_source(case_text, item.source_text, segment.start, segment.end)
+            locations[key] = (segment.index, start, None if start is None else start + len(item.source_text))
+            evidence.append(item.model_dump())
+
+    languages = [output.language_detected for output in outputs]
+    raw = {
+        "fields": fields,
+        "structured_clinical_summary": " ".join(
+            output.structured_clinical_summary.strip() for output in outputs if output.structured_clinical_summary.strip()
+        ),
+        "missing_fields": still_missing(_union([*(output.missing_fields for output in outputs), conflicting])),
+        "missing_information": {
+            "required_for_routing": required,
+            "clinically_useful": still_missing(_union(output.missing_information.clinically_useful for output in outputs)),
+            "unconfirmed": _union([*(output.missing_information.unconfirmed for output in outputs), conflicting]),
+        },
+        "completion_questions": _union(output.completion_questions for output in outputs),
+        "possible_conflicts": _union([*(output.possible_conflicts for output in outputs), conflicts]),
+        "field_evidence": evidence,
+        "extraction_quality_flags": flags,
+        "pii_warnings": _union(output.pii_warnings for output in outputs),
+        "warnings": _union(output.warnings for output in outputs) + [
+            f"Narrative of {len(case_text)} characters was extracted in {len(segments)} overlapping segments "
+            "and merged deterministically."
+        ],
+        "confidence": min(output.confidence for output in outputs),
+        "language_detected": max(languages, key=languages.count),
+    }
+    return raw, locations
+
+
+async def _call_openai_segments(
+    segments: List[NarrativeSegment], model: str, extraction_id: str, emit: Optional[ExtractionEventSink]
+) -> List[CardioAIRawOutput]:
+    """Extract every segment concurrently (still within the shared OpenAI slot limit)."""
+
+    async def run(segment: NarrativeSegment) -> CardioAIRawOutput:
+        output = await _call_openai(segment.text, model, f"{extraction_id}-S{segment.index + 1}")
+        if emit is not None:
+            await emit("segment", {
+                "index": segment.index,
+                "start": segment.start,
+                "end": segment.end,
+                "fields": output.fields.model_dump(exclude_none=True),
+            })
+        return output
+
+    tasks = [asyncio.ensure_future(run(segment)) for segment in segments]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # One failed segment fails the extraction; don't leave the others running.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
-    This endpoint ONLY structures the signal. It does not route, diagnose, or prescribe.
+
+# ── Endpoint ──────────────────────────────────────────────────────
+
+EXTRACTION_CACHE_HEADER = "X-Soficca-Extraction-Cache"
+
+_EXTRACTION_CACHE = ExtractionCache("cardio_extract")
+
+
+# Progress events for streaming clients: (event name, JSON-compatible data).
+ExtractionEventSink = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+def _new_extraction_id() -> str:
+    return f"EXT-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def _extraction_model() -> str:
+    return os.environ.get("CARDIO_EXTRACTION_MODEL", "gpt-4o-mini")
+
+
+def _reported_model() -> str:
+    """The `model` shown to clients: the cassette when outputs are replayed."""
+    replay = get_replay_provider()
+    return replay.source if replay is not None else _extraction_model()
+
+
+async def _extract(
+    case_text: str,
+    language: str,
+    bypass_cache: bool,
+    extraction_id: str,
+    emit: Optional[ExtractionEventSink] = None,
+) -> Tuple[CardioPilotExtractResponse, Optional[str]]:
+    """Run one extraction; returns the response and its cache status (None when pre-extracted).
+
+    `emit`, when given, receives progress events as each stage finishes:
+    `pii_scan` (identifiers found), `pre_extraction`, `cache` (hits only), `partial`
+    (model fields as they stream), `segment` (each segment of a long narrative) and `safety`.
     """
     endpoint_start = time.monotonic()
-    model = os.environ.get("CARDIO_EXTRACTION_MODEL", "gpt-4o-mini")
-    extraction_id = f"EXT-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
-
-    logger.info("[%s] extract_start | model=%s", extraction_id, model)
+    model = _extraction_model()
+    # Replayed outputs are labelled with their cassette and kept out of the cache.
+    reported_model = _reported_model()
+    use_cache = get_replay_provider() is None
+
+    # Identifiers are found locally before anything is sent (SOFICCA_PII_PRESCAN).
+    pii_mode = pii_prescan_mode()
+    pii = scan_pii(case_text) if pii_mode != PII_PRESCAN_OFF else []
+    pii_found = pii_warnings(pii)
+    if pii_found:
+        logger.info("[%s] pii_prescan | mode=%s found=%s", extraction_id, pii_mode, ",".join(pii_found))
+        if emit is not None:
+            await emit("pii_scan", {"warnings": pii_found, "mode": pii_mode})
+
+    pre = pre_extract(case_text) if pre_extraction_enabled() else None
+    min_confidence = pre_extraction_min_confidence()
+    covered = pre is not None and pre.covers_core_fields(min_confidence)
+    if pre is not None and emit is not None:
+        await emit("pre_extraction", {
+            "fields": pre.fields,
+            "covers_core_fields": covered,
+            "missing_core_fields": pre.missing_core_fields,
+        })
+    if covered:
+        EXTRACTIONS.inc("pre_extractor")
+        logger.info(
+            "[%s] extract_pre_extracted | confidence=%.2f total_elapsed_ms=%d",
+            extraction_id, pre.confidence, int((time.monotonic() - endpoint_start) * 1000),
+        )
+        return _pre_extraction_response(pre, extraction_id, language, case_text, pii_found), None
 
-    raw_output = _call_openai(payload.case_text, model, extraction_id)
+    if pii_found and pii_mode == PII_PRESCAN_BLOCK:
+        logger.warning("[%s] extract_pii_blocked | found=%s", extraction_id, ",".join(pii_found))
+        raise HTTPException(
+            status_code=422,
+            detail=f"Narrative appears to contain personal identifiers ({describe_pii(pii_found)}); "
+            "remove them before AI extraction.",
+        )
+    # Masking keeps the text's length, so segment and evidence offsets still refer to case_text.
+    masked = pii_mode == PII_PRESCAN_MASK and bool(pii)
+    model_text = mask_pii(case_text, pii) if masked else case_text
+
+    cache_key = extraction_cache_key(model_text, model, language, PROMPTS_FINGERPRINT)
+    if use_cache and not bypass_cache:
+        cached = await _EXTRACTION_CACHE.aget(cache_key)
+        if cached is not None:
+            EXTRACTIONS.inc("cache")
+            if emit is not None:
+                await emit("cache", {"status": "hit"})
+            logger.info(
+                "[%s] extract_cache_hit | model=%s total_elapsed_ms=%d",
+                extraction_id, model, int((time.monotonic() - endpoint_start) * 1000),
+            )
+            cached["field_evidence"] = locate_evidence(cached["field_evidence"], case_text)
+            add_pii_findings(cached, pii_found)
+            return CardioPilotExtractResponse.model_validate({**cached, "extraction_id": extraction_id}), "hit"
+
+    segments = split_narrative(model_text, segment_chars(), segment_overlap_chars(), max_segments())
+    logger.info("[%s] extract_start | model=%s segments=%d", extraction_id, model, len(segments))
+
+    locations: Optional[EvidenceLocations] = None
+    if len(segments) > 1:
+        outputs = await _call_openai_segments(segments, model, extraction_id, emit)
+        raw_dict, locations = merge_segment_outputs(outputs, segments, case_text)
+    elif emit is None:
+        raw_dict = (await _call_openai(model_text, model, extraction_id)).model_dump()
+    else:
+        async def on_partial(fields: Dict[str, Any]) -> None:
+            await emit("partial", {"fields": fields})
+
+        raw_dict = (await _call_openai(model_text, model, extraction_id, on_partial=on_partial)).model_dump()
+    EXTRACTIONS.inc("ai")
 
     # Safety: strip any disallowed fields from raw dict, then re-validate
-    raw_dict = raw_output.model_dump()
     safety_warnings = strip_disallowed_fields(raw_dict)
     content_warnings = sanitize_summary_and_questions(raw_dict)
+    hint_warnings = merge_pre_extraction_hints(raw_dict, pre, min_confidence) if pre is not None else []
+    add_pii_findings(raw_dict, pii_found)
+    mask_warnings = (
+        [f"Possible identifiers ({describe_pii(pii_found)}) were masked before the narrative was sent to the model."]
+        if masked else []
+    )
+    if emit is not None:
+        await emit("safety", {"warnings": safety_warnings + content_warnings})
 
     # Re-validate after stripping
     cleaned = CardioAIRawOutput.model_validate(raw_dict)
 
-    all_warnings = list(cleaned.warnings) + safety_warnings + content_warnings
+    all_warnings = list(cleaned.warnings) + safety_warnings + content_warnings + hint_warnings + mask_warnings
 
     total_ms = int((time.monotonic() - endpoint_start) * 1000)
     logger.info(
@@ -492,9 +1148,9 @@ def pilot_extract(payload: CardioPilotExtractRequest) -> CardioPilotExtractRespo
         extraction_id, model, cleaned.confidence, total_ms,
     )
 
-    return CardioPilotExtractResponse(
+    result = CardioPilotExtractResponse(
         extraction_id=extraction_id,
-        model=model,
+        model=reported_model,
         language_detected=cleaned.language_detected,
         ai_role="STRUCTURING_ONLY",
         confidence=cleaned.confidence,
@@ -504,8 +1160,227 @@ def pilot_extract(payload: CardioPilotExtractRequest) -> CardioPilotExtractRespo
         missing_information=cleaned.missing_information,
         completion_questions=cleaned.completion_questions,
         possible_conflicts=cleaned.possible_conflicts,
-        field_evidence=cleaned.field_evidence,
+        field_evidence=locate_evidence(cleaned.field_evidence, case_text, locations),
         extraction_quality_flags=cleaned.extraction_quality_flags,
         pii_warnings=cleaned.pii_warnings,
         warnings=all_warnings,
     )
+    if not use_cache:
+        return result, "bypass"
+    await _EXTRACTION_CACHE.aput(cache_key, result.model_dump(mode="json", exclude={"extraction_id"}))
+    return result, "bypass" if bypass_cache else "miss"
+
+
+@router.post("/extract", response_model=CardioPilotExtractResponse)
+async def pilot_extract(
+    payload: CardioPilotExtractRequest,
+    response: Response,
+    x_soficca_deadline_ms: Optional[int] = Header(default=None, ge=1),
+) -> CardioPilotExtractResponse:
+    """
+    Extract structured clinical fields from a free-text narrative.
+
+    This endpoint ONLY structures the signal. It does not route, diagnose, or prescribe.
+    Narratives whose core fields can all be read deterministically skip the model
+    (cardio_triage_v1/pre_extraction.py); otherwise results are cached by narrative,
+    model, language and prompt version (api/extraction_cache.py), and `bypass_cache`
+    forces a fresh extraction. `X-Soficca-Deadline-Ms` bounds the time spent on model
+    calls (api/deadlines.py).
+    """
+    with deadline_scope(deadline_after(x_soficca_deadline_ms)):
+        result, cache_status = await _extract(
+            payload.case_text, payload.language, payload.bypass_cache, _new_extraction_id()
+        )
+    if cache_status is not None:
+        response.headers[EXTRACTION_CACHE_HEADER] = cache_status
+    return result
+
+
+# ── Batch endpoint ────────────────────────────────────────────────
+
+BATCH_MAX_ITEMS_ENV = "SOFICCA_EXTRACT_BATCH_MAX_ITEMS"
+BATCH_CONCURRENCY_ENV = "SOFICCA_EXTRACT_BATCH_CONCURRENCY"
+BATCH_ITEM_TIMEOUT_ENV = "SOFICCA_EXTRACT_BATCH_ITEM_TIMEOUT_SECONDS"
+DEFAULT_BATCH_MAX_ITEMS = 500
+DEFAULT_BATCH_CONCURRENCY = 4
+DEFAULT_BATCH_ITEM_TIMEOUT_SECONDS = 60.0
+
+
+def batch_max_items() -> int:
+    raw = os.environ.get(BATCH_MAX_ITEMS_ENV, "").strip()
+    return max(1, int(raw)) if raw else DEFAULT_BATCH_MAX_ITEMS
+
+
+def batch_concurrency() -> int:
+    raw = os.environ.get(BATCH_CONCURRENCY_ENV, "").strip()
+    return max(1, int(raw)) if raw else DEFAULT_BATCH_CONCURRENCY
+
+
+def batch_item_timeout_seconds() -> float:
+    raw = os.environ.get(BATCH_ITEM_TIMEOUT_ENV, "").strip()
+    return float(raw) if raw else DEFAULT_BATCH_ITEM_TIMEOUT_SECONDS
+
+
+def group_batch_items(items: List[CardioPilotBatchItem]) -> List[List[int]]:
+    """Item indices grouped by whitespace-normalized narrative, in first-seen order."""
+    groups: Dict[str, List[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(normalize_case_text(item.case_text), []).append(index)
+    return list(groups.values())
+
+
+def _extraction_error(e: Exception, extraction_id: str) -> Dict[str, Any]:
+    """Error envelope for streamed results, which cannot change the HTTP status once started."""
+    if isinstance(e, HTTPException):
+        return make_error("EXTRACTION_FAILED", str(e.detail), meta={"status_code": e.status_code})
+    logger.error("[%s] extract_stream_error | type=%s", extraction_id, type(e).__name__)
+    return make_error("EXTRACTION_FAILED", "Unexpected error during extraction.", meta={"status_code": 500})
+
+
+async def _batch_outcome(
+    case_text: str, payload: CardioPilotBatchExtractRequest, timeout: float, deadline: Optional[float]
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """(extraction, None) or (None, error envelope); never raises, so one item cannot end the stream."""
+    extraction_id = _new_extraction_id()
+    try:
+        with deadline_scope(deadline):
+            result, _ = await asyncio.wait_for(
+                _extract(case_text, payload.language, payload.bypass_cache, extraction_id), timeout
+            )
+    except asyncio.TimeoutError:
+        logger.error("[%s] batch_item_timeout | timeout_s=%.1f", extraction_id, timeout)
+        return None, make_error("ITEM_TIMEOUT", f"Extraction did not finish within {timeout:g}s.", meta={"status_code": 504})
+    except Exception as e:
+        return None, _extraction_error(e, extraction_id)
+    return result.model_dump(mode="json"), None
+
+
+async def _stream_batch_extractions(
+    payload: CardioPilotBatchExtractRequest, deadline: Optional[float]
+) -> AsyncIterator[bytes]:
+    groups = group_batch_items(payload.items)
+    todo = deque(groups)
+    done: asyncio.Queue = asyncio.Queue()
+    timeout = batch_item_timeout_seconds()
+
+    async def worker() -> None:
+        while todo:
+            indices = todo.popleft()
+            outcome = await _batch_outcome(payload.items[indices[0]].case_text, payload, timeout, deadline)
+            await done.put((indices, outcome))
+
+    # Unique narratives are pulled by a fixed pool of workers; the shared OpenAI slot
+    # (api/openai_client.py) still caps model calls across all concurrent requests.
+    workers = [asyncio.create_task(worker()) for _ in range(min(batch_concurrency(), len(groups)))]
+    failed = 0
+    try:
+        for _ in groups:
+            indices, (extraction, error) = await done.get()
+            output = bytearray()
+            for index in indices:
+                line: Dict[str, Any] = {"index": index, "id": payload.items[index].id}
+                if index != indices[0]:
+                    line["duplicate_of"] = indices[0]
+                if error is not None:
+                    failed += 1
+                    line["error"] = {**error, "path": f"$.items[{index}]"}
+                elif index == indices[0]:
+                    line["extraction"] = extraction
+                else:
+                    EXTRACTIONS.inc("batch_duplicate")
+                    line["extraction"] = {**extraction, "extraction_id": _new_extraction_id()}
+                output += ndjson_dumps(line)
+            yield bytes(output)
+        yield ndjson_dumps({
+            "summary": {
+                "items": len(payload.items),
+                "unique": len(groups),
+                "succeeded": len(payload.items) - failed,
+                "failed": failed,
+            }
+        })
+    finally:
+        # Client gone or stream finished: stop any extraction still running.
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+@router.post("/extract/batch", response_class=StreamingResponse)
+async def pilot_extract_batch(
+    payload: CardioPilotBatchExtractRequest, x_soficca_deadline_ms: Optional[int] = Header(default=None, ge=1)
+) -> StreamingResponse:
+    """
+    Extract many narratives in one request, streaming one NDJSON line per item as it completes.
+
+    Identical narratives (after whitespace normalization) are extracted once. Lines are
+    `{"index", "id", "extraction"}` or `{"index", "id", "error": {code, message, path, meta}}`,
+    with `duplicate_of` on deduplicated items, followed by one `{"summary": {...}}` line.
+    At most SOFICCA_EXTRACT_BATCH_CONCURRENCY narratives run at once, each bounded by
+    SOFICCA_EXTRACT_BATCH_ITEM_TIMEOUT_SECONDS; `X-Soficca-Deadline-Ms` is one budget for
+    the whole batch.
+    """
+    max_items = batch_max_items()
+    if len(payload.items) > max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch has {len(payload.items)} items; the limit is {max_items}.",
+        )
+    return StreamingResponse(
+        _stream_batch_extractions(payload, deadline_after(x_soficca_deadline_ms)), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+# ── Server-sent events endpoint ───────────────────────────────────
+
+
+async def _stream_extraction_events(
+    payload: CardioPilotExtractRequest, deadline: Optional[float]
+) -> AsyncIterator[bytes]:
+    extraction_id = _new_extraction_id()
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def emit(event: str, data: Dict[str, Any]) -> None:
+        await events.put(sse_event(event, data))
+
+    async def run() -> None:
+        try:
+            with deadline_scope(deadline):
+                result, _ = await _extract(
+                    payload.case_text, payload.language, payload.bypass_cache, extraction_id, emit
+                )
+            await emit("result", result.model_dump(mode="json"))
+        except Exception as e:
+            await emit("error", _extraction_error(e, extraction_id))
+        finally:
+            await events.put(None)
+
+    yield sse_event("accepted", {"extraction_id": extraction_id, "model": _reported_model()})
+    task = asyncio.create_task(run())
+    try:
+        while (frame := await events.get()) is not None:
+            yield frame
+    finally:
+        # Client gone: stop the extraction (and release its OpenAI slot).
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+@router.post("/extract/stream", response_class=StreamingResponse)
+async def pilot_extract_stream(
+    payload: CardioPilotExtractRequest, x_soficca_deadline_ms: Optional[int] = Header(default=None, ge=1)
+) -> StreamingResponse:
+    """
+    The extraction of `/extract`, reported as server-sent events while it runs.
+
+    Events, in order: `accepted` {extraction_id, model}; `pre_extraction` {fields,
+    covers_core_fields, missing_core_fields}; `cache` {status} on a cache hit; `partial`
+    {fields} each time the model completes more fields; `safety` {warnings}; then
+    either `result` (exactly the `/extract` response body) or `error`
+    {code, message, path, meta.status_code}. Stages that do not run emit nothing.
+    """
+    return StreamingResponse(
+        _stream_extraction_events(payload, deadline_after(x_soficca_deadline_ms)),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
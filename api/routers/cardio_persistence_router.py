@@ -22,6 +22,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, ConfigDict, Field
 
+from api.encoding import FastJSONResponse, FastJSONRoute
 from db.config import database_url_configured
 from db.pool import create_pool, get_pool
 from repositories.cardio_models import (
@@ -52,7 +53,12 @@ from repositories.cardio_pilot_repository import (
 )
 from repositories.errors import DatabaseWriteError, RecordNotFoundError
 
-router = APIRouter(prefix="/v1/cardio/pilot", tags=["cardio-pilot-persistence"])
+router = APIRouter(
+    prefix="/v1/cardio/pilot",
+    tags=["cardio-pilot-persistence"],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
+)
 
 
 # ── Helpers ──────────────────────────────────────────────────────
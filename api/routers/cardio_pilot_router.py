@@ -20,8 +20,18 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from cardio_triage_v1.decision_contract import assert_valid_report
 from cardio_triage_v1.validation import evaluate_readiness as evaluate_cardio_report
+from soficca_core.timing import STAGE_CONTRACT, current_stage_timings
 
-router = APIRouter(prefix="/v1/cardio/pilot", tags=["cardio-pilot"])
+from api.encoding import FastJSONResponse, FastJSONRoute
+from api.metrics import record_decision_report
+from api.profiling import profiled
+
+router = APIRouter(
+    prefix="/v1/cardio/pilot",
+    tags=["cardio-pilot"],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
+)
 
 
 # ── Pydantic models ──────────────────────────────────────────────
@@ -130,6 +140,7 @@ def map_extraction_to_engine_input(
 
 
 @router.post("/report", response_model=CardioPilotReportResponse)
+@profiled
 def pilot_report(payload: CardioPilotReportRequest) -> CardioPilotReportResponse:
     """
     Accept a pilot extraction payload, map to engine input,
@@ -140,13 +151,16 @@ def pilot_report(payload: CardioPilotReportRequest) -> CardioPilotReportResponse
 
     raw_report = evaluate_cardio_report(engine_input)
     validated_report = assert_valid_report(raw_report)
+    current_stage_timings().mark(STAGE_CONTRACT)
+    engine_report = validated_report.model_dump(mode="json")
+    record_decision_report("cardio_triage_v1", engine_report)
 
     return CardioPilotReportResponse(
         case_id=payload.case_id,
         source=payload.source,
         raw_text=payload.raw_text,
         engine_input=engine_input,
-        engine_report=validated_report.model_dump(mode="json"),
+        engine_report=engine_report,
         human_review_required=True,
         pilot_mode="deterministic_routing_v1",
     )
@@ -1,10 +1,13 @@
 from fastapi import APIRouter
+from api.encoding import FastJSONResponse, FastJSONRoute
 from schemas.dermatology_schemas import PenIntakePayload, SoficcaDecisionResponse
 from rules.dermatology_rules import evaluate_hairloss_case
 
 router = APIRouter(
     prefix="/api/v1/dermatology",
-    tags=["Dermatology / Pen"]
+    tags=["Dermatology / Pen"],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
 )
 
 @router.post("/hairloss/evaluate", response_model=SoficcaDecisionResponse)
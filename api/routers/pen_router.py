@@ -1,18 +1,76 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
 
-from pen_hair_v1.schema import PenEvaluationResponse, PenIntakeRequest
-from pen_hair_v1.service import evaluate_pen_intake
+from api.encoding import FastJSONResponse, FastJSONRoute
+from api.json_cache import PrecomputedJSON
+from api.metrics import record_decision
+from api.profiling import profiled
+from api.single_flight import SingleFlight, canonical_key
 
-router = APIRouter(prefix="/v1/pen", tags=["Pen Hair v1"])
+from pen_hair_v1.constants import JOURNEY_STATES
+from pen_hair_v1.journey_token import JourneyTokenError
+from pen_hair_v1.metrics import decision_cache_metrics
+from pen_hair_v1.schema import (
+    PenEvaluationResponse,
+    PenIntakeRequest,
+    PenJourneyStageResponse,
+    PenLazyEvaluationResponse,
+)
+from pen_hair_v1.service import evaluate_pen_intake, evaluate_pen_intake_lazy, render_pen_journey_stage
+
+router = APIRouter(
+    prefix="/v1/pen",
+    tags=["Pen Hair v1"],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
+)
+
+_PEN_CONTRACT = PrecomputedJSON(PenEvaluationResponse.model_json_schema())
+_PEN_EVALUATE_FLIGHT = SingleFlight("pen_evaluate")
 
 
 @router.get("/contract")
-def pen_contract() -> dict:
-    return PenEvaluationResponse.model_json_schema()
+def pen_contract(request: Request) -> Response:
+    return _PEN_CONTRACT.response(request)
+
+
+@router.get("/metrics")
+def pen_metrics() -> dict:
+    return {"caches": decision_cache_metrics()}
 
 
 @router.post("/evaluate", response_model=PenEvaluationResponse)
+@profiled
 def evaluate_pen(payload: PenIntakeRequest) -> PenEvaluationResponse:
-    return evaluate_pen_intake(payload)
+    key = canonical_key(payload.model_dump(mode="json"))
+    response = _PEN_EVALUATE_FLIGHT.run(key, evaluate_pen_intake, payload)
+    _record_pen_decision(response)
+    return response
+
+
+@router.post("/evaluate/lazy", response_model=PenLazyEvaluationResponse)
+@profiled
+def evaluate_pen_lazy(payload: PenIntakeRequest) -> PenLazyEvaluationResponse:
+    response = evaluate_pen_intake_lazy(payload)
+    _record_pen_decision(response)
+    return response
+
+
+def _record_pen_decision(response: PenEvaluationResponse | PenLazyEvaluationResponse) -> None:
+    # Pen safety outcomes surface as decision flags; they are counted as policy triggers.
+    record_decision("pen_hair_v1", response.decision.status, response.trace.rules_triggered, response.decision.flags)
+
+
+@router.get("/journey/{stage}", response_model=PenJourneyStageResponse)
+def pen_journey_stage(
+    stage: str,
+    token: str = Query(..., min_length=1, description="frontend_adapter.evaluation.journey_token"),
+) -> PenJourneyStageResponse:
+    if stage not in JOURNEY_STATES:
+        raise HTTPException(status_code=404, detail=f"Unknown journey stage: {stage}")
+    try:
+        return render_pen_journey_stage(stage, token)
+    except JourneyTokenError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid journey token: {e}")
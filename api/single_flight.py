@@ -0,0 +1,92 @@
+"""
+Single-flight coalescing for engine endpoints.
+
+Concurrent requests with the same canonical payload share one in-flight evaluation:
+the first caller (the leader) runs it, callers arriving while it runs wait for and
+return the same result, or re-raise the same exception. Nothing is cached once the
+evaluation finishes, so a later identical request evaluates again.
+
+Engine handlers are sync and run in the thread pool, so waiting blocks a worker
+thread, never the event loop. Results are shared between callers: callers must treat
+them as read-only (the endpoints only serialize them).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, TypeVar
+
+T = TypeVar("T")
+
+_GROUPS: List["SingleFlight"] = []
+
+
+def canonical_key(payload: Any) -> str:
+    """Hash of a JSON-compatible payload that ignores key order and whitespace."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """One coalescing group (typically one endpoint), with counters."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        _GROUPS.append(self)
+
+    def run(self, key: str, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                self.executions += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        # Leave the in-flight table before publishing, so a request arriving after
+        # completion starts a fresh evaluation instead of reading a finished one.
+        try:
+            result = func(*args)
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: str) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._in_flight),
+            }
+
+
+def single_flight_metrics() -> Dict[str, Dict[str, int]]:
+    """Counters per group name (groups sharing a name are summed)."""
+    totals: Dict[str, Dict[str, int]] = {}
+    for group in _GROUPS:
+        counters = totals.setdefault(group.name, {"calls": 0, "executions": 0, "coalesced": 0, "in_flight": 0})
+        for key, value in group.metrics().items():
+            counters[key] += value
+    return dict(sorted(totals.items()))
@@ -0,0 +1,18 @@
+"""Server-sent events helpers for progress streams."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from api.encoding import encode_json
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Proxies (nginx in particular) buffer responses unless told otherwise, which would
+# hold every event back until the stream ends.
+SSE_HEADERS: Dict[str, str] = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    """One `event:`/`data:` frame; the JSON encoding never contains raw newlines."""
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + encode_json(data) + b"\n\n"
@@ -0,0 +1,159 @@
+"""
+Build-time asset pipeline and static serving for the cardio demo.
+
+`build_static_assets` copies a static directory, renames JS/CSS files to
+content-hashed names (`main.3f9c1a2b7d.js`), rewrites the relative references to them
+in HTML/JS/CSS, and writes `.br` (when `brotli` is installed) and `.gz` siblings for
+text assets. Run it through `scripts/build_demo_assets.py`.
+
+`PrecompressedStaticFiles` serves such a directory: it negotiates the precompressed
+sibling with the client's Accept-Encoding, and marks hashed files as immutable while
+entry points (index.html) revalidate on every load. Pointed at an unbuilt directory it
+behaves like StaticFiles plus revalidation headers.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Scope
+
+from api.compression import ENCODING_BROTLI, ENCODING_GZIP, brotli, negotiate_encoding
+
+HASH_LENGTH = 10
+HASHED_SUFFIXES = (".js", ".css")
+PRECOMPRESS_SUFFIXES = (".html", ".js", ".css", ".json", ".svg", ".txt", ".ts")
+MANIFEST_NAME = "manifest.json"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+# Sibling suffix per encoding, in server preference order.
+PRECOMPRESSED_SUFFIXES: Dict[str, str] = {ENCODING_BROTLI: ".br", ENCODING_GZIP: ".gz"}
+
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{%d}\.[A-Za-z0-9]+$" % HASH_LENGTH)
+# Relative references (`./dom.js`, `../styles.css`) inside quotes: imports, src, href.
+_RELATIVE_REFERENCE = re.compile(r"""(?P<quote>["'])(?P<ref>\.{1,2}/[^"'\s]+?\.(?:js|css))(?P=quote)""")
+
+
+def is_hashed_asset(path: str) -> bool:
+    return _HASHED_NAME.search(os.path.basename(path)) is not None
+
+
+# ── Build ─────────────────────────────────────────────────────────
+
+
+class _AssetBuilder:
+    def __init__(self, source: Path, output: Path) -> None:
+        self.source = source
+        self.output = output
+        self.hashed: Dict[str, str] = {}
+        self._in_progress: List[str] = []
+
+    def _rewrite(self, relative: str, text: str) -> str:
+        base = Path(relative).parent
+
+        def replace(match: "re.Match[str]") -> str:
+            ref = match.group("ref")
+            target = os.path.normpath(base / ref).replace(os.sep, "/")
+            if not (self.source / target).is_file():
+                return match.group(0)
+            hashed = self.emit(target)
+            return match.group("quote") + ref[: ref.rfind("/") + 1] + Path(hashed).name + match.group("quote")
+
+        return _RELATIVE_REFERENCE.sub(replace, text)
+
+    def emit(self, relative: str) -> str:
+        """Write one source file to the output (dependencies first); returns its output name."""
+        if relative in self.hashed:
+            return self.hashed[relative]
+        if relative in self._in_progress:
+            raise ValueError(f"Circular asset reference: {' -> '.join(self._in_progress + [relative])}")
+        self._in_progress.append(relative)
+        path = Path(relative)
+        data = (self.source / relative).read_bytes()
+        if path.suffix in HASHED_SUFFIXES or path.suffix == ".html":
+            data = self._rewrite(relative, data.decode("utf-8")).encode("utf-8")
+        name = relative
+        if path.suffix in HASHED_SUFFIXES:
+            digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+            name = path.with_name(f"{path.stem}.{digest}{path.suffix}").as_posix()
+        target = self.output / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        if path.suffix in PRECOMPRESS_SUFFIXES:
+            _write_precompressed(target, data)
+        self._in_progress.pop()
+        self.hashed[relative] = name
+        return name
+
+
+def _write_precompressed(target: Path, data: bytes) -> None:
+    variants = {ENCODING_GZIP: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[ENCODING_BROTLI] = brotli.compress(data, quality=11)
+    for encoding, compressed in variants.items():
+        if len(compressed) < len(data):
+            target.with_name(target.name + PRECOMPRESSED_SUFFIXES[encoding]).write_bytes(compressed)
+
+
+def build_static_assets(source: Path, output: Path) -> Dict[str, str]:
+    """Rebuild `output` from `source`; returns the source -> output name manifest."""
+    if output.exists():
+        shutil.rmtree(output)
+    output.mkdir(parents=True)
+    builder = _AssetBuilder(source, output)
+    for path in sorted(source.rglob("*")):
+        if path.is_file() and path.suffix != ".md":
+            builder.emit(path.relative_to(source).as_posix())
+    manifest = dict(sorted(builder.hashed.items()))
+    (output / MANIFEST_NAME).write_text(json.dumps({"assets": manifest}, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+# ── Serving ───────────────────────────────────────────────────────
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        path = os.fspath(full_path)
+        media_type = mimetypes.guess_type(path)[0] or "text/plain"
+        headers = {
+            "cache-control": IMMUTABLE_CACHE_CONTROL if is_hashed_asset(path) else REVALIDATE_CACHE_CONTROL,
+        }
+
+        variants = {
+            encoding: path + suffix for encoding, suffix in PRECOMPRESSED_SUFFIXES.items() if os.path.isfile(path + suffix)
+        }
+        encoding: Optional[str] = None
+        if variants:
+            headers["vary"] = "Accept-Encoding"
+            encoding = negotiate_encoding(request_headers.get("accept-encoding"), list(variants))
+        if encoding is not None:
+            path = variants[encoding]
+            stat_result = os.stat(path)
+            headers["content-encoding"] = encoding
+
+        # The ETag comes from the served file's stat, so each encoding gets its own.
+        response = FileResponse(path, status_code=status_code, headers=headers, media_type=media_type, stat_result=stat_result)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,85 @@
+"""
+Stage timing middleware.
+
+Opens a stage-timing recording for each HTTP request. When the handler ran an
+instrumented engine, the stages (see soficca_core.timing) go out as a `Server-Timing`
+header and as one structured log line on the "soficca.timing" logger:
+
+    {"event": "stage_timings", "method": "POST", "path": "/v1/evaluate", "status": 200,
+     "stages_ms": {"request": 0.41, "validate": 0.01, ...}, "total_ms": 1.2}
+
+`request` covers body parsing and request validation before the engine starts;
+`response` covers response serialization after it returns. Set
+SOFICCA_STAGE_TIMING=0 to disable recording entirely.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Dict, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from soficca_core.timing import STAGE_RESPONSE, StageTimings, record_stage_timings
+
+STAGE_TIMING_ENV = "SOFICCA_STAGE_TIMING"
+
+logger = logging.getLogger("soficca.timing")
+
+
+def stage_timing_enabled() -> bool:
+    return os.environ.get(STAGE_TIMING_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _stages_ms(timings: StageTimings) -> Dict[str, float]:
+    return {stage: round(ns / 1_000_000, 3) for stage, ns in timings.stages_ns.items()}
+
+
+def server_timing_header(timings: StageTimings, total_ns: Optional[int] = None) -> str:
+    entries = [f"{stage};dur={ms}" for stage, ms in _stages_ms(timings).items()]
+    if total_ns is not None:
+        entries.append(f"total;dur={round(total_ns / 1_000_000, 3)}")
+    return ", ".join(entries)
+
+
+class StageTimingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.enabled = stage_timing_enabled()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = 0
+        with record_stage_timings() as timings:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    if timings.stages_ns:
+                        timings.mark(STAGE_RESPONSE)
+                        header = server_timing_header(timings, timings.total_ns())
+                        message["headers"] = [*message.get("headers", []), (b"server-timing", header.encode("latin-1"))]
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        if timings.stages_ns and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                json.dumps(
+                    {
+                        "event": "stage_timings",
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status,
+                        "stages_ms": _stages_ms(timings),
+                        "total_ms": round(timings.total_ns() / 1_000_000, 3),
+                    },
+                    separators=(",", ":"),
+                )
+            )
@@ -0,0 +1,91 @@
+"""
+Response encoding benchmark: FastAPI's default path vs api.encoding.
+
+For a representative payload per endpoint, compares
+  default: jsonable_encoder(...) + JSONResponse.render (stdlib json)
+  fast:    api.encoding.encode_json (pydantic serializer / orjson)
+
+Usage:
+    cd soficca_core_engine
+    python scripts/benchmark_json_encoding.py [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from api.encoding import encode_json, orjson
+from api.main import BatchEvaluateResponse
+from api.routers.cardio_pilot_router import CardioPilotExtraction, CardioPilotReportRequest, pilot_report
+from cardio_triage_v1.validation import evaluate_readiness
+from pen_hair_v1.examples import canonical_hypertension_request_example
+from pen_hair_v1.request_adapter import map_frontend_intake_to_request
+from pen_hair_v1.service import evaluate_pen_intake
+from soficca_core.engine import evaluate as evaluate_decision
+
+
+def _payloads() -> List[Tuple[str, Any]]:
+    evaluate_input = json.loads((ROOT / "examples" / "02_decided_safe.json").read_text(encoding="utf-8"))
+    cardio_scenarios = json.loads((ROOT / "examples" / "cardio_v1_scenarios.json").read_text(encoding="utf-8"))
+    cardio_input = cardio_scenarios["scenarios"][0]["input"]
+    decision_report = evaluate_decision(evaluate_input)
+    cardio_report = evaluate_readiness(cardio_input)
+    pen_response = evaluate_pen_intake(map_frontend_intake_to_request(canonical_hypertension_request_example()))
+    pilot_response = pilot_report(
+        CardioPilotReportRequest(
+            case_id="BENCH-001",
+            extraction=CardioPilotExtraction(**{k: v for k, v in cardio_input["state"].items() if k in CardioPilotExtraction.model_fields}),
+        )
+    )
+    case_bundle: Dict[str, Any] = {
+        "case": {"case_id": "BENCH-001", "status": "REVIEWED", "engine_report": cardio_report},
+        "extraction": {"payload": cardio_input, "warnings": []},
+        "feedback": [{"reviewer": f"R{i}", "notes": "ok", "payload": {"agree": True}} for i in range(20)],
+    }
+    return [
+        ("POST /v1/evaluate", decision_report),
+        ("POST /v1/evaluate/batch (200 items)", BatchEvaluateResponse(results=[decision_report] * 200)),
+        ("POST /v1/cardio/report", cardio_report),
+        ("POST /v1/cardio/pilot/report", pilot_response),
+        ("POST /v1/pen/evaluate", pen_response),
+        ("GET /v1/cardio/pilot/cases/{id} (bundle)", case_bundle),
+    ]
+
+
+def _default(content: Any) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def _time(func: Callable[[Any], bytes], content: Any, repeat: int) -> float:
+    return min(timeit.repeat(lambda: func(content), number=repeat, repeat=3)) / repeat * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"fast encoder: {'orjson ' + orjson.__version__ if orjson else 'pydantic_core'}")
+    print(f"{'endpoint':44} {'bytes':>8} {'default us':>11} {'fast us':>9} {'speedup':>8}")
+    for name, content in _payloads():
+        assert json.loads(_default(content)) == json.loads(encode_json(content)), name
+        default_us = _time(_default, content, args.repeat)
+        fast_us = _time(encode_json, content, args.repeat)
+        size = len(encode_json(content))
+        print(f"{name:44} {size:>8} {default_us:>11.1f} {fast_us:>9.1f} {default_us / fast_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Safety filter benchmark: per-phrase substring loop vs api.phrase_matcher.
+
+For clean summaries of growing length (the worst case: nothing matches, so nothing
+short-circuits) and phrase lists of growing size, compares
+  loop:     `phrase in text.lower()` for every phrase (the previous filter; first hit only)
+  loop-all: str.find per phrase until exhausted (same output as the matcher)
+  compiled: PhraseMatcher.find_all, one trie-shaped regex scan
+
+Usage:
+    cd soficca_core_engine
+    python scripts/benchmark_safety_filter.py [--repeat 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from api.phrase_matcher import PhraseMatch, PhraseMatcher
+from api.routers.cardio_extract_router import DISALLOWED_PHRASES
+
+SUMMARY_SENTENCE = (
+    "The narrative reports a 64-year-old patient with retrosternal chest pressure for 40 minutes, "
+    "radiating to the left arm, with diaphoresis; blood pressure 150/95 and heart rate 104 are documented. "
+)
+
+_VERBS = ["recommend", "refer", "transfer", "escalate", "recomendar", "derivar", "trasladar", "orienter", "encaminhar"]
+_OBJECTS = [
+    "to cardiology", "to the emergency department", "for admission", "for thrombolysis", "for angiography",
+    "a urgencias", "a cardiología", "para ingreso", "vers les urgences", "para a emergência",
+    "immediately", "without delay", "today", "for observation",
+]
+
+
+def _phrase_lists() -> List[Tuple[str, List[str]]]:
+    synthetic = [f"{verb} {obj}" for verb, obj in itertools.product(_VERBS, _OBJECTS)]
+    numbered = [f"{phrase} ({n})" for n, phrase in enumerate(synthetic * 4)]
+    return [
+        (f"{len(DISALLOWED_PHRASES)} phrases", list(DISALLOWED_PHRASES)),
+        (f"{len(DISALLOWED_PHRASES) + len(synthetic)} phrases", list(DISALLOWED_PHRASES) + synthetic),
+        (f"{len(DISALLOWED_PHRASES) + len(numbered)} phrases", list(DISALLOWED_PHRASES) + numbered),
+    ]
+
+
+def _loop(phrases: List[str]) -> Callable[[str], object]:
+    def run(text: str) -> object:
+        lower = text.lower()
+        for phrase in phrases:
+            if phrase in lower:
+                return phrase
+        return None
+
+    return run
+
+
+def _loop_all(phrases: List[str]) -> Callable[[str], List[PhraseMatch]]:
+    def run(text: str) -> List[PhraseMatch]:
+        lower = text.lower()
+        found: List[PhraseMatch] = []
+        for phrase in phrases:
+            start = lower.find(phrase)
+            while start != -1:
+                found.append(PhraseMatch(phrase, start, start + len(phrase)))
+                start = lower.find(phrase, start + 1)
+        return found
+
+    return run
+
+
+def _time(func: Callable[[str], object], text: str, repeat: int) -> float:
+    return min(timeit.repeat(lambda: func(text), number=repeat, repeat=3)) / repeat * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'phrases':>14} {'chars':>8} {'loop us':>10} {'loop-all us':>12} {'compiled us':>12} {'vs loop-all':>11}")
+    for label, phrases in _phrase_lists():
+        matcher = PhraseMatcher(phrases)
+        for sentences in (4, 40, 400):
+            text = SUMMARY_SENTENCE * sentences
+            probe = text + "The patient should be referred; route to emergency."
+            assert sorted(_loop_all(phrases)(probe), key=lambda m: m.start) == matcher.find_all(probe), label
+            loop_us = _time(_loop(phrases), text, args.repeat)
+            loop_all_us = _time(_loop_all(phrases), text, args.repeat)
+            compiled_us = _time(matcher.find_all, text, args.repeat)
+            print(
+                f"{label:>14} {len(text):>8} {loop_us:>10.1f} {loop_all_us:>12.1f} {compiled_us:>12.1f} "
+                f"{loop_all_us / compiled_us:>10.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
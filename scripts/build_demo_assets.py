@@ -0,0 +1,45 @@
+"""
+Build the cardio demo for serving: content-hashed JS/CSS names plus .br/.gz siblings.
+
+The API serves the output directory at /demo/cardio when it exists (see
+api/static_assets.py); hashed files get immutable cache headers.
+
+Usage:
+    cd soficca_core_engine
+    python scripts/build_demo_assets.py [--source ui/cardio-demo] [--output build/cardio-demo]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from api.compression import brotli
+from api.static_assets import build_static_assets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--source", type=Path, default=ROOT / "ui" / "cardio-demo")
+    parser.add_argument("--output", type=Path, default=ROOT / "build" / "cardio-demo")
+    args = parser.parse_args()
+
+    manifest = build_static_assets(args.source, args.output)
+    print(f"precompressed: gzip{', brotli' if brotli is not None else ' (install brotli for .br)'}")
+    for source, output in manifest.items():
+        built = args.output / output
+        sizes = [f"{built.stat().st_size}"]
+        for suffix in (".br", ".gz"):
+            variant = built.with_name(built.name + suffix)
+            if variant.is_file():
+                sizes.append(f"{suffix[1:]} {variant.stat().st_size}")
+        print(f"{source:28} -> {output:36} {' / '.join(sizes)}")
+
+
+if __name__ == "__main__":
+    main()
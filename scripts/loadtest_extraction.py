@@ -0,0 +1,199 @@
+"""
+Offline load test for the extraction endpoints, replaying recorded model outputs.
+
+Drives the app in-process (httpx ASGITransport, no network) with SOFICCA_EXTRACTION_REPLAY
+standing in for the provider (api/extraction_replay.py), and reports throughput and
+latency percentiles. With `--latency 0` the numbers are the pipeline's own overhead
+(validation, safety filter, merging, response building); with a realistic latency they
+show how SOFICCA_OPENAI_MAX_CONCURRENCY shapes queueing and tail latency. `--error-rate`
+injects provider 500s, `--deadline-ms` sends a per-request budget and `--hedge` turns
+on hedged calls, to see the circuit breaker, deadlines and hedging under load.
+
+Without --cassette, a synthetic cassette is built from examples/cardio_v1_scenarios.json.
+Narratives are unique per request and bypass the cache, and the deterministic
+pre-extractor is off unless --pre-extraction is given, so every request reaches the
+(replayed) model.
+
+Usage:
+    cd soficca_core_engine
+    python scripts/loadtest_extraction.py [--cassette recorded.jsonl] [--latency lognormal:3,0.4]
+        [--requests 500] [--clients 64] [--openai-concurrency 16] [--endpoint extract|stream]
+        [--error-rate 0.3] [--deadline-ms 5000] [--hedge]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+
+def _extraction_fields(state: Dict[str, Any]) -> Dict[str, Any]:
+    """The engine state values the extraction schema can express (it has fewer enum values)."""
+    from pydantic import ValidationError
+
+    from api.routers.cardio_extract_router import CardioPilotExtractionFields
+
+    fields: Dict[str, Any] = {}
+    for name, value in state.items():
+        try:
+            CardioPilotExtractionFields(**{name: value})
+        except ValidationError:
+            continue
+        fields[name] = value
+    return fields
+
+
+def _synthetic_cassette(path: Path) -> None:
+    scenarios = json.loads((ROOT / "examples" / "cardio_v1_scenarios.json").read_text(encoding="utf-8"))["scenarios"]
+    with path.open("w", encoding="utf-8") as handle:
+        for index, scenario in enumerate(scenarios):
+            state = _extraction_fields(scenario["input"]["state"])
+            output = {
+                "fields": state,
+                "structured_clinical_summary": "The narrative reports "
+                + ", ".join(f"{name} {value}" for name, value in state.items())
+                + ".",
+                "missing_fields": [],
+                "missing_information": {"required_for_routing": [], "clinically_useful": [], "unconfirmed": []},
+                "completion_questions": ["How long has the pain lasted?"],
+                "possible_conflicts": [],
+                "field_evidence": [
+                    {"field": name, "value": str(value).lower(), "source_text": f"{name} {value}", "confidence": 0.9}
+                    for name, value in state.items()
+                ],
+                "extraction_quality_flags": ["requires_human_confirmation"],
+                "pii_warnings": [],
+                "warnings": [],
+                "confidence": 0.85,
+                "language_detected": "en",
+            }
+            handle.write(json.dumps({"key": f"synthetic-{index}", "model": "synthetic", "output": output}) + "\n")
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def _run(
+    endpoint: str, requests: int, clients: int, deadline_ms: Optional[int]
+) -> Tuple[float, List[float], Counter]:
+    import httpx
+
+    from api.main import app
+
+    path = "/v1/cardio/pilot/extract" + ("/stream" if endpoint == "stream" else "")
+    headers = {"X-Soficca-Deadline-Ms": str(deadline_ms)} if deadline_ms else {}
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    queue: asyncio.Queue = asyncio.Queue()
+    for index in range(requests):
+        queue.put_nowait(index)
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        while not queue.empty():
+            index = queue.get_nowait()
+            body: Dict[str, Any] = {
+                "case_text": f"Load test narrative {index}: chest pain since this morning.",
+                "bypass_cache": True,
+            }
+            start = time.perf_counter()
+            response = await client.post(path, json=body, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            failed = endpoint == "stream" and "event: error" in response.text
+            statuses["error event" if failed else response.status_code] += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies, statuses
+
+
+def _print_resilience() -> None:
+    from api.metrics import REGISTRY
+
+    prefixes = ("soficca_openai_calls_rejected_total", "soficca_openai_hedges_total", "soficca_circuit_breaker_")
+    for line in REGISTRY.render().splitlines():
+        if line.startswith(prefixes) and not line.endswith(" 0"):
+            print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cassette", type=Path, help="recorded cassette (SOFICCA_EXTRACTION_RECORD output)")
+    parser.add_argument("--latency", default="0", help="replay latency spec, e.g. fixed:2 or lognormal:3,0.4")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--clients", type=int, default=64, help="concurrent client connections")
+    parser.add_argument("--openai-concurrency", type=int, help="SOFICCA_OPENAI_MAX_CONCURRENCY for the run")
+    parser.add_argument("--endpoint", choices=("extract", "stream"), default="extract")
+    parser.add_argument("--pre-extraction", action="store_true", help="leave the deterministic pre-extractor on")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of replayed calls that fail with a 500")
+    parser.add_argument("--deadline-ms", type=int, help="X-Soficca-Deadline-Ms sent with each request")
+    parser.add_argument("--hedge", action="store_true", help="turn on hedged model calls (SOFICCA_OPENAI_HEDGE)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        cassette = args.cassette
+        if cassette is None:
+            cassette = Path(scratch) / "synthetic.jsonl"
+            _synthetic_cassette(cassette)
+        os.environ["SOFICCA_EXTRACTION_REPLAY"] = str(cassette)
+        os.environ["SOFICCA_EXTRACTION_REPLAY_LATENCY"] = args.latency
+        os.environ["SOFICCA_EXTRACTION_REPLAY_SEED"] = str(args.seed)
+        # Load-test narratives are unrecorded; each gets a recorded output as a stand-in.
+        os.environ["SOFICCA_EXTRACTION_REPLAY_SYNTHETIC"] = "1"
+        os.environ["SOFICCA_EXTRACTION_REPLAY_ERROR_RATE"] = str(args.error_rate)
+        if args.hedge:
+            os.environ["SOFICCA_OPENAI_HEDGE"] = "1"
+        os.environ.setdefault("SOFICCA_EXTRACTION_CACHE_SIZE", "64")
+        os.environ.pop("SOFICCA_EXTRACTION_CACHE_DIR", None)
+        os.environ.pop("SOFICCA_EXTRACTION_RECORD", None)
+        if not args.pre_extraction:
+            os.environ["SOFICCA_PRE_EXTRACTION"] = "0"
+        if args.openai_concurrency is not None:
+            os.environ["SOFICCA_OPENAI_MAX_CONCURRENCY"] = str(args.openai_concurrency)
+
+        elapsed, latencies, statuses = asyncio.run(
+            _run(args.endpoint, args.requests, args.clients, args.deadline_ms)
+        )
+
+    latencies.sort()
+    print(
+        f"endpoint={args.endpoint} latency={args.latency} requests={args.requests} clients={args.clients} "
+        f"openai_concurrency={os.environ.get('SOFICCA_OPENAI_MAX_CONCURRENCY', 'default')}"
+    )
+    print(f"statuses: {dict(statuses)}")
+    _print_resilience()
+    print(f"throughput: {len(latencies) / elapsed:.1f} req/s over {elapsed:.2f}s")
+    print(
+        "latency ms: "
+        + " ".join(
+            f"{label}={value * 1000:.1f}"
+            for label, value in (
+                ("mean", statistics.fmean(latencies)),
+                ("p50", _percentile(latencies, 0.50)),
+                ("p90", _percentile(latencies, 0.90)),
+                ("p99", _percentile(latencies, 0.99)),
+                ("max", latencies[-1]),
+            )
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ This is NOT part of CI — it requires real API calls.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 import json
@@ -156,7 +157,7 @@ def run_case(case: Dict[str, Any], model: str) -> Dict[str, Any]:
     print(f"  Narrative: {text[:100]}...")
 
     try:
-        raw_output = _call_openai(text, model)
+        raw_output = asyncio.run(_call_openai(text, model, f"MANUAL-{name}"))
     except Exception as e:
         print(f"  ERROR: {e}")
         return {"name": name, "status": "error", "error": str(e)}
@@ -0,0 +1,350 @@
+"""
+Deterministic pre-extraction of cardio fields from free text.
+
+Semi-structured narratives ("64M, BP 122/80, HR 78, chest pressure 15 min, no syncope")
+are scanned with a fixed set of compiled patterns (English and Spanish). Every value
+comes with the span of text that supports it. Boolean findings honour explicit
+negation ("no syncope", "denies dyspnea", "sin disnea", "syncope: no") within the same
+clause. A negation ends at the next comma unless the items form a coordinated list
+("no syncope, dyspnea or diaphoresis", "sin disnea, síncope ni dolor"); findings
+negated across a comma in such a list get CONFIDENCE_LIST_NEGATION, below the
+extraction router's default bar, so they are never routed on without the model. A
+field found both affirmed and denied is dropped as conflicting.
+
+Coverage is judged with the engine's own readiness rules (CORE_REQUIRED_FIELDS and
+detect_conflicts), so "covered" means the deterministic engine could route on these
+fields alone.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from cardio_triage_v1.normalization import normalize_for_readiness
+from cardio_triage_v1.validation import detect_conflicts, get_missing_core_fields
+
+PRE_EXTRACTOR_VERSION = "cardio-pre-extractor-v1"
+
+# Words allowed between a negation cue and the finding it negates ("no syncope, dyspnea or diaphoresis").
+NEGATION_WINDOW_WORDS = 5
+
+CONFIDENCE_LABELED_VITAL = 0.97
+CONFIDENCE_UNLABELED_VITAL = 0.9
+CONFIDENCE_AGE = 0.96
+CONFIDENCE_AGE_SHORTHAND = 0.93
+CONFIDENCE_FINDING = 0.92
+# Negation carried across a comma through a coordinated list: plausible, not confirmed.
+CONFIDENCE_LIST_NEGATION = 0.75
+CONFIDENCE_MEDICATION = 0.93
+CONFIDENCE_DURATION = 0.9
+CONFIDENCE_DESCRIPTOR = 0.9
+CONFIDENCE_SEVERITY = 0.88
+
+_I = re.IGNORECASE
+
+
+@dataclass(frozen=True)
+class FieldHit:
+    field: str
+    value: Any
+    source_text: str
+    confidence: float
+
+
+@dataclass
+class PreExtraction:
+    fields: Dict[str, Any]
+    evidence: List[FieldHit]
+    language: str
+    conflicting_fields: List[str] = field(default_factory=list)
+    missing_core_fields: List[str] = field(default_factory=list)
+    engine_conflicts: List[str] = field(default_factory=list)
+
+    @property
+    def confidence(self) -> float:
+        return min((hit.confidence for hit in self.evidence), default=0.0)
+
+    def covers_core_fields(self, min_confidence: float) -> bool:
+        """True when every core field is set, nothing conflicts and all evidence clears the bar."""
+        return (
+            not self.missing_core_fields
+            and not self.conflicting_fields
+            and not self.engine_conflicts
+            and self.confidence >= min_confidence
+        )
+
+
+# ── Patterns ──────────────────────────────────────────────────────
+
+_CLAUSE_BREAK = re.compile(
+    r"[.;!?\n]|\b(?:but|however|although|with|reports?|presents?|has|had|pero|aunque|con|refiere|presenta)\b", _I
+)
+_NEGATION_CUE = re.compile(
+    r"\b(?:no|not|denies|denied|deny|without|negative for|absence of|free of|sin|niega|neg[oó]|ni)\b", _I
+)
+_LIST_COORDINATOR = re.compile(r"\b(?:or|nor|and|o|u|ni|y|e)\b", _I)
+_POST_NEGATION = re.compile(r"\s*(?:[:=-]\s*)?(?:no|none|negative|neg|denied|absent|ausente|negativo|negativa)\b", _I)
+
+_AGE_PATTERNS: Tuple[Tuple[Pattern[str], float], ...] = (
+    (re.compile(r"\b(\d{1,3})\s*(?:-|\s)?(?:years?|yrs?|y)[\s-]*(?:old|o)\b", _I), CONFIDENCE_AGE),
+    (re.compile(r"\b(\d{1,3})\s*(?:yo|y/o)\b", _I), CONFIDENCE_AGE),
+    (re.compile(r"\b(\d{1,3})\s*a[nñ]os\b", _I), CONFIDENCE_AGE),
+    (re.compile(r"\b(?:age|aged|edad)\s*:?\s*(\d{1,3})\b", _I), CONFIDENCE_AGE),
+    (re.compile(r"\b(\d{1,3})\s*(?:[MF]|male|female|man|woman|hombre|mujer|var[oó]n)\b"), CONFIDENCE_AGE_SHORTHAND),
+)
+_BP_PATTERNS: Tuple[Tuple[Pattern[str], float], ...] = (
+    (
+        re.compile(
+            r"\b(?:BP|B/P|blood pressure|PA|TA|presi[oó]n arterial|tensi[oó]n arterial)\s*(?:of|is|was|de|:|=)?\s*(\d{2,3})\s*/\s*\d{2,3}",
+            _I,
+        ),
+        CONFIDENCE_LABELED_VITAL,
+    ),
+    (re.compile(r"\bsystolic(?: BP| blood pressure)?\s*(?:of|is|was|:|=)?\s*(\d{2,3})\b", _I), CONFIDENCE_LABELED_VITAL),
+    (re.compile(r"\b(\d{2,3})\s*/\s*\d{2,3}\s*mm\s*hg\b", _I), CONFIDENCE_UNLABELED_VITAL),
+)
+_HR_PATTERNS: Tuple[Tuple[Pattern[str], float], ...] = (
+    (
+        re.compile(
+            r"\b(?:HR|heart rate|pulse|FC|frecuencia card[ií]aca|pulso)\s*(?:of|is|was|de|:|=)?\s*(\d{2,3})\b", _I
+        ),
+        CONFIDENCE_LABELED_VITAL,
+    ),
+    (re.compile(r"\b(\d{2,3})\s*(?:bpm|lpm|beats per minute|latidos por minuto)\b", _I), CONFIDENCE_UNLABELED_VITAL),
+)
+# Unit "h"/"hr" only in lower case, so "HR 76" is not read as 76 hours.
+_DURATION = re.compile(
+    r"(?<![/\d])\b(\d{1,4}(?:[.,]\d+)?)\s*-?\s*((?i:min(?:ute)?s?|minutos?|hours?|horas?)|hrs?|h)\b"
+)
+
+_CHEST_PAIN = re.compile(
+    r"\bchest (?:pain|pressure|tightness|discomfort|heaviness)|\bangina\b"
+    r"|\bdolor (?:tor[aá]cico|en el pecho|precordial)|\b(?:opresi[oó]n|presi[oó]n) (?:tor[aá]cica|en el pecho)",
+    _I,
+)
+_FINDINGS: Dict[str, Pattern[str]] = {
+    "chest_pain_present": _CHEST_PAIN,
+    "dyspnea": re.compile(
+        r"\bdyspn(?:o)?ea\b|\bshort(?:ness)? of breath\b|\bSOB\b|\bbreathless(?:ness)?\b|\bdisnea\b|\bfalta de aire\b", _I
+    ),
+    "syncope": re.compile(
+        r"\bsyncop(?:e|al)\b|\bfaint(?:ed|ing)?\b|\bpassed out\b|\bloss of consciousness\b|\bs[ií]ncope\b|\bdesmayo\b", _I
+    ),
+    "diaphoresis": re.compile(
+        r"\bdiaphore(?:sis|tic)\b|\bsweat(?:ing|y)?\b|\bdiaforesis\b|\bsudoraci[oó]n\b|\bsudoros[oa]\b", _I
+    ),
+    "prior_mi": re.compile(
+        r"\b(?:prior|previous|history of|old) (?:MI|myocardial infarction|heart attack)\b"
+        r"|\b(?:infarto|IAM) previo\b|\bantecedentes? de infarto\b",
+        _I,
+    ),
+    "known_cad": re.compile(
+        r"\b(?:known )?CAD\b|\bcoronary (?:artery )?disease\b|\benfermedad coronaria\b|\bcardiopat[ií]a isqu[eé]mica\b"
+    ),
+}
+
+_EXERTIONAL = re.compile(r"\b(?:on|with) exertion\b|\bexertional\b|\b(?:al|con el|de) esfuerzo\b", _I)
+
+_CHARACTERS: Tuple[Tuple[str, Pattern[str]], ...] = (
+    ("pressure", re.compile(r"(?<!blood )\bpressure\b|\bpressing\b|\bopresi[oó]n\b|\bopresiv[oa]\b|\bpresi[oó]n\b(?! arterial)", _I)),
+    ("sharp", re.compile(r"\bsharp\b|\bstabbing\b|\bpunzante\b", _I)),
+    ("burning", re.compile(r"\bburning\b|\bardor\b|\bquemante\b", _I)),
+    ("tightness", re.compile(r"\btight(?:ness)?\b|\bconstrictiv[oa]\b", _I)),
+    ("heaviness", re.compile(r"\bheav(?:y|iness)\b|\bpesadez\b", _I)),
+)
+_SEVERITIES: Tuple[Tuple[str, Pattern[str]], ...] = (
+    ("high", re.compile(r"\bsevere\b|\bintense\b|\bexcruciating\b|\bcrushing\b|\b(?:10|[89])/10\b|\bsever[oa]\b|\bintens[oa]\b", _I)),
+    ("moderate", re.compile(r"\bmoderate\b|\b[5-7]/10\b|\bmoderad[oa]\b", _I)),
+    ("low", re.compile(r"\bmild\b|\bslight\b|\blow-grade\b|\b[1-4]/10\b|\blev[e]\b", _I)),
+)
+_NO_RADIATION = re.compile(
+    r"\bno radiation\b|\bnon-?radiating\b|\bwithout radiation\b|\bdoes not radiate\b|\bsin irradiaci[oó]n\b|\bno (?:se )?irradia",
+    _I,
+)
+_RADIATION_CUE = re.compile(r"\bradiat\w*|\bspread\w*|\birradia\w*|\bse extiende\b", _I)
+_RADIATION_SITES: Tuple[Tuple[str, Pattern[str]], ...] = (
+    ("left_arm", re.compile(r"\bleft arm\b|\bbrazo izquierdo\b", _I)),
+    ("right_arm", re.compile(r"\bright arm\b|\bbrazo derecho\b", _I)),
+    ("jaw", re.compile(r"\bjaw\b|\bmand[ií]bula\b", _I)),
+    ("back", re.compile(r"\bback\b|\bespalda\b", _I)),
+    ("shoulder", re.compile(r"\bshoulders?\b|\bhombros?\b", _I)),
+)
+
+_NO_MEDICATIONS = re.compile(
+    r"\bno (?:current |regular |cardiac |daily )?(?:medications?|meds|medicines|drugs)\b"
+    r"|\bnot (?:on|taking) (?:any )?(?:\w+ )?(?:medications?|meds|medicines)\b"
+    r"|\btakes no (?:\w+ )?(?:medications?|meds)\b"
+    r"|\bsin (?:medicaci[oó]n|medicamentos|tratamiento)\b|\bno toma (?:medicamentos|medicaci[oó]n)\b",
+    _I,
+)
+_MEDICATIONS = re.compile(
+    r"\b(aspirin|aspirina|ASA|metoprolol|atenolol|bisoprolol|carvedilol|lisinopril|enalapril|ramipril|losartan"
+    r"|valsartan|amlodipine|amlodipino|atorvastatin|atorvastatina|rosuvastatin|rosuvastatina|simvastatin"
+    r"|simvastatina|clopidogrel|ticagrelor|nitroglycerin|nitroglicerina|warfarin|apixaban|rivaroxaban"
+    r"|furosemide|furosemida|metformin|metformina|insulin|insulina)\b",
+    _I,
+)
+
+_SPANISH_MARKERS = re.compile(r"\b(?:paciente|años|dolor|pecho|desde hace|sin|con|niega|presión|frecuencia)\b", _I)
+_ENGLISH_MARKERS = re.compile(r"\b(?:patient|year|pain|chest|denies|with|without|pressure|rate|no)\b", _I)
+
+
+# ── Scanning ──────────────────────────────────────────────────────
+
+
+def _clause_start(text: str, position: int) -> int:
+    start = 0
+    for match in _CLAUSE_BREAK.finditer(text, 0, position):
+        start = match.end()
+    return start
+
+
+def _clause_end(text: str, position: int) -> int:
+    stop = _CLAUSE_BREAK.search(text, position)
+    return len(text) if stop is None else stop.start()
+
+
+def _in_coordinated_list(text: str, cue_end: int, end: int) -> bool:
+    """True when the comma-separated items after a negation cue are joined by "or"/"ni"/..."""
+    stop = _clause_end(text, end)
+    for next_cue in _NEGATION_CUE.finditer(text, end, stop):
+        if not _LIST_COORDINATOR.fullmatch(next_cue.group(0)):  # "ni" continues the list
+            stop = next_cue.start()
+            break
+    return _LIST_COORDINATOR.search(text, cue_end, stop) is not None
+
+
+def _negation_span(text: str, start: int, end: int) -> Optional[Tuple[int, int, float]]:
+    """(start, end, confidence) of the negated mention covering text[start:end], or None when affirmed."""
+    post = _POST_NEGATION.match(text, end)
+    if post is not None:
+        return start, post.end(), CONFIDENCE_FINDING
+    clause = _clause_start(text, start)
+    cue = None
+    for cue in _NEGATION_CUE.finditer(text, clause, start):
+        pass
+    if cue is None or len(text[cue.end():start].split()) > NEGATION_WINDOW_WORDS:
+        return None
+    if "," not in text[cue.end():start]:
+        return cue.start(), end, CONFIDENCE_FINDING
+    # "no radiation, denies dyspnea, fainted today": the negation stopped at the comma.
+    if _in_coordinated_list(text, cue.end(), end):
+        return cue.start(), end, CONFIDENCE_LIST_NEGATION
+    return None
+
+
+def _numbers(patterns: Tuple[Tuple[Pattern[str], float], ...], text: str, low: int, high: int) -> Iterator[Tuple[int, str, float]]:
+    for pattern, confidence in patterns:
+        for match in pattern.finditer(text):
+            value = int(match.group(1))
+            if low <= value <= high:
+                yield value, match.group(0).strip(), confidence
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.values: Dict[str, Any] = {}
+        self.evidence: Dict[str, FieldHit] = {}
+        self.conflicting: List[str] = []
+
+    def add(self, name: str, value: Any, source_text: str, confidence: float) -> None:
+        if name in self.conflicting:
+            return
+        if name in self.values:
+            if self.values[name] != value:
+                self.conflicting.append(name)
+                del self.values[name]
+                del self.evidence[name]
+            return
+        self.values[name] = value
+        self.evidence[name] = FieldHit(name, value, source_text, confidence)
+
+
+def _detect_language(text: str) -> str:
+    return "es" if len(_SPANISH_MARKERS.findall(text)) > len(_ENGLISH_MARKERS.findall(text)) else "en"
+
+
+def _collect_pain_descriptors(text: str, found: _Collector) -> None:
+    for match in _DURATION.finditer(text):
+        amount = float(match.group(1).replace(",", "."))
+        minutes = amount * 60 if match.group(2).lower().startswith("h") else amount
+        found.add("pain_duration_minutes", int(round(minutes)), match.group(0).strip(), CONFIDENCE_DURATION)
+
+    for match in _EXERTIONAL.finditer(text):
+        negation = _negation_span(text, match.start(), match.end())
+        start, end, confidence = negation or (match.start(), match.end(), CONFIDENCE_FINDING)
+        found.add("exertional_chest_pain", negation is None, text[start:end].strip(), confidence)
+
+    for character, pattern in _CHARACTERS:
+        for match in pattern.finditer(text):
+            if _negation_span(text, match.start(), match.end()) is None:
+                found.add("pain_character", character, match.group(0), CONFIDENCE_DESCRIPTOR)
+    # Severity words only count inside a chest-pain clause ("mild shortness of breath" is not pain severity).
+    for mention in _CHEST_PAIN.finditer(text):
+        if _negation_span(text, mention.start(), mention.end()) is not None:
+            continue
+        start, end = _clause_start(text, mention.start()), _clause_end(text, mention.end())
+        for severity, pattern in _SEVERITIES:
+            for match in pattern.finditer(text, start, end):
+                found.add("pain_severity", severity, match.group(0), CONFIDENCE_SEVERITY)
+
+    no_radiation = _NO_RADIATION.search(text)
+    if no_radiation is not None:
+        found.add("pain_radiation", "none", no_radiation.group(0), CONFIDENCE_DESCRIPTOR)
+    else:
+        for cue in _RADIATION_CUE.finditer(text):
+            end = len(text)
+            stop = _CLAUSE_BREAK.search(text, cue.end())
+            # "radiating to the left arm with sweating": sites end at the clause break
+            if stop is not None and stop.group(0) in ".;!?\n":
+                end = stop.start()
+            window = text[cue.end():end]
+            sites = [site for site, pattern in _RADIATION_SITES if pattern.search(window)]
+            if sites:
+                site = sites[0] if len(sites) == 1 else "multiple"
+                found.add("pain_radiation", site, text[cue.start():end].strip(), CONFIDENCE_DESCRIPTOR)
+
+
+def pre_extract(text: str) -> PreExtraction:
+    found = _Collector()
+
+    for value, source, confidence in _numbers(_AGE_PATTERNS, text, 0, 120):
+        found.add("age", value, source, confidence)
+    for value, source, confidence in _numbers(_BP_PATTERNS, text, 50, 260):
+        found.add("systolic_bp", value, source, confidence)
+    for value, source, confidence in _numbers(_HR_PATTERNS, text, 20, 250):
+        found.add("heart_rate", value, source, confidence)
+
+    for name, pattern in _FINDINGS.items():
+        for match in pattern.finditer(text):
+            negation = _negation_span(text, match.start(), match.end())
+            start, end, confidence = negation or (match.start(), match.end(), CONFIDENCE_FINDING)
+            found.add(name, negation is None, text[start:end].strip(), confidence)
+
+    # Pain descriptors only count once chest pain is affirmed ("mild dyspnea on exertion" describes dyspnea).
+    if found.values.get("chest_pain_present") is True:
+        _collect_pain_descriptors(text, found)
+
+    no_meds = _NO_MEDICATIONS.search(text)
+    if no_meds is not None:
+        found.add("current_meds_none", True, no_meds.group(0), CONFIDENCE_MEDICATION)
+    medications: List[str] = []
+    for match in _MEDICATIONS.finditer(text):
+        if _negation_span(text, match.start(), match.end()) is None and match.group(1).lower() not in medications:
+            medications.append(match.group(1).lower())
+    if medications:
+        found.add("current_meds_none", False, ", ".join(medications), CONFIDENCE_MEDICATION)
+        if "current_meds_none" in found.values:
+            found.add("current_meds_summary", ", ".join(medications), ", ".join(medications), CONFIDENCE_MEDICATION)
+
+    normalized = normalize_for_readiness(found.values)
+    return PreExtraction(
+        fields=dict(found.values),
+        evidence=list(found.evidence.values()),
+        language=_detect_language(text),
+        conflicting_fields=list(found.conflicting),
+        missing_core_fields=get_missing_core_fields(normalized),
+        engine_conflicts=detect_conflicts(normalized),
+    )
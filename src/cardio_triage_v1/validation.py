@@ -18,6 +18,15 @@ from cardio_triage_v1.normalization import normalize_for_readiness
 from cardio_triage_v1.rules import apply_routing
 from cardio_triage_v1.safety_policy import evaluate_safety
 from soficca_core.errors import make_error
+from soficca_core.timing import (
+    STAGE_NORMALIZE,
+    STAGE_REQUEST,
+    STAGE_RULES,
+    STAGE_SAFETY,
+    STAGE_TRACE,
+    STAGE_VALIDATE,
+    current_stage_timings,
+)
 
 CORE_REQUIRED_FIELDS: List[str] = [
     "age",
@@ -111,9 +120,12 @@ def detect_conflicts(normalized_state: Dict[str, Any]) -> List[str]:
 
 def evaluate_readiness(input_data: Any) -> Dict[str, Any]:
     """Stage-5 deterministic readiness + conflict handling + routing + emergency override."""
+    timings = current_stage_timings()
+    timings.mark(STAGE_REQUEST)
     report = build_base_report()
 
     errors, cleaned = validate_input(input_data)
+    timings.mark(STAGE_VALIDATE)
     if errors:
         report["ok"] = False
         report["errors"] = errors
@@ -130,6 +142,7 @@ def evaluate_readiness(input_data: Any) -> Dict[str, Any]:
 
     normalized = normalize_for_readiness(cleaned["state"])
     missing_fields = get_missing_core_fields(normalized)
+    timings.mark(STAGE_NORMALIZE)
 
     report["trace"]["evidence"] = {k: {"value": v} for k, v in normalized.items()}
 
@@ -150,13 +163,17 @@ def evaluate_readiness(input_data: Any) -> Dict[str, Any]:
         ]
         report["trace"]["preliminary_route"] = None
         report["trace"]["final_route"] = None
+        timings.mark(STAGE_TRACE)
         return report
 
+    timings.mark(STAGE_TRACE)
+
     conflicts_detected = detect_conflicts(normalized)
     report["trace"]["conflicts_detected"] = list(conflicts_detected)
 
     # Stage-4 deterministic preliminary route (non-emergency only)
     routing = apply_routing(normalized)
+    timings.mark(STAGE_RULES)
     report["decision"]["status"] = "DECIDED"
     report["decision"]["decision_id"] = routing["decision_id"]
     report["decision"]["decision_type"] = routing["decision_id"]
@@ -184,7 +201,9 @@ def evaluate_readiness(input_data: Any) -> Dict[str, Any]:
     routed_rules = list(routing["rules_triggered"])
     report["trace"]["rules_triggered"] = routed_rules
 
+    timings.mark(STAGE_TRACE)
     safety_eval = evaluate_safety(normalized)
+    timings.mark(STAGE_SAFETY)
     combined_activated_rules: List[str] = []
     for rid in routed_rules + list(safety_eval["activated_rules"]):
         if rid not in combined_activated_rules:
@@ -233,4 +252,5 @@ def evaluate_readiness(input_data: Any) -> Dict[str, Any]:
         report["trace"]["final_route"] = routing["preliminary_route"]
 
     report["trace"]["policy_trace"]["triggered"] = list(safety_eval["activated_rules"])
+    timings.mark(STAGE_TRACE)
     return report
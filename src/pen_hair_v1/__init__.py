@@ -1,5 +1,15 @@
 from pen_hair_v1.service import evaluate_pen_intake
-from pen_hair_v1.request_adapter import map_frontend_intake_to_request
+from pen_hair_v1.request_adapter import (
+    iter_frontend_intakes_from_ndjson,
+    map_frontend_intake_to_request,
+    map_frontend_intakes_to_requests,
+)
 from pen_hair_v1.contract_freeze import validate_frozen_pen_contract_shape
 
-__all__ = ["evaluate_pen_intake", "map_frontend_intake_to_request", "validate_frozen_pen_contract_shape"]
+__all__ = [
+    "evaluate_pen_intake",
+    "iter_frontend_intakes_from_ndjson",
+    "map_frontend_intake_to_request",
+    "map_frontend_intakes_to_requests",
+    "validate_frozen_pen_contract_shape",
+]
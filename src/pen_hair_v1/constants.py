@@ -14,10 +14,33 @@ DECISION_PATH_NEEDS_MORE_INFORMATION = "needs_more_information"
 DECISION_PATH_MANUAL_REVIEW = "manual_review"
 DECISION_PATH_ORAL_TREATMENT = "oral_treatment"
 
+DECISION_TITLE_CARDIO_MANUAL_REVIEW = "Manual clinical review required"
+DECISION_TITLE_SIDE_EFFECTS_MANUAL_REVIEW = "Manual review for prior side effects"
+DECISION_TITLE_NEEDS_MORE_INFORMATION = "More information needed"
+DECISION_TITLE_ORAL_TREATMENT = "Oral treatment selected"
+DECISION_TITLE_TOPICAL_WITH_SUPPORT = "Topical plan with support"
+DECISION_TITLE_TOPICAL_FIRST_LINE = "Topical first-line start"
+DECISION_TITLE_TOPICAL_ORAL_DEFERRED = "Topical first-line start (oral preference deferred)"
+DECISION_TITLES = [
+    DECISION_TITLE_CARDIO_MANUAL_REVIEW,
+    DECISION_TITLE_SIDE_EFFECTS_MANUAL_REVIEW,
+    DECISION_TITLE_NEEDS_MORE_INFORMATION,
+    DECISION_TITLE_ORAL_TREATMENT,
+    DECISION_TITLE_TOPICAL_WITH_SUPPORT,
+    DECISION_TITLE_TOPICAL_FIRST_LINE,
+    DECISION_TITLE_TOPICAL_ORAL_DEFERRED,
+]
+
 SAFETY_FLAG_HIGH_BLOOD_PRESSURE = "HIGH_BLOOD_PRESSURE"
 SAFETY_FLAG_CARDIOVASCULAR_CONDITION = "CARDIOVASCULAR_CONDITION"
 SAFETY_FLAG_PRIOR_SIDE_EFFECTS = "PRIOR_SIDE_EFFECTS"
 SAFETY_FLAG_SCALP_SENSITIVITY = "SCALP_SENSITIVITY"
+ALL_SAFETY_FLAGS = [
+    SAFETY_FLAG_HIGH_BLOOD_PRESSURE,
+    SAFETY_FLAG_CARDIOVASCULAR_CONDITION,
+    SAFETY_FLAG_PRIOR_SIDE_EFFECTS,
+    SAFETY_FLAG_SCALP_SENSITIVITY,
+]
 EXCLUDED_OPTION_ORAL_TREATMENT = DECISION_PATH_ORAL_TREATMENT
 
 RULE_EXCLUDE_ORAL_FOR_HYPERTENSION = "RULE_EXCLUDE_ORAL_FOR_HYPERTENSION_V1"
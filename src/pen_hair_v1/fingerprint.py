@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Tuple
+
+# Boolean intake signals that drive pen decisions, in bit order.
+SIGNAL_FIELDS: Tuple[str, ...] = (
+    "high_blood_pressure",
+    "cardiovascular_conditions",
+    "prior_treatment_use",
+    "had_side_effects",
+    "scalp_sensitivities",
+)
+
+# (signal bits, routine_consistency, priority_factor, treatment_preference)
+DecisionFingerprint = Tuple[int, str, str, str]
+
+
+def pack_signal_bits(*values: bool) -> int:
+    """Pack boolean signals, given in SIGNAL_FIELDS order, into an int."""
+    bits = 0
+    for position, value in enumerate(values):
+        if value:
+            bits |= 1 << position
+    return bits
+
+
+def signal_bits(source: Any) -> int:
+    """Pack the boolean decision signals of an intake-like object into an int."""
+    return pack_signal_bits(*(getattr(source, name) for name in SIGNAL_FIELDS))
+
+
+def signals_from_bits(bits: int) -> Dict[str, bool]:
+    return {name: bool(bits & (1 << position)) for position, name in enumerate(SIGNAL_FIELDS)}
+
+
+def decision_fingerprint(source: Any) -> DecisionFingerprint:
+    """Compact key over every intake field the pen rules, rationale and trace read."""
+    return (
+        signal_bits(source),
+        source.routine_consistency,
+        source.priority_factor,
+        source.treatment_preference,
+    )
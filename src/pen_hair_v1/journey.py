@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Mapping, Optional, Tuple, overload
 
 from pen_hair_v1.constants import (
     DECISION_PATH_MANUAL_REVIEW,
@@ -8,17 +8,25 @@ from pen_hair_v1.constants import (
     DECISION_PATH_ORAL_TREATMENT,
     DECISION_PATH_TOPICAL_TREATMENT,
     DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT,
-    RULE_CARDIO_COMORBIDITY_MANUAL_REVIEW,
-    RULE_EXCLUDE_ORAL_FOR_HYPERTENSION,
-    RULE_NEEDS_MORE_INFORMATION_UNKNOWN_INPUTS,
-    RULE_PRIOR_SIDE_EFFECTS_MANUAL_REVIEW,
-    RULE_SUPPORT_PATH_COMFORT_PRIORITY,
-    RULE_SUPPORT_PATH_LOW_CONSISTENCY,
-    RULE_SUPPORT_PATH_SCALP_SENSITIVITY,
-    RULE_SUPPORT_PATH_SIMPLER_ROUTINE_PREFERENCE,
+    JOURNEY_STATES,
     SAFETY_FLAG_HIGH_BLOOD_PRESSURE,
     SAFETY_FLAG_SCALP_SENSITIVITY,
 )
+from pen_hair_v1.journey_templates import (
+    DRIVER_BLOOD_PRESSURE,
+    DRIVER_DEFAULT,
+    DRIVER_ORAL_PREFERENCE_DEFERRED,
+    HERO_BODY,
+    PRIMARY_DRIVER_BY_PATH,
+    PRIMARY_DRIVER_RANK,
+    TRACE_BADGE,
+    VARIANT_DEFAULT,
+    VARIANT_HIGH_BLOOD_PRESSURE,
+    VARIANT_SAFETY_CONSTRAINED,
+    VARIANT_SCALP_SENSITIVITY,
+    resolve_stage_text,
+    resolve_treatment_description,
+)
 from pen_hair_v1.schema import (
     FrontendJourneyAdapter,
     FrontendTreatmentDetails,
@@ -37,36 +45,19 @@ from pen_hair_v1.schema import (
 )
 
 
-def _describe_primary_driver(decision_title: str, decision_path: str, rules_triggered: Iterable[str], flags: Iterable[str]) -> str:
-    triggered = set(rules_triggered)
-    flag_set = set(flags)
-    if RULE_CARDIO_COMORBIDITY_MANUAL_REVIEW in triggered:
-        return "cardiovascular risk signal"
-    if RULE_PRIOR_SIDE_EFFECTS_MANUAL_REVIEW in triggered:
-        return "prior treatment side-effect signal"
-    if RULE_NEEDS_MORE_INFORMATION_UNKNOWN_INPUTS in triggered:
-        return "missing critical preference/consistency inputs"
-    if RULE_SUPPORT_PATH_SCALP_SENSITIVITY in triggered:
-        return "scalp-sensitivity support signal"
-    if RULE_SUPPORT_PATH_LOW_CONSISTENCY in triggered:
-        return "routine-consistency support signal"
-    if RULE_SUPPORT_PATH_SIMPLER_ROUTINE_PREFERENCE in triggered:
-        return "simpler-routine support signal"
-    if RULE_SUPPORT_PATH_COMFORT_PRIORITY in triggered:
-        return "comfort/convenience support signal"
-    if RULE_EXCLUDE_ORAL_FOR_HYPERTENSION in triggered or "HIGH_BLOOD_PRESSURE" in flag_set:
-        return "blood-pressure oral-exclusion safety signal"
+def _describe_primary_driver(decision_title: str, decision_path: str, rules_triggered: Iterable[str], flags: List[str]) -> str:
+    best: Optional[Tuple[int, str]] = None
+    for rule_id in rules_triggered:
+        ranked = PRIMARY_DRIVER_RANK.get(rule_id)
+        if ranked is not None and (best is None or ranked[0] < best[0]):
+            best = ranked
+    if best is not None:
+        return best[1]
+    if SAFETY_FLAG_HIGH_BLOOD_PRESSURE in flags:
+        return DRIVER_BLOOD_PRESSURE
     if "oral preference deferred" in decision_title.lower():
-        return "oral-preference deferral signal"
-    if decision_path == DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT:
-        return "support-path criteria"
-    if decision_path == DECISION_PATH_MANUAL_REVIEW:
-        return "manual-review guardrail"
-    if decision_path == DECISION_PATH_NEEDS_MORE_INFORMATION:
-        return "missing-information guardrail"
-    if decision_path == DECISION_PATH_ORAL_TREATMENT:
-        return "oral treatment preference signal"
-    return "deterministic first-line posture"
+        return DRIVER_ORAL_PREFERENCE_DEFERRED
+    return PRIMARY_DRIVER_BY_PATH.get(decision_path, DRIVER_DEFAULT)
 
 
 def _stage_specific_text(
@@ -74,99 +65,15 @@ def _stage_specific_text(
     decision_title: str,
     decision_path: str,
     primary_driver: str,
-) -> tuple[str, str]:
-    recommendation_body = f"{decision_title}. Continue topical protocol and monitor tolerance/progress at this milestone."
-    narrative_body = (
-        f"{stage_key} state: deterministic plan anchored to '{decision_title}', guided by {primary_driver}."
+) -> Tuple[str, str]:
+    variant = VARIANT_SAFETY_CONSTRAINED if primary_driver == DRIVER_BLOOD_PRESSURE else VARIANT_DEFAULT
+    return resolve_stage_text(
+        decision_path,
+        stage_key,
+        variant,
+        {"decision_title": decision_title, "primary_driver": primary_driver, "stage_key": stage_key},
     )
 
-    if decision_path == DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT:
-        if stage_key == "month_0":
-            recommendation_body = (
-                f"Initiate topical plan with explicit support onboarding; primary support driver is {primary_driver}."
-            )
-            narrative_body = "Your topical treatment is now active with a structured support layer designed to improve comfort and adherence from the start. Your baseline has been captured."
-        elif stage_key == "week_6":
-            recommendation_body = (
-                "Run early tolerance/adherence checkpoint and reinforce support prompts for the active support driver."
-            )
-            narrative_body = "Six weeks in. This checkpoint focuses on your comfort with the routine and early tolerance signals under the support framework."
-        elif stage_key == "month_3":
-            recommendation_body = (
-                "Assess continuation quality; keep support interventions that are improving adherence/comfort."
-            )
-            narrative_body = "Three months in. Your support-guided topical protocol is being reviewed for comfort, adherence, and initial response quality."
-        else:
-            recommendation_body = (
-                "Consolidate long-horizon support plan and define next follow-up cadence for sustained adherence."
-            )
-            narrative_body = "Six months completed. Your support-assisted topical plan has reached its first long-term milestone. Continue your routine as directed."
-    elif decision_path == DECISION_PATH_MANUAL_REVIEW:
-        if stage_key == "month_0":
-            recommendation_body = (
-                f"Pause autonomous plan activation and queue clinician review for {primary_driver} before treatment commitment."
-            )
-            narrative_body = "Your case requires clinician review before treatment can be selected. No active treatment is running until your review is complete."
-        elif stage_key == "week_6":
-            recommendation_body = "Confirm review completion status and document clinician-approved safe next-step."
-            narrative_body = "Clinician review is still pending. No treatment milestone is available until your case is cleared for activation."
-        elif stage_key == "month_3":
-            recommendation_body = "Re-check that post-review plan remains aligned with safety constraints and tolerability."
-            narrative_body = "Your case is still under review. Treatment continuation at the 3-month mark depends on resolution of your clinical assessment."
-        else:
-            recommendation_body = "Lock long-horizon follow-up approach based on reviewed plan and risk posture."
-            narrative_body = "Manual review is outstanding. No long-term treatment direction can be confirmed without a completed clinical evaluation."
-    elif decision_path == DECISION_PATH_NEEDS_MORE_INFORMATION:
-        if stage_key == "month_0":
-            recommendation_body = (
-                "Collect missing preference/consistency details now; defer treatment activation until clarified."
-            )
-            narrative_body = "Your profile needs additional information before your case can be routed to a treatment. Please complete your intake to activate your plan."
-        elif stage_key == "week_6":
-            recommendation_body = "Run follow-up intake checkpoint to close unresolved critical fields."
-            narrative_body = "Without a complete intake profile, no treatment checkpoint is available at this stage."
-        elif stage_key == "month_3":
-            recommendation_body = "Escalate data-completion outreach if key inputs remain unknown."
-            narrative_body = "Your case cannot be assessed at the 3-month stage without a completed intake profile."
-        else:
-            recommendation_body = "Set long-horizon next-step only after critical input completeness is achieved."
-            narrative_body = "A complete intake profile is required before any long-term treatment direction can be established."
-    elif decision_path == DECISION_PATH_ORAL_TREATMENT:
-        if stage_key == "month_0":
-            recommendation_body = "Oral treatment initiated. Take as directed and monitor for tolerance and early response."
-            narrative_body = "Your oral treatment is now active, based on your explicit preference and health profile. Your baseline has been recorded and your first checkpoint is in 6 weeks."
-        elif stage_key == "week_6":
-            recommendation_body = "Continue oral protocol. Run early response checkpoint to confirm tolerability and adherence."
-            narrative_body = "Six weeks in. This checkpoint focuses on early adherence and tolerance signals from your oral treatment before your 3-month reassessment."
-        elif stage_key == "month_3":
-            recommendation_body = "Reassess oral treatment progress and confirm continuation plan with clinician review."
-            narrative_body = "Three months in. Your oral treatment is progressing. Your clinician will review your response at this stage to confirm your ongoing plan."
-        else:
-            recommendation_body = "Consolidate long-term oral treatment maintenance and establish next-review cadence."
-            narrative_body = "Six months completed. Your oral treatment plan has reached its first long-term milestone. Your next annual review will confirm your maintenance direction."
-    else:
-        is_safety_constrained = "blood-pressure" in primary_driver
-        if stage_key == "month_0":
-            recommendation_body = f"Activate topical first-line plan under {primary_driver} with clear baseline capture."
-            if is_safety_constrained:
-                narrative_body = "Your treatment has been selected under a safety-first posture. A topical route has been activated as your safe starting point based on your health profile. Your baseline has been captured."
-            else:
-                narrative_body = "Your topical treatment is now active, selected based on your case profile. Your baseline has been recorded and your first checkpoint is in 6 weeks."
-        elif stage_key == "week_6":
-            recommendation_body = "Run early response/tolerance checkpoint and confirm adherence to first-line routine."
-            narrative_body = "Six weeks in. This checkpoint evaluates early adherence and tolerance signals from your topical routine before your 3-month reassessment."
-        elif stage_key == "month_3":
-            recommendation_body = "Reassess continuation confidence and maintain the deterministic topical course."
-            if is_safety_constrained:
-                narrative_body = "Three months in. Your topical plan is holding under a stable safety posture. Continue the current protocol."
-            else:
-                narrative_body = "Three months in. Your topical treatment response is being evaluated. Continue the current protocol unless your clinician advises a change."
-        else:
-            recommendation_body = "Consolidate long-term maintenance plan and next-review cadence for topical continuity."
-            narrative_body = "Six months completed. Your topical treatment plan has reached its first long-term milestone. Continue your maintenance routine as directed."
-
-    return recommendation_body, narrative_body
-
 
 def _build_view(
     stage_key: str,
@@ -174,26 +81,26 @@ def _build_view(
     decision_title: str,
     decision_path: str,
     rules_triggered: List[str],
-    flags: List[str],
+    primary_driver: str,
 ) -> JourneyView:
-    primary_driver = _describe_primary_driver(
-        decision_title=decision_title,
-        decision_path=decision_path,
-        rules_triggered=rules_triggered,
-        flags=flags,
-    )
     recommendation_body, narrative_body = _stage_specific_text(
         stage_key=stage_key,
         decision_title=decision_title,
         decision_path=decision_path,
         primary_driver=primary_driver,
     )
-    stage_badge = f"{stage_key} trace: {primary_driver}; rules={', '.join(rules_triggered) if rules_triggered else 'none'}"
+    values = {
+        "stage_key": stage_key,
+        "state_label": state_label,
+        "decision_title": decision_title,
+        "primary_driver": primary_driver,
+        "rules": ", ".join(rules_triggered) if rules_triggered else "none",
+    }
 
     return JourneyView(
         hero=JourneySection(
             heading=state_label,
-            body=f"{state_label}: {decision_title} selected under {primary_driver}.",
+            body=HERO_BODY.render(values),
         ),
         progress_strip=["month_0", "week_6", "month_3", "month_6"],
         progress_photos={
@@ -208,7 +115,7 @@ def _build_view(
             heading="Current recommendation",
             body=recommendation_body,
         ),
-        decision_trace_badge=stage_badge,
+        decision_trace_badge=TRACE_BADGE.render(values),
     )
 
 
@@ -295,27 +202,6 @@ _TREATMENT_LABEL_AND_ICON: dict = {
     },
 }
 
-_TREATMENT_STAGE_DESCRIPTIONS: dict = {
-    "topical_minoxidil": {
-        "month_0": "Starting today, applied directly to the scalp to stimulate follicles and establish your baseline response.",
-        "week_6": "Continue your application routine. Consistency at this stage is the primary driver of a reliable early response.",
-        "month_3": "Three months of consistent application. Your scalp response is building — maintain the current protocol.",
-        "month_6": "Six months in. Topical Minoxidil 5% remains your active maintenance treatment going forward.",
-    },
-    "oral_finasteride": {
-        "month_0": "Starting today, taken once daily to reduce DHT levels and slow hair loss at its hormonal source.",
-        "week_6": "Continue your daily oral dose. Early adherence and tolerance monitoring are the key signals at this checkpoint.",
-        "month_3": "Three months on oral Finasteride. Your DHT response is building — confirm continuation with your clinician.",
-        "month_6": "Six months in. Oral Finasteride 1 mg remains your active long-term treatment under ongoing review.",
-    },
-    "oral_minoxidil": {
-        "month_0": "Starting today, low-dose oral Minoxidil taken once daily to promote hair growth with a minimal topical footprint.",
-        "week_6": "Continue your daily dose. Tolerance and early hair growth signals are the key indicators at this checkpoint.",
-        "month_3": "Three months on oral Minoxidil. Reassess adherence and response and confirm continuation with your clinician.",
-        "month_6": "Six months in. Oral Minoxidil remains your active treatment under ongoing clinical review.",
-    },
-}
-
 _TREATMENT_DETAILS: dict = {
     "topical_minoxidil": {
         "route": "Topical",
@@ -387,38 +273,12 @@ _STAGE_UNLOCKED_PHOTOS: dict = {
     "month_6": {"baseline", "week_6", "month_3", "month_6"},
 }
 
-def _build_month0_treatment_description(
-    treatment_key: str,
-    flags: List[str],
-    rules_triggered: List[str],
-) -> str:
-    if treatment_key == "topical_minoxidil":
-        if SAFETY_FLAG_HIGH_BLOOD_PRESSURE in flags:
-            return (
-                "Selected as a topical-first option based on your safety profile. "
-                "Oral treatment is not recommended due to high blood pressure. "
-                "Applied directly to the scalp daily."
-            )
-        if SAFETY_FLAG_SCALP_SENSITIVITY in flags:
-            return (
-                "Selected with scalp-specific support to account for your reported sensitivity. "
-                "Applied directly to the scalp daily with comfort-adjusted support."
-            )
-        return (
-            "Selected as your first-line topical treatment based on your case profile. "
-            "Applied directly to the scalp daily to stimulate follicles and establish your baseline response."
-        )
-    if treatment_key == "oral_finasteride":
-        return (
-            "Selected as a once-daily oral treatment aligned with your explicit treatment preference. "
-            "Reduces DHT levels at their hormonal source to slow hair loss and support regrowth."
-        )
-    if treatment_key == "oral_minoxidil":
-        return (
-            "Selected as a safety-preferred oral option aligned with your tolerance priority. "
-            "Low-dose once-daily dosing to promote hair growth with a minimal topical footprint."
-        )
-    return ""
+def _treatment_description_variant(flags: List[str]) -> str:
+    if SAFETY_FLAG_HIGH_BLOOD_PRESSURE in flags:
+        return VARIANT_HIGH_BLOOD_PRESSURE
+    if SAFETY_FLAG_SCALP_SENSITIVITY in flags:
+        return VARIANT_SCALP_SENSITIVITY
+    return VARIANT_DEFAULT
 
 
 def _build_frontend_view(
@@ -426,17 +286,11 @@ def _build_frontend_view(
     state_label: str,
     decision_title: str,
     decision_path: str,
-    rules_triggered: List[str],
-    flags: List[str],
+    primary_driver: str,
+    description_variant: str,
     trace_evidence: Dict[str, Any] | None = None,
     treatment_key: str = "",
 ) -> FrontendJourneyView:
-    primary_driver = _describe_primary_driver(
-        decision_title=decision_title,
-        decision_path=decision_path,
-        rules_triggered=rules_triggered,
-        flags=flags,
-    )
     _, narrative_body = _stage_specific_text(
         stage_key=stage_key,
         decision_title=decision_title,
@@ -450,13 +304,9 @@ def _build_frontend_view(
     treatment_details: Optional[FrontendTreatmentDetails] = (
         FrontendTreatmentDetails(**_detail_data) if _detail_data else None
     )
-    if stage_key == "month_0" and treatment_key:
-        treatment_description = _build_month0_treatment_description(treatment_key, flags, rules_triggered)
-    else:
-        treatment_description = (
-            _TREATMENT_STAGE_DESCRIPTIONS.get(treatment_key, {}).get(stage_key)
-            if treatment_key else None
-        )
+    treatment_description = (
+        resolve_treatment_description(treatment_key, stage_key, description_variant) if treatment_key else None
+    )
     unlocked_ids = _STAGE_UNLOCKED_PHOTOS[stage_key]
     photo_steps = [
         FrontendPhotoStep(id=step["id"], label=step["label"], unlocked=step["id"] in unlocked_ids)
@@ -511,24 +361,159 @@ def _build_frontend_view(
     )
 
 
-def build_frontend_journey_views(
+JOURNEY_STAGE_LABELS: Dict[str, str] = {
+    "month_0": "Baseline / Activation",
+    "week_6": "Week 6 Check-in",
+    "month_3": "Month 3 Progress",
+    "month_6": "Month 6 Review",
+}
+
+FRONTEND_JOURNEY_STAGE_LABELS: Dict[str, str] = {
+    "month_0": "Baseline",
+    "week_6": "Week 6",
+    "month_3": "Month 3",
+    "month_6": "Month 6",
+}
+
+
+def build_journey_stage(
+    stage_key: str,
+    decision_title: str,
+    decision_path: str,
+    rules_triggered: List[str] | None = None,
+    flags: List[str] | None = None,
+) -> JourneyView:
+    """Render a single canonical journey stage (raises KeyError for unknown stages)."""
+    resolved_rules = rules_triggered or []
+    return _build_view(
+        stage_key,
+        JOURNEY_STAGE_LABELS[stage_key],
+        decision_title,
+        decision_path,
+        resolved_rules,
+        _describe_primary_driver(decision_title, decision_path, resolved_rules, flags or []),
+    )
+
+
+def build_frontend_journey_stage(
+    stage_key: str,
     decision_title: str,
     decision_path: str,
     rules_triggered: List[str] | None = None,
     flags: List[str] | None = None,
     trace_evidence: Dict[str, Any] | None = None,
     priority_factor: str = "",
-) -> FrontendJourneyAdapter:
-    resolved_rules = rules_triggered or []
+) -> FrontendJourneyView:
+    """Render a single frontend journey stage (raises KeyError for unknown stages)."""
     resolved_flags = flags or []
-    resolved_evidence = trace_evidence or {}
-    treatment_key = _determine_treatment_key(decision_path, priority_factor)
-    return FrontendJourneyAdapter(
-        month_0=_build_frontend_view("month_0", "Baseline", decision_title, decision_path, resolved_rules, resolved_flags, resolved_evidence, treatment_key),
-        week_6=_build_frontend_view("week_6", "Week 6", decision_title, decision_path, resolved_rules, resolved_flags, resolved_evidence, treatment_key),
-        month_3=_build_frontend_view("month_3", "Month 3", decision_title, decision_path, resolved_rules, resolved_flags, resolved_evidence, treatment_key),
-        month_6=_build_frontend_view("month_6", "Month 6", decision_title, decision_path, resolved_rules, resolved_flags, resolved_evidence, treatment_key),
+    return _build_frontend_view(
+        stage_key,
+        FRONTEND_JOURNEY_STAGE_LABELS[stage_key],
+        decision_title,
+        decision_path,
+        _describe_primary_driver(decision_title, decision_path, rules_triggered or [], resolved_flags),
+        _treatment_description_variant(resolved_flags),
+        trace_evidence or {},
+        _determine_treatment_key(decision_path, priority_factor),
+    )
+
+
+class LazyFrontendJourney(Mapping[str, FrontendJourneyView]):
+    """Frontend journey whose stages are rendered on first access and then reused."""
+
+    def __init__(
+        self,
+        decision_title: str,
+        decision_path: str,
+        rules_triggered: List[str],
+        flags: List[str],
+        trace_evidence: Dict[str, Any],
+        priority_factor: str,
+    ) -> None:
+        self._decision_title = decision_title
+        self._decision_path = decision_path
+        self._primary_driver = _describe_primary_driver(decision_title, decision_path, rules_triggered, flags)
+        self._description_variant = _treatment_description_variant(flags)
+        self._trace_evidence = trace_evidence
+        self._treatment_key = _determine_treatment_key(decision_path, priority_factor)
+        self._rendered: Dict[str, FrontendJourneyView] = {}
+
+    def __getitem__(self, stage_key: str) -> FrontendJourneyView:
+        view = self._rendered.get(stage_key)
+        if view is None:
+            view = _build_frontend_view(
+                stage_key,
+                FRONTEND_JOURNEY_STAGE_LABELS[stage_key],
+                self._decision_title,
+                self._decision_path,
+                self._primary_driver,
+                self._description_variant,
+                self._trace_evidence,
+                self._treatment_key,
+            )
+            self._rendered[stage_key] = view
+        return view
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(JOURNEY_STATES)
+
+    def __len__(self) -> int:
+        return len(JOURNEY_STATES)
+
+    @property
+    def rendered_stages(self) -> List[str]:
+        return [stage_key for stage_key in JOURNEY_STATES if stage_key in self._rendered]
+
+    def to_adapter(self) -> FrontendJourneyAdapter:
+        return FrontendJourneyAdapter(**{stage_key: self[stage_key] for stage_key in JOURNEY_STATES})
+
+
+@overload
+def build_frontend_journey_views(
+    decision_title: str,
+    decision_path: str,
+    rules_triggered: List[str] | None = ...,
+    flags: List[str] | None = ...,
+    trace_evidence: Dict[str, Any] | None = ...,
+    priority_factor: str = ...,
+    lazy: Literal[False] = ...,
+) -> FrontendJourneyAdapter: ...
+
+
+@overload
+def build_frontend_journey_views(
+    decision_title: str,
+    decision_path: str,
+    rules_triggered: List[str] | None = ...,
+    flags: List[str] | None = ...,
+    trace_evidence: Dict[str, Any] | None = ...,
+    priority_factor: str = ...,
+    *,
+    lazy: Literal[True],
+) -> LazyFrontendJourney: ...
+
+
+def build_frontend_journey_views(
+    decision_title: str,
+    decision_path: str,
+    rules_triggered: List[str] | None = None,
+    flags: List[str] | None = None,
+    trace_evidence: Dict[str, Any] | None = None,
+    priority_factor: str = "",
+    lazy: bool = False,
+) -> FrontendJourneyAdapter | LazyFrontendJourney:
+    """Build all frontend journey stages, or with ``lazy=True`` defer each stage until it is read."""
+    journey = LazyFrontendJourney(
+        decision_title=decision_title,
+        decision_path=decision_path,
+        rules_triggered=rules_triggered or [],
+        flags=flags or [],
+        trace_evidence=trace_evidence or {},
+        priority_factor=priority_factor,
     )
+    if lazy:
+        return journey
+    return journey.to_adapter()
 
 
 def build_journey_views(
@@ -538,38 +523,17 @@ def build_journey_views(
     flags: List[str] | None = None,
 ) -> PenJourneyViews:
     resolved_rules = rules_triggered or []
-    resolved_flags = flags or []
+    primary_driver = _describe_primary_driver(decision_title, decision_path, resolved_rules, flags or [])
     return PenJourneyViews(
-        month_0=_build_view(
-            "month_0",
-            "Baseline / Activation",
-            decision_title,
-            decision_path,
-            resolved_rules,
-            resolved_flags,
-        ),
-        week_6=_build_view(
-            "week_6",
-            "Week 6 Check-in",
-            decision_title,
-            decision_path,
-            resolved_rules,
-            resolved_flags,
-        ),
-        month_3=_build_view(
-            "month_3",
-            "Month 3 Progress",
-            decision_title,
-            decision_path,
-            resolved_rules,
-            resolved_flags,
-        ),
-        month_6=_build_view(
-            "month_6",
-            "Month 6 Review",
-            decision_title,
-            decision_path,
-            resolved_rules,
-            resolved_flags,
-        ),
+        **{
+            stage_key: _build_view(
+                stage_key,
+                JOURNEY_STAGE_LABELS[stage_key],
+                decision_title,
+                decision_path,
+                resolved_rules,
+                primary_driver,
+            )
+            for stage_key in JOURNEY_STATES
+        }
     )
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from string import Formatter
+from typing import Dict, Mapping, Tuple
+
+from pen_hair_v1.constants import (
+    DECISION_PATH_MANUAL_REVIEW,
+    DECISION_PATH_NEEDS_MORE_INFORMATION,
+    DECISION_PATH_ORAL_TREATMENT,
+    DECISION_PATH_TOPICAL_TREATMENT,
+    DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT,
+    JOURNEY_STATES,
+    RULE_CARDIO_COMORBIDITY_MANUAL_REVIEW,
+    RULE_EXCLUDE_ORAL_FOR_HYPERTENSION,
+    RULE_NEEDS_MORE_INFORMATION_UNKNOWN_INPUTS,
+    RULE_PRIOR_SIDE_EFFECTS_MANUAL_REVIEW,
+    RULE_SUPPORT_PATH_COMFORT_PRIORITY,
+    RULE_SUPPORT_PATH_LOW_CONSISTENCY,
+    RULE_SUPPORT_PATH_SCALP_SENSITIVITY,
+    RULE_SUPPORT_PATH_SIMPLER_ROUTINE_PREFERENCE,
+)
+
+# Placeholders a journey template may reference. Anything else is rejected at import.
+TEMPLATE_FIELDS = frozenset({"decision_title", "primary_driver", "stage_key", "state_label", "rules"})
+
+VARIANT_DEFAULT = ""
+VARIANT_SAFETY_CONSTRAINED = "safety_constrained"
+VARIANT_HIGH_BLOOD_PRESSURE = "high_blood_pressure"
+VARIANT_SCALP_SENSITIVITY = "scalp_sensitivity"
+
+TREATMENT_TOPICAL_MINOXIDIL = "topical_minoxidil"
+TREATMENT_ORAL_FINASTERIDE = "oral_finasteride"
+TREATMENT_ORAL_MINOXIDIL = "oral_minoxidil"
+
+DRIVER_BLOOD_PRESSURE = "blood-pressure oral-exclusion safety signal"
+DRIVER_ORAL_PREFERENCE_DEFERRED = "oral-preference deferral signal"
+DRIVER_DEFAULT = "deterministic first-line posture"
+
+# Triggered rules that name the primary driver, highest priority first.
+PRIMARY_DRIVER_BY_RULE: Tuple[Tuple[str, str], ...] = (
+    (RULE_CARDIO_COMORBIDITY_MANUAL_REVIEW, "cardiovascular risk signal"),
+    (RULE_PRIOR_SIDE_EFFECTS_MANUAL_REVIEW, "prior treatment side-effect signal"),
+    (RULE_NEEDS_MORE_INFORMATION_UNKNOWN_INPUTS, "missing critical preference/consistency inputs"),
+    (RULE_SUPPORT_PATH_SCALP_SENSITIVITY, "scalp-sensitivity support signal"),
+    (RULE_SUPPORT_PATH_LOW_CONSISTENCY, "routine-consistency support signal"),
+    (RULE_SUPPORT_PATH_SIMPLER_ROUTINE_PREFERENCE, "simpler-routine support signal"),
+    (RULE_SUPPORT_PATH_COMFORT_PRIORITY, "comfort/convenience support signal"),
+    (RULE_EXCLUDE_ORAL_FOR_HYPERTENSION, DRIVER_BLOOD_PRESSURE),
+)
+
+# Fallback driver when no rule above fired and no safety/title signal applies.
+PRIMARY_DRIVER_BY_PATH: Dict[str, str] = {
+    DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT: "support-path criteria",
+    DECISION_PATH_MANUAL_REVIEW: "manual-review guardrail",
+    DECISION_PATH_NEEDS_MORE_INFORMATION: "missing-information guardrail",
+    DECISION_PATH_ORAL_TREATMENT: "oral treatment preference signal",
+}
+
+# rule_id -> (priority, driver); lower priority wins.
+PRIMARY_DRIVER_RANK: Dict[str, Tuple[int, str]] = {
+    rule_id: (priority, driver) for priority, (rule_id, driver) in enumerate(PRIMARY_DRIVER_BY_RULE)
+}
+
+HERO_BODY_TEMPLATE = "{state_label}: {decision_title} selected under {primary_driver}."
+TRACE_BADGE_TEMPLATE = "{stage_key} trace: {primary_driver}; rules={rules}"
+
+# (decision_path, stage_key, variant) -> (recommendation body, narrative body).
+# Paths without a variant-specific entry use VARIANT_DEFAULT; unknown paths use the topical entries.
+STAGE_TEXT_TEMPLATES: Dict[Tuple[str, str, str], Tuple[str, str]] = {
+    (DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT, "month_0", VARIANT_DEFAULT): (
+        "Initiate topical plan with explicit support onboarding; primary support driver is {primary_driver}.",
+        "Your topical treatment is now active with a structured support layer designed to improve comfort and adherence from the start. Your baseline has been captured.",
+    ),
+    (DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT, "week_6", VARIANT_DEFAULT): (
+        "Run early tolerance/adherence checkpoint and reinforce support prompts for the active support driver.",
+        "Six weeks in. This checkpoint focuses on your comfort with the routine and early tolerance signals under the support framework.",
+    ),
+    (DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT, "month_3", VARIANT_DEFAULT): (
+        "Assess continuation quality; keep support interventions that are improving adherence/comfort.",
+        "Three months in. Your support-guided topical protocol is being reviewed for comfort, adherence, and initial response quality.",
+    ),
+    (DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT, "month_6", VARIANT_DEFAULT): (
+        "Consolidate long-horizon support plan and define next follow-up cadence for sustained adherence.",
+        "Six months completed. Your support-assisted topical plan has reached its first long-term milestone. Continue your routine as directed.",
+    ),
+    (DECISION_PATH_MANUAL_REVIEW, "month_0", VARIANT_DEFAULT): (
+        "Pause autonomous plan activation and queue clinician review for {primary_driver} before treatment commitment.",
+        "Your case requires clinician review before treatment can be selected. No active treatment is running until your review is complete.",
+    ),
+    (DECISION_PATH_MANUAL_REVIEW, "week_6", VARIANT_DEFAULT): (
+        "Confirm review completion status and document clinician-approved safe next-step.",
+        "Clinician review is still pending. No treatment milestone is available until your case is cleared for activation.",
+    ),
+    (DECISION_PATH_MANUAL_REVIEW, "month_3", VARIANT_DEFAULT): (
+        "Re-check that post-review plan remains aligned with safety constraints and tolerability.",
+        "Your case is still under review. Treatment continuation at the 3-month mark depends on resolution of your clinical assessment.",
+    ),
+    (DECISION_PATH_MANUAL_REVIEW, "month_6", VARIANT_DEFAULT): (
+        "Lock long-horizon follow-up approach based on reviewed plan and risk posture.",
+        "Manual review is outstanding. No long-term treatment direction can be confirmed without a completed clinical evaluation.",
+    ),
+    (DECISION_PATH_NEEDS_MORE_INFORMATION, "month_0", VARIANT_DEFAULT): (
+        "Collect missing preference/consistency details now; defer treatment activation until clarified.",
+        "Your profile needs additional information before your case can be routed to a treatment. Please complete your intake to activate your plan.",
+    ),
+    (DECISION_PATH_NEEDS_MORE_INFORMATION, "week_6", VARIANT_DEFAULT): (
+        "Run follow-up intake checkpoint to close unresolved critical fields.",
+        "Without a complete intake profile, no treatment checkpoint is available at this stage.",
+    ),
+    (DECISION_PATH_NEEDS_MORE_INFORMATION, "month_3", VARIANT_DEFAULT): (
+        "Escalate data-completion outreach if key inputs remain unknown.",
+        "Your case cannot be assessed at the 3-month stage without a completed intake profile.",
+    ),
+    (DECISION_PATH_NEEDS_MORE_INFORMATION, "month_6", VARIANT_DEFAULT): (
+        "Set long-horizon next-step only after critical input completeness is achieved.",
+        "A complete intake profile is required before any long-term treatment direction can be established.",
+    ),
+    (DECISION_PATH_ORAL_TREATMENT, "month_0", VARIANT_DEFAULT): (
+        "Oral treatment initiated. Take as directed and monitor for tolerance and early response.",
+        "Your oral treatment is now active, based on your explicit preference and health profile. Your baseline has been recorded and your first checkpoint is in 6 weeks.",
+    ),
+    (DECISION_PATH_ORAL_TREATMENT, "week_6", VARIANT_DEFAULT): (
+        "Continue oral protocol. Run early response checkpoint to confirm tolerability and adherence.",
+        "Six weeks in. This checkpoint focuses on early adherence and tolerance signals from your oral treatment before your 3-month reassessment.",
+    ),
+    (DECISION_PATH_ORAL_TREATMENT, "month_3", VARIANT_DEFAULT): (
+        "Reassess oral treatment progress and confirm continuation plan with clinician review.",
+        "Three months in. Your oral treatment is progressing. Your clinician will review your response at this stage to confirm your ongoing plan.",
+    ),
+    (DECISION_PATH_ORAL_TREATMENT, "month_6", VARIANT_DEFAULT): (
+        "Consolidate long-term oral treatment maintenance and establish next-review cadence.",
+        "Six months completed. Your oral treatment plan has reached its first long-term milestone. Your next annual review will confirm your maintenance direction.",
+    ),
+    (DECISION_PATH_TOPICAL_TREATMENT, "month_0", VARIANT_DEFAULT): (
+        "Activate topical first-line plan under {primary_driver} with clear baseline capture.",
+        "Your topical treatment is now active, selected based on your case profile. Your baseline has been recorded and your first checkpoint is in 6 weeks.",
+    ),
+    (DECISION_PATH_TOPICAL_TREATMENT, "month_0", VARIANT_SAFETY_CONSTRAINED): (
+        "Activate topical first-line plan under {primary_driver} with clear baseline capture.",
+        "Your treatment has been selected under a safety-first posture. A topical route has been activated as your safe starting point based on your health profile. Your baseline has been captured.",
+    ),
+    (DECISION_PATH_TOPICAL_TREATMENT, "week_6", VARIANT_DEFAULT): (
+        "Run early response/tolerance checkpoint and confirm adherence to first-line routine.",
+        "Six weeks in. This checkpoint evaluates early adherence and tolerance signals from your topical routine before your 3-month reassessment.",
+    ),
+    (DECISION_PATH_TOPICAL_TREATMENT, "month_3", VARIANT_DEFAULT): (
+        "Reassess continuation confidence and maintain the deterministic topical course.",
+        "Three months in. Your topical treatment response is being evaluated. Continue the current protocol unless your clinician advises a change.",
+    ),
+    (DECISION_PATH_TOPICAL_TREATMENT, "month_3", VARIANT_SAFETY_CONSTRAINED): (
+        "Reassess continuation confidence and maintain the deterministic topical course.",
+        "Three months in. Your topical plan is holding under a stable safety posture. Continue the current protocol.",
+    ),
+    (DECISION_PATH_TOPICAL_TREATMENT, "month_6", VARIANT_DEFAULT): (
+        "Consolidate long-term maintenance plan and next-review cadence for topical continuity.",
+        "Six months completed. Your topical treatment plan has reached its first long-term milestone. Continue your maintenance routine as directed.",
+    ),
+}
+
+# (treatment_key, stage_key, variant) -> recommendation description.
+# Only month_0 topical descriptions vary with the safety flags.
+TREATMENT_DESCRIPTION_TEMPLATES: Dict[Tuple[str, str, str], str] = {
+    (TREATMENT_TOPICAL_MINOXIDIL, "month_0", VARIANT_DEFAULT): (
+        "Selected as your first-line topical treatment based on your case profile. "
+        "Applied directly to the scalp daily to stimulate follicles and establish your baseline response."
+    ),
+    (TREATMENT_TOPICAL_MINOXIDIL, "month_0", VARIANT_HIGH_BLOOD_PRESSURE): (
+        "Selected as a topical-first option based on your safety profile. "
+        "Oral treatment is not recommended due to high blood pressure. "
+        "Applied directly to the scalp daily."
+    ),
+    (TREATMENT_TOPICAL_MINOXIDIL, "month_0", VARIANT_SCALP_SENSITIVITY): (
+        "Selected with scalp-specific support to account for your reported sensitivity. "
+        "Applied directly to the scalp daily with comfort-adjusted support."
+    ),
+    (TREATMENT_TOPICAL_MINOXIDIL, "week_6", VARIANT_DEFAULT): "Continue your application routine. Consistency at this stage is the primary driver of a reliable early response.",
+    (TREATMENT_TOPICAL_MINOXIDIL, "month_3", VARIANT_DEFAULT): "Three months of consistent application. Your scalp response is building — maintain the current protocol.",
+    (TREATMENT_TOPICAL_MINOXIDIL, "month_6", VARIANT_DEFAULT): "Six months in. Topical Minoxidil 5% remains your active maintenance treatment going forward.",
+    (TREATMENT_ORAL_FINASTERIDE, "month_0", VARIANT_DEFAULT): (
+        "Selected as a once-daily oral treatment aligned with your explicit treatment preference. "
+        "Reduces DHT levels at their hormonal source to slow hair loss and support regrowth."
+    ),
+    (TREATMENT_ORAL_FINASTERIDE, "week_6", VARIANT_DEFAULT): "Continue your daily oral dose. Early adherence and tolerance monitoring are the key signals at this checkpoint.",
+    (TREATMENT_ORAL_FINASTERIDE, "month_3", VARIANT_DEFAULT): "Three months on oral Finasteride. Your DHT response is building — confirm continuation with your clinician.",
+    (TREATMENT_ORAL_FINASTERIDE, "month_6", VARIANT_DEFAULT): "Six months in. Oral Finasteride 1 mg remains your active long-term treatment under ongoing review.",
+    (TREATMENT_ORAL_MINOXIDIL, "month_0", VARIANT_DEFAULT): (
+        "Selected as a safety-preferred oral option aligned with your tolerance priority. "
+        "Low-dose once-daily dosing to promote hair growth with a minimal topical footprint."
+    ),
+    (TREATMENT_ORAL_MINOXIDIL, "week_6", VARIANT_DEFAULT): "Continue your daily dose. Tolerance and early hair growth signals are the key indicators at this checkpoint.",
+    (TREATMENT_ORAL_MINOXIDIL, "month_3", VARIANT_DEFAULT): "Three months on oral Minoxidil. Reassess adherence and response and confirm continuation with your clinician.",
+    (TREATMENT_ORAL_MINOXIDIL, "month_6", VARIANT_DEFAULT): "Six months in. Oral Minoxidil remains your active treatment under ongoing clinical review.",
+}
+
+_STAGE_TEXT_VARIANTS = (VARIANT_DEFAULT, VARIANT_SAFETY_CONSTRAINED)
+_TREATMENT_DESCRIPTION_VARIANTS = (VARIANT_DEFAULT, VARIANT_HIGH_BLOOD_PRESSURE, VARIANT_SCALP_SENSITIVITY)
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template parsed once; literal templates render without calling str.format."""
+
+    source: str
+    fields: Tuple[str, ...]
+
+    def render(self, values: Mapping[str, str]) -> str:
+        if not self.fields:
+            return self.source
+        return self.source.format_map(values)
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    fields = tuple(
+        dict.fromkeys(field_name for _, field_name, _, _ in Formatter().parse(source) if field_name is not None)
+    )
+    unknown = [field_name for field_name in fields if field_name not in TEMPLATE_FIELDS]
+    if unknown:
+        raise ValueError(f"journey template references unknown fields {unknown}: {source!r}")
+    return CompiledTemplate(source=source, fields=fields)
+
+
+def compile_stage_text_index(
+    table: Mapping[Tuple[str, str, str], Tuple[str, str]],
+) -> Dict[Tuple[str, str, str], Tuple[CompiledTemplate, CompiledTemplate]]:
+    """Expand a stage-text table into a dense (path, stage, variant) index.
+
+    Every path/stage gets an entry for every variant, falling back to the default
+    variant, so resolution is a single dict lookup.
+    """
+    index: Dict[Tuple[str, str, str], Tuple[CompiledTemplate, CompiledTemplate]] = {}
+    paths = {path for path, _, _ in table}
+    for path in paths:
+        for stage_key in JOURNEY_STATES:
+            default = table.get((path, stage_key, VARIANT_DEFAULT))
+            if default is None:
+                raise ValueError(f"journey template table is missing {path}/{stage_key}")
+            for variant in _STAGE_TEXT_VARIANTS:
+                recommendation, narrative = table.get((path, stage_key, variant), default)
+                index[(path, stage_key, variant)] = (compile_template(recommendation), compile_template(narrative))
+    return index
+
+
+def compile_treatment_description_index(
+    table: Mapping[Tuple[str, str, str], str],
+) -> Dict[Tuple[str, str, str], CompiledTemplate]:
+    index: Dict[Tuple[str, str, str], CompiledTemplate] = {}
+    treatments = {treatment_key for treatment_key, _, _ in table}
+    for treatment_key in treatments:
+        for stage_key in JOURNEY_STATES:
+            default = table.get((treatment_key, stage_key, VARIANT_DEFAULT))
+            if default is None:
+                raise ValueError(f"treatment description table is missing {treatment_key}/{stage_key}")
+            for variant in _TREATMENT_DESCRIPTION_VARIANTS:
+                index[(treatment_key, stage_key, variant)] = compile_template(
+                    table.get((treatment_key, stage_key, variant), default)
+                )
+    return index
+
+
+STAGE_TEXT_INDEX = compile_stage_text_index(STAGE_TEXT_TEMPLATES)
+TREATMENT_DESCRIPTION_INDEX = compile_treatment_description_index(TREATMENT_DESCRIPTION_TEMPLATES)
+HERO_BODY = compile_template(HERO_BODY_TEMPLATE)
+TRACE_BADGE = compile_template(TRACE_BADGE_TEMPLATE)
+
+
+def resolve_stage_text(
+    decision_path: str,
+    stage_key: str,
+    variant: str,
+    values: Mapping[str, str],
+) -> Tuple[str, str]:
+    """Return (recommendation body, narrative body); unknown paths use the topical templates."""
+    templates = STAGE_TEXT_INDEX.get((decision_path, stage_key, variant))
+    if templates is None:
+        templates = STAGE_TEXT_INDEX[(DECISION_PATH_TOPICAL_TREATMENT, stage_key, variant)]
+    recommendation, narrative = templates
+    return recommendation.render(values), narrative.render(values)
+
+
+def resolve_treatment_description(treatment_key: str, stage_key: str, variant: str) -> str | None:
+    template = TREATMENT_DESCRIPTION_INDEX.get((treatment_key, stage_key, variant))
+    if template is None:
+        return None
+    return template.source
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import secrets
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from pen_hair_v1.constants import ALL_SAFETY_FLAGS, DECISION_TITLES
+from pen_hair_v1.fingerprint import SIGNAL_FIELDS, decision_fingerprint, signal_bits, signals_from_bits
+from pen_hair_v1.schema import DecisionPath
+from pen_hair_v1.trace import copy_trace_evidence, rules_evaluated, trace_evidence_for_fingerprint
+
+JOURNEY_TOKEN_VERSION = 2
+MAX_JOURNEY_TOKEN_LENGTH = 1024
+
+# HMAC key for journey tokens. Without it each process signs with its own random key,
+# so tokens only verify on the process that issued them: set it for multi-worker
+# deployments and to keep tokens valid across restarts.
+JOURNEY_TOKEN_KEY_ENV = "SOFICCA_JOURNEY_TOKEN_KEY"
+_SIGNATURE_BYTES = 16
+_PROCESS_KEY = secrets.token_bytes(32)
+
+_DECISION_PATHS: List[str] = [path.value for path in DecisionPath]
+_RULE_IDS: List[str] = rules_evaluated()
+
+
+class JourneyTokenError(ValueError):
+    """Raised when a journey token cannot be decoded into a known pen decision."""
+
+
+@dataclass(frozen=True)
+class JourneyDecision:
+    """Everything the journey renderers need, decoupled from the full intake payload."""
+
+    decision_path: str
+    decision_title: str
+    rules_triggered: Tuple[str, ...]
+    flags: Tuple[str, ...]
+    high_blood_pressure: bool
+    cardiovascular_conditions: bool
+    prior_treatment_use: bool
+    had_side_effects: bool
+    scalp_sensitivities: bool
+    routine_consistency: str
+    priority_factor: str
+    treatment_preference: str
+
+    def trace_evidence(self) -> Dict[str, Any]:
+        return copy_trace_evidence(trace_evidence_for_fingerprint(decision_fingerprint(self)))
+
+
+def _signing_key() -> bytes:
+    raw = os.environ.get(JOURNEY_TOKEN_KEY_ENV, "").strip()
+    return raw.encode("utf-8") if raw else _PROCESS_KEY
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _signature(body: str) -> str:
+    return _b64(hmac.new(_signing_key(), body.encode("ascii"), hashlib.sha256).digest()[:_SIGNATURE_BYTES])
+
+
+def encode_journey_token(decision: JourneyDecision) -> str:
+    """Encode a decision as a compact, URL-safe, signed token (ids are stored as indices).
+
+    The payload is readable but HMAC-signed, so a client cannot assemble a path, title,
+    rules or flags the engine never decided.
+    """
+    payload = [
+        JOURNEY_TOKEN_VERSION,
+        _DECISION_PATHS.index(decision.decision_path),
+        DECISION_TITLES.index(decision.decision_title),
+        [_RULE_IDS.index(rule_id) for rule_id in decision.rules_triggered],
+        [ALL_SAFETY_FLAGS.index(flag) for flag in decision.flags],
+        signal_bits(decision),
+        decision.routine_consistency,
+        decision.priority_factor,
+        decision.treatment_preference,
+    ]
+    body = _b64(json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+    return f"{body}.{_signature(body)}"
+
+
+def _lookup(table: List[str], index: Any, label: str) -> str:
+    if not isinstance(index, int) or isinstance(index, bool) or not 0 <= index < len(table):
+        raise JourneyTokenError(f"journey token has an unknown {label}")
+    return table[index]
+
+
+def decode_journey_token(token: str) -> JourneyDecision:
+    """Verify and decode a token produced by `encode_journey_token`."""
+    if not token or len(token) > MAX_JOURNEY_TOKEN_LENGTH or not token.isascii():
+        raise JourneyTokenError("journey token is empty, too long or not ASCII")
+
+    body, _, signature = token.partition(".")
+    if not hmac.compare_digest(signature, _signature(body)):
+        raise JourneyTokenError("journey token signature does not verify")
+
+    try:
+        raw = base64.urlsafe_b64decode(body + "=" * (-len(body) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise JourneyTokenError("journey token is not decodable") from exc
+
+    if not isinstance(payload, list) or len(payload) != 9:
+        raise JourneyTokenError("journey token has an invalid layout")
+
+    version, path_index, title_index, rule_indices, flag_indices, bits, *text_signals = payload
+    if version != JOURNEY_TOKEN_VERSION:
+        raise JourneyTokenError("journey token version is not supported")
+    if not isinstance(rule_indices, list) or not isinstance(flag_indices, list):
+        raise JourneyTokenError("journey token has an invalid layout")
+    if not isinstance(bits, int) or isinstance(bits, bool) or not 0 <= bits < 1 << len(SIGNAL_FIELDS):
+        raise JourneyTokenError("journey token has invalid signal bits")
+    if not all(isinstance(value, str) for value in text_signals):
+        raise JourneyTokenError("journey token has invalid text signals")
+
+    routine_consistency, priority_factor, treatment_preference = text_signals
+    return JourneyDecision(
+        decision_path=_lookup(_DECISION_PATHS, path_index, "decision path"),
+        decision_title=_lookup(DECISION_TITLES, title_index, "decision title"),
+        rules_triggered=tuple(_lookup(_RULE_IDS, index, "rule") for index in rule_indices),
+        flags=tuple(_lookup(ALL_SAFETY_FLAGS, index, "flag") for index in flag_indices),
+        routine_consistency=routine_consistency,
+        priority_factor=priority_factor,
+        treatment_preference=treatment_preference,
+        **signals_from_bits(bits),
+    )
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+from pen_hair_v1.rationale import rationale_for_fingerprint
+from pen_hair_v1.trace import trace_evidence_for_fingerprint
+
+_DECISION_CACHES: Dict[str, Callable[..., Any]] = {
+    "decision_rationale": rationale_for_fingerprint,
+    "trace_evidence": trace_evidence_for_fingerprint,
+}
+
+
+def decision_cache_metrics() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss counters and hit rate for the fingerprint-keyed pen caches."""
+    metrics: Dict[str, Dict[str, Any]] = {}
+    for name, cached in _DECISION_CACHES.items():
+        info = cached.cache_info()
+        lookups = info.hits + info.misses
+        metrics[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+            "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+        }
+    return metrics
+
+
+def clear_decision_caches() -> None:
+    for cached in _DECISION_CACHES.values():
+        cached.cache_clear()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from pen_hair_v1.constants import (
     DECISION_PATH_MANUAL_REVIEW,
@@ -9,96 +10,117 @@ from pen_hair_v1.constants import (
     DECISION_PATH_TOPICAL_TREATMENT,
     DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT,
 )
+from pen_hair_v1.fingerprint import DecisionFingerprint, decision_fingerprint, signals_from_bits
 from pen_hair_v1.schema import DecisionRationale, PenDecision, PenNormalizedIntake
 
+RATIONALE_CACHE_SIZE = 1024
 
-def _format_safety_summary(decision: PenDecision) -> str | None:
-    if decision.excluded_options:
-        excluded = ", ".join(option.value for option in decision.excluded_options)
-        if "HIGH_BLOOD_PRESSURE" in decision.flags:
+
+def _format_safety_summary(excluded_options: Tuple[str, ...], flags: Tuple[str, ...]) -> str | None:
+    if excluded_options:
+        excluded = ", ".join(excluded_options)
+        if "HIGH_BLOOD_PRESSURE" in flags:
             return f"{excluded} excluded due to high blood pressure safety posture."
         return f"{excluded} excluded due to deterministic safety posture."
-    if decision.flags:
-        return "Safety flags present: " + ", ".join(decision.flags)
+    if flags:
+        return "Safety flags present: " + ", ".join(flags)
     return None
 
 
 def build_decision_rationale(decision: PenDecision, intake: PenNormalizedIntake) -> DecisionRationale:
-    safety_summary = _format_safety_summary(decision)
+    """Rationale for a decision; the returned model is shared and frozen."""
+    return rationale_for_fingerprint(
+        decision.decision_path.value,
+        tuple(option.value for option in decision.excluded_options),
+        tuple(decision.flags),
+        decision_fingerprint(intake),
+    )
+
+
+@lru_cache(maxsize=RATIONALE_CACHE_SIZE)
+def rationale_for_fingerprint(
+    decision_path: str,
+    excluded_options: Tuple[str, ...],
+    flags: Tuple[str, ...],
+    fingerprint: DecisionFingerprint,
+) -> DecisionRationale:
+    bits, routine_consistency, priority_factor, treatment_preference = fingerprint
+    scalp_sensitivities = signals_from_bits(bits)["scalp_sensitivities"]
+    safety_summary = _format_safety_summary(excluded_options, flags)
 
-    if decision.decision_path.value == DECISION_PATH_NEEDS_MORE_INFORMATION:
+    if decision_path == DECISION_PATH_NEEDS_MORE_INFORMATION:
         return DecisionRationale(
             primary_reason="Not enough information for safe deterministic path selection.",
-            supporting_reasons=[
+            supporting_reasons=(
                 "One or more critical preference/consistency inputs are unknown.",
-            ],
+            ),
             safety_summary=safety_summary,
-            why_not_selected=[
+            why_not_selected=(
                 "Topical and manual routes are deferred until missing critical inputs are clarified.",
-            ],
+            ),
         )
 
-    if decision.decision_path.value == DECISION_PATH_MANUAL_REVIEW:
+    if decision_path == DECISION_PATH_MANUAL_REVIEW:
         return DecisionRationale(
             primary_reason="Automatic path selection is not appropriate for this case.",
-            supporting_reasons=[
+            supporting_reasons=(
                 "Deterministic risk guardrail triggered manual review.",
-            ],
+            ),
             safety_summary=safety_summary,
-            why_not_selected=[
+            why_not_selected=(
                 "Oral treatment not auto-selected due to safety guardrails.",
                 "Topical auto-confirmation deferred pending clinician review.",
-            ],
+            ),
         )
 
-    if decision.decision_path.value == DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT:
+    if decision_path == DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT:
         support_reasons: List[str] = []
-        if intake.scalp_sensitivities:
+        if scalp_sensitivities:
             support_reasons.append("Scalp sensitivity indicates comfort-first onboarding support.")
-        if intake.routine_consistency in {"low", "inconsistent", "variable"}:
+        if routine_consistency in {"low", "inconsistent", "variable"}:
             support_reasons.append("Routine consistency indicates adherence support is needed.")
-        if intake.priority_factor in {"comfort", "tolerance", "minimize_side_effects", "side_effects"}:
+        if priority_factor in {"comfort", "tolerance", "minimize_side_effects", "side_effects"}:
             support_reasons.append("Priority factor emphasizes comfort/tolerability.")
-        if intake.priority_factor in {"convenience", "simple", "simplicity", "easy_routine"}:
+        if priority_factor in {"convenience", "simple", "simplicity", "easy_routine"}:
             support_reasons.append("Priority factor emphasizes convenience/simplicity.")
-        if intake.treatment_preference in {"simple", "simplicity", "simpler_routine", "easy_routine", "minimal_steps"}:
+        if treatment_preference in {"simple", "simplicity", "simpler_routine", "easy_routine", "minimal_steps"}:
             support_reasons.append("Treatment preference asks for a simpler routine with onboarding support.")
 
         return DecisionRationale(
             primary_reason="Topical treatment is appropriate with additional support framing.",
-            supporting_reasons=support_reasons or ["Deterministic support criteria triggered."],
+            supporting_reasons=tuple(support_reasons) or ("Deterministic support criteria triggered.",),
             safety_summary=safety_summary,
-            why_not_selected=[
+            why_not_selected=(
                 "Oral treatment not selected as first path under current safety/profile constraints.",
-            ],
+            ),
         )
 
-    if decision.decision_path.value == DECISION_PATH_ORAL_TREATMENT:
+    if decision_path == DECISION_PATH_ORAL_TREATMENT:
         oral_supporting: List[str] = []
-        if intake.routine_consistency == "high":
+        if routine_consistency == "high":
             oral_supporting.append("High routine consistency supports reliable oral treatment adherence.")
-        if intake.priority_factor == "efficacy":
+        if priority_factor == "efficacy":
             oral_supporting.append("Efficacy-focused priority aligns with oral treatment outcomes.")
         return DecisionRationale(
             primary_reason="Oral treatment selected per explicit preference with no medical contraindications.",
-            supporting_reasons=oral_supporting or ["Oral treatment preference confirmed with no medical blockers."],
+            supporting_reasons=tuple(oral_supporting) or ("Oral treatment preference confirmed with no medical blockers.",),
             safety_summary=safety_summary,
-            why_not_selected=[
+            why_not_selected=(
                 "Topical treatment was not selected; patient preference for oral treatment was respected.",
-            ],
+            ),
         )
 
     supporting: List[str] = []
-    if intake.treatment_preference == "topical":
+    if treatment_preference == "topical":
         supporting.append("Patient preference aligns with a topical pathway.")
-    if intake.routine_consistency == "high":
+    if routine_consistency == "high":
         supporting.append("Routine consistency supports reliable topical adherence.")
 
     return DecisionRationale(
         primary_reason="Topical treatment selected as safest deterministic starting path.",
-        supporting_reasons=supporting,
+        supporting_reasons=tuple(supporting),
         safety_summary=safety_summary,
-        why_not_selected=[
+        why_not_selected=(
             "Oral treatment excluded or not selected under deterministic safety posture.",
-        ],
+        ),
     )
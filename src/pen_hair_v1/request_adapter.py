@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
 
-from pen_hair_v1.schema import PenIntakeRequest
+from pydantic import AliasChoices, AliasGenerator, ConfigDict, TypeAdapter, model_validator
+
+from pen_hair_v1.schema import PenIntakeRequest, coerce_legacy_transport_payload
 
 
 _FRONTEND_TO_CANONICAL_KEYS: Dict[str, str] = {
@@ -26,14 +28,85 @@ _FRONTEND_TO_CANONICAL_KEYS: Dict[str, str] = {
     "baselinePhotosUploaded": "baseline_photos_uploaded",
 }
 
+# canonical field -> accepted payload keys, frontend camelCase first.
+_FRONTEND_INPUT_KEYS: Dict[str, Tuple[str, ...]] = {
+    canonical: (frontend, canonical) for frontend, canonical in _FRONTEND_TO_CANONICAL_KEYS.items()
+}
+
+
+def _drop_duplicate_spellings(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the later of two spellings of one field (camelCase and snake_case both sent).
+
+    Matches the key-by-key translation this adapter used to do, where the last key won;
+    copies `data` only when a duplicate is present.
+    """
+    payload = data
+    for frontend, canonical in _FRONTEND_TO_CANONICAL_KEYS.items():
+        if frontend in data and canonical in data:
+            if payload is data:
+                payload = dict(data)
+                order = {key: index for index, key in enumerate(data)}
+            del payload[frontend if order[frontend] < order[canonical] else canonical]
+    return payload
+
+
+def _frontend_validation_alias(field_name: str) -> Union[str, AliasChoices]:
+    keys = _FRONTEND_INPUT_KEYS.get(field_name)
+    if keys is None:
+        return field_name
+    return AliasChoices(*keys)
+
+
+class PenFrontendIntakeRequest(PenIntakeRequest):
+    """PenIntakeRequest that also accepts frontend camelCase keys.
+
+    Key translation is compiled into pydantic validation aliases, so payloads are
+    validated in place without building a canonical copy first. Serialization still
+    uses the canonical snake_case names.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        alias_generator=AliasGenerator(validation_alias=_frontend_validation_alias),
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def coerce_legacy_transport_fields(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        return coerce_legacy_transport_payload(_drop_duplicate_spellings(data), _FRONTEND_INPUT_KEYS)
+
+
+_FRONTEND_INTAKE_LIST_ADAPTER: TypeAdapter[List[PenFrontendIntakeRequest]] = TypeAdapter(List[PenFrontendIntakeRequest])
+
 
 def map_frontend_intake_to_request(frontend_intake: Mapping[str, Any]) -> PenIntakeRequest:
     """Map frontend IntakeData-like payloads (camelCase or snake_case) to canonical PenIntakeRequest.
 
     This mapper performs key translation only; it does not infer missing clinical signals.
     """
-    canonical_payload: Dict[str, Any] = {}
-    for key, value in frontend_intake.items():
-        canonical_payload[_FRONTEND_TO_CANONICAL_KEYS.get(key, key)] = value
+    if not isinstance(frontend_intake, dict):
+        frontend_intake = dict(frontend_intake)
+    return PenFrontendIntakeRequest.model_validate(frontend_intake)
+
+
+def map_frontend_intakes_to_requests(frontend_intakes: Iterable[Mapping[str, Any]]) -> List[PenIntakeRequest]:
+    """Map a list of frontend intakes in one validation pass.
+
+    Raises pydantic.ValidationError; error locations are prefixed with the item index.
+    """
+    items = [item if isinstance(item, dict) else dict(item) for item in frontend_intakes]
+    return list(_FRONTEND_INTAKE_LIST_ADAPTER.validate_python(items))
 
-    return PenIntakeRequest.model_validate(canonical_payload)
+
+def iter_frontend_intakes_from_ndjson(lines: Iterable[Union[str, bytes]]) -> Iterator[PenIntakeRequest]:
+    """Yield one PenIntakeRequest per non-blank NDJSON line.
+
+    Each line is parsed and validated directly by pydantic, so memory stays flat for
+    arbitrarily long streams. Raises pydantic.ValidationError on the first invalid line.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        yield PenFrontendIntakeRequest.model_validate_json(line)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List
 
 from pen_hair_v1.constants import (
     DECISION_PATH_MANUAL_REVIEW,
@@ -8,6 +8,14 @@ from pen_hair_v1.constants import (
     DECISION_PATH_ORAL_TREATMENT,
     DECISION_PATH_TOPICAL_TREATMENT,
     DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT,
+    DECISION_TITLE_CARDIO_MANUAL_REVIEW,
+    DECISION_TITLE_NEEDS_MORE_INFORMATION,
+    DECISION_TITLE_ORAL_TREATMENT,
+    DECISION_TITLE_SIDE_EFFECTS_MANUAL_REVIEW,
+    DECISION_TITLE_TOPICAL_FIRST_LINE,
+    DECISION_TITLE_TOPICAL_ORAL_DEFERRED,
+    DECISION_TITLE_TOPICAL_WITH_SUPPORT,
+    RULE_CARDIO_COMORBIDITY_MANUAL_REVIEW,
     RULE_DEFAULT_SAFEST_START,
     RULE_NEEDS_MORE_INFORMATION_UNKNOWN_INPUTS,
     RULE_ORAL_TREATMENT_PREFERENCE_SELECTED,
@@ -18,44 +26,140 @@ from pen_hair_v1.constants import (
     RULE_SUPPORT_PATH_SIMPLER_ROUTINE_PREFERENCE,
 )
 from pen_hair_v1.schema import PenNormalizedIntake
+from soficca_core.rule_engine import AnyOf, In, Is, Rule, RuleSet, compile_ruleset
+
+_UNKNOWN_VALUES: FrozenSet[str] = frozenset(
+    {
+        "",
+        "unknown",
+        "unsure",
+        "not_sure",
+        "not sure",
+        "n/a",
+        "na",
+        "prefer_not_to_say",
+        "prefer not to say",
+    }
+)
+_LOW_CONSISTENCY_VALUES: FrozenSet[str] = frozenset({"low", "inconsistent", "variable"})
+_COMFORT_PRIORITY_VALUES: FrozenSet[str] = frozenset(
+    {
+        "comfort",
+        "tolerance",
+        "minimize_side_effects",
+        "side_effects",
+        "convenience",
+        "simple",
+        "simplicity",
+        "easy_routine",
+    }
+)
+_SIMPLER_ROUTINE_PREFERENCE_VALUES: FrozenSet[str] = frozenset(
+    {
+        "simple",
+        "simplicity",
+        "simpler_routine",
+        "easy_routine",
+        "minimal_steps",
+    }
+)
 
-_UNKNOWN_VALUES: Set[str] = {
-    "",
-    "unknown",
-    "unsure",
-    "not_sure",
-    "not sure",
-    "n/a",
-    "na",
-    "prefer_not_to_say",
-    "prefer not to say",
-}
-_LOW_CONSISTENCY_VALUES: Set[str] = {"low", "inconsistent", "variable"}
-_COMFORT_PRIORITY_VALUES: Set[str] = {
-    "comfort",
-    "tolerance",
-    "minimize_side_effects",
-    "side_effects",
-    "convenience",
-    "simple",
-    "simplicity",
-    "easy_routine",
-}
-_SIMPLER_ROUTINE_PREFERENCE_VALUES: Set[str] = {
-    "simple",
-    "simplicity",
-    "simpler_routine",
-    "easy_routine",
-    "minimal_steps",
+_SUPPORT_PATH_OUTPUTS = {
+    "decision_path": DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT,
+    "title": DECISION_TITLE_TOPICAL_WITH_SUPPORT,
 }
 
 
-def _has_critical_unknowns(intake: PenNormalizedIntake) -> bool:
-    return (
-        intake.treatment_preference in _UNKNOWN_VALUES
-        or intake.routine_consistency in _UNKNOWN_VALUES
-        or intake.priority_factor in _UNKNOWN_VALUES
+_PATH_RULESET = compile_ruleset(
+    RuleSet(
+        name="pen_decision_path",
+        rules=(
+            # Already traced by the safety policy (RULE_CARDIO_COMORBIDITY_MANUAL_REVIEW).
+            Rule(
+                rule_id=RULE_CARDIO_COMORBIDITY_MANUAL_REVIEW,
+                priority=10,
+                when=(Is("cardiovascular_conditions", True),),
+                outputs={
+                    "decision_path": DECISION_PATH_MANUAL_REVIEW,
+                    "title": DECISION_TITLE_CARDIO_MANUAL_REVIEW,
+                    "explanation": "Reported cardiovascular conditions require clinician review before final treatment selection.",
+                },
+                terminal=True,
+                traced=False,
+            ),
+            Rule(
+                rule_id=RULE_PRIOR_SIDE_EFFECTS_MANUAL_REVIEW,
+                priority=20,
+                when=(Is("prior_treatment_use", True), Is("had_side_effects", True)),
+                outputs={
+                    "decision_path": DECISION_PATH_MANUAL_REVIEW,
+                    "title": DECISION_TITLE_SIDE_EFFECTS_MANUAL_REVIEW,
+                    "explanation": "Prior treatment-related side effects reported; manual review needed for safer next-step planning.",
+                },
+                terminal=True,
+            ),
+            Rule(
+                rule_id=RULE_NEEDS_MORE_INFORMATION_UNKNOWN_INPUTS,
+                priority=30,
+                when=(
+                    AnyOf(
+                        (
+                            In("treatment_preference", _UNKNOWN_VALUES),
+                            In("routine_consistency", _UNKNOWN_VALUES),
+                            In("priority_factor", _UNKNOWN_VALUES),
+                        )
+                    ),
+                ),
+                outputs={
+                    "decision_path": DECISION_PATH_NEEDS_MORE_INFORMATION,
+                    "title": DECISION_TITLE_NEEDS_MORE_INFORMATION,
+                    "explanation": "Decision-critical preference/consistency inputs are unknown; safe automatic selection is deferred.",
+                },
+                terminal=True,
+            ),
+            Rule(
+                rule_id=RULE_ORAL_TREATMENT_PREFERENCE_SELECTED,
+                priority=40,
+                when=(In("treatment_preference", frozenset({"oral"})), Is("oral_excluded", False)),
+                outputs={
+                    "decision_path": DECISION_PATH_ORAL_TREATMENT,
+                    "title": DECISION_TITLE_ORAL_TREATMENT,
+                    "explanation": "Oral treatment preference selected with no medical contraindications detected.",
+                },
+                terminal=True,
+            ),
+            # Support rules accumulate: every matching rule adds its support reason.
+            Rule(
+                rule_id=RULE_SUPPORT_PATH_SCALP_SENSITIVITY,
+                priority=50,
+                when=(Is("scalp_sensitivities", True),),
+                outputs={**_SUPPORT_PATH_OUTPUTS, "support_reasons": ("scalp sensitivity",)},
+            ),
+            Rule(
+                rule_id=RULE_SUPPORT_PATH_LOW_CONSISTENCY,
+                priority=51,
+                when=(In("routine_consistency", _LOW_CONSISTENCY_VALUES),),
+                outputs={**_SUPPORT_PATH_OUTPUTS, "support_reasons": ("routine consistency support",)},
+            ),
+            Rule(
+                rule_id=RULE_SUPPORT_PATH_COMFORT_PRIORITY,
+                priority=52,
+                when=(In("priority_factor", _COMFORT_PRIORITY_VALUES),),
+                outputs={**_SUPPORT_PATH_OUTPUTS, "support_reasons": ("comfort-first priority",)},
+            ),
+            Rule(
+                rule_id=RULE_SUPPORT_PATH_SIMPLER_ROUTINE_PREFERENCE,
+                priority=53,
+                when=(In("treatment_preference", _SIMPLER_ROUTINE_PREFERENCE_VALUES),),
+                outputs={**_SUPPORT_PATH_OUTPUTS, "support_reasons": ("simpler-routine preference",)},
+            ),
+        ),
+        fallback=Rule(
+            rule_id=RULE_DEFAULT_SAFEST_START,
+            outputs={"decision_path": DECISION_PATH_TOPICAL_TREATMENT},
+        ),
     )
+)
 
 
 def select_decision_path(intake: PenNormalizedIntake, safety: Dict[str, List[str]]) -> Dict[str, object]:
@@ -63,78 +167,45 @@ def select_decision_path(intake: PenNormalizedIntake, safety: Dict[str, List[str
     excluded_options = list(safety.get("excluded_options", []))
     safety_reasons = list(safety.get("safety_reasons", []))
 
-    if intake.cardiovascular_conditions:
-        return {
-            "decision_path": DECISION_PATH_MANUAL_REVIEW,
-            "title": "Manual clinical review required",
-            "explanation": "Reported cardiovascular conditions require clinician review before final treatment selection.",
-            "rules_triggered": rules_triggered,
-            "excluded_options": excluded_options,
-        }
-
-    if intake.prior_treatment_use and intake.had_side_effects:
-        rules_triggered.append(RULE_PRIOR_SIDE_EFFECTS_MANUAL_REVIEW)
-        return {
-            "decision_path": DECISION_PATH_MANUAL_REVIEW,
-            "title": "Manual review for prior side effects",
-            "explanation": "Prior treatment-related side effects reported; manual review needed for safer next-step planning.",
-            "rules_triggered": rules_triggered,
-            "excluded_options": excluded_options,
-        }
-
-    if _has_critical_unknowns(intake):
-        rules_triggered.append(RULE_NEEDS_MORE_INFORMATION_UNKNOWN_INPUTS)
-        return {
-            "decision_path": DECISION_PATH_NEEDS_MORE_INFORMATION,
-            "title": "More information needed",
-            "explanation": "Decision-critical preference/consistency inputs are unknown; safe automatic selection is deferred.",
-            "rules_triggered": rules_triggered,
-            "excluded_options": excluded_options,
+    outcome = _PATH_RULESET.evaluate(
+        {
+            "cardiovascular_conditions": intake.cardiovascular_conditions,
+            "prior_treatment_use": intake.prior_treatment_use,
+            "had_side_effects": intake.had_side_effects,
+            "scalp_sensitivities": intake.scalp_sensitivities,
+            "treatment_preference": intake.treatment_preference,
+            "routine_consistency": intake.routine_consistency,
+            "priority_factor": intake.priority_factor,
+            "oral_excluded": DECISION_PATH_ORAL_TREATMENT in excluded_options,
         }
+    )
+    rules_triggered.extend(outcome.rules_triggered)
+    decision_path = outcome.outputs["decision_path"]
 
-    if intake.treatment_preference == "oral" and DECISION_PATH_ORAL_TREATMENT not in excluded_options:
-        rules_triggered.append(RULE_ORAL_TREATMENT_PREFERENCE_SELECTED)
+    if decision_path == DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT:
         return {
-            "decision_path": DECISION_PATH_ORAL_TREATMENT,
-            "title": "Oral treatment selected",
-            "explanation": "Oral treatment preference selected with no medical contraindications detected.",
+            "decision_path": decision_path,
+            "title": outcome.outputs["title"],
+            "explanation": "Topical treatment remains appropriate, with additional support for "
+            + ", ".join(outcome.outputs["support_reasons"])
+            + ".",
             "rules_triggered": rules_triggered,
             "excluded_options": excluded_options,
         }
 
-    support_reasons: List[str] = []
-    if intake.scalp_sensitivities:
-        rules_triggered.append(RULE_SUPPORT_PATH_SCALP_SENSITIVITY)
-        support_reasons.append("scalp sensitivity")
-
-    if intake.routine_consistency in _LOW_CONSISTENCY_VALUES:
-        rules_triggered.append(RULE_SUPPORT_PATH_LOW_CONSISTENCY)
-        support_reasons.append("routine consistency support")
-
-    if intake.priority_factor in _COMFORT_PRIORITY_VALUES:
-        rules_triggered.append(RULE_SUPPORT_PATH_COMFORT_PRIORITY)
-        support_reasons.append("comfort-first priority")
-
-    if intake.treatment_preference in _SIMPLER_ROUTINE_PREFERENCE_VALUES:
-        rules_triggered.append(RULE_SUPPORT_PATH_SIMPLER_ROUTINE_PREFERENCE)
-        support_reasons.append("simpler-routine preference")
-
-    if support_reasons:
+    if decision_path != DECISION_PATH_TOPICAL_TREATMENT:
         return {
-            "decision_path": DECISION_PATH_TOPICAL_TREATMENT_WITH_SUPPORT,
-            "title": "Topical plan with support",
-            "explanation": "Topical treatment remains appropriate, with additional support for "
-            + ", ".join(support_reasons)
-            + ".",
+            "decision_path": decision_path,
+            "title": outcome.outputs["title"],
+            "explanation": outcome.outputs["explanation"],
             "rules_triggered": rules_triggered,
             "excluded_options": excluded_options,
         }
 
-    rules_triggered.append(RULE_DEFAULT_SAFEST_START)
-    title = "Topical first-line start"
+    title = DECISION_TITLE_TOPICAL_FIRST_LINE
     explanation_parts: List[str] = []
     if intake.treatment_preference == "oral":
-        title = "Topical first-line start (oral preference deferred)"
+        title = DECISION_TITLE_TOPICAL_ORAL_DEFERRED
         explanation_parts.append(
             "Oral preference was captured, but oral treatment is not auto-selected by this deterministic safety-first engine."
         )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -56,30 +56,60 @@ class PenIntakeRequest(BaseModel):
         """Backwards-conscious coercion for legacy array-style request payloads."""
         if not isinstance(data, dict):
             return data
-
-        payload = dict(data)
-
-        cardio_value = payload.get("cardiovascular_conditions")
-        if isinstance(cardio_value, list):
-            payload["cardiovascular_conditions"] = len([item for item in cardio_value if str(item).strip()]) > 0
-
-        which_treatment_value = payload.get("which_treatment")
-        if isinstance(which_treatment_value, list):
-            first_non_empty = next((str(item).strip() for item in which_treatment_value if str(item).strip()), "")
-            payload["which_treatment"] = first_non_empty or None
-        elif isinstance(which_treatment_value, str) and which_treatment_value.strip() == "":
-            payload["which_treatment"] = None
-
-        for nullable_bool_field in (
-            "current_medication",
-            "prior_treatment_use",
-            "had_side_effects",
-            "scalp_sensitivities",
-        ):
-            if payload.get(nullable_bool_field) is None:
-                payload[nullable_bool_field] = False
-
-        return payload
+        return coerce_legacy_transport_payload(data)
+
+
+_NULLABLE_BOOL_FIELDS = (
+    "current_medication",
+    "prior_treatment_use",
+    "had_side_effects",
+    "scalp_sensitivities",
+)
+
+
+def coerce_legacy_transport_payload(
+    data: Dict[str, Any],
+    input_keys: Optional[Mapping[str, Tuple[str, ...]]] = None,
+) -> Dict[str, Any]:
+    """Apply legacy transport coercions, copying `data` only if a field actually changes.
+
+    `input_keys` maps a canonical field to the payload keys it may arrive under
+    (e.g. camelCase aliases); by default only the canonical name is checked.
+    """
+    payload = data
+
+    def _key(field_name: str) -> str:
+        candidates = input_keys.get(field_name, (field_name,)) if input_keys else (field_name,)
+        for candidate in candidates:
+            if candidate in data:
+                return candidate
+        return field_name
+
+    def _set(key: str, value: Any) -> None:
+        nonlocal payload
+        if payload is data:
+            payload = dict(data)
+        payload[key] = value
+
+    cardio_key = _key("cardiovascular_conditions")
+    cardio_value = data.get(cardio_key)
+    if isinstance(cardio_value, list):
+        _set(cardio_key, len([item for item in cardio_value if str(item).strip()]) > 0)
+
+    which_treatment_key = _key("which_treatment")
+    which_treatment_value = data.get(which_treatment_key)
+    if isinstance(which_treatment_value, list):
+        first_non_empty = next((str(item).strip() for item in which_treatment_value if str(item).strip()), "")
+        _set(which_treatment_key, first_non_empty or None)
+    elif isinstance(which_treatment_value, str) and which_treatment_value.strip() == "":
+        _set(which_treatment_key, None)
+
+    for nullable_bool_field in _NULLABLE_BOOL_FIELDS:
+        key = _key(nullable_bool_field)
+        if data.get(key) is None:
+            _set(key, False)
+
+    return payload
 
 
 class PenNormalizedIntake(BaseModel):
@@ -162,12 +192,12 @@ class PenJourneyViews(BaseModel):
 
 
 class DecisionRationale(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     primary_reason: str
-    supporting_reasons: List[str]
+    supporting_reasons: Tuple[str, ...]
     safety_summary: Optional[str]
-    why_not_selected: List[str]
+    why_not_selected: Tuple[str, ...]
 
 
 class FrontendJourneyHero(BaseModel):
@@ -261,6 +291,7 @@ class FrontendEvaluationAdapter(BaseModel):
     decision_title: str
     decision_explanation: str
     trace_evidence: Dict[str, Any]
+    journey_token: Optional[str] = None
 
 
 class FrontendJourneyAdapter(BaseModel):
@@ -288,3 +319,29 @@ class PenEvaluationResponse(BaseModel):
     trace: PenTrace
     journey_views: PenJourneyViews
     frontend_adapter: FrontendAdapter
+
+
+class FrontendLazyAdapter(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    evaluation: FrontendEvaluationAdapter
+
+
+class PenLazyEvaluationResponse(BaseModel):
+    """Evaluation without journey stages; stages are fetched per milestone via the journey token."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    versions: PenVersions
+    decision: PenDecision
+    decision_rationale: DecisionRationale
+    trace: PenTrace
+    frontend_adapter: FrontendLazyAdapter
+
+
+class PenJourneyStageResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    stage: str
+    journey_view: JourneyView
+    frontend_view: FrontendJourneyView
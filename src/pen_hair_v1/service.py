@@ -1,35 +1,66 @@
 from __future__ import annotations
 
+from typing import Any, Dict, Tuple
+
 from pen_hair_v1.constants import (
     DECISION_PATH_NEEDS_MORE_INFORMATION,
     DECISION_STATUS_DECIDED,
     DECISION_STATUS_NEEDS_MORE_INFO,
 )
 from pen_hair_v1.decision_contract import assert_valid_response, build_versions
-from pen_hair_v1.journey import build_frontend_journey_views, build_journey_views
+from pen_hair_v1.journey import (
+    build_frontend_journey_stage,
+    build_frontend_journey_views,
+    build_journey_stage,
+    build_journey_views,
+)
+from pen_hair_v1.journey_token import JourneyDecision, decode_journey_token, encode_journey_token
 from pen_hair_v1.normalization import normalize_intake
 from pen_hair_v1.rationale import build_decision_rationale
 from pen_hair_v1.rules import select_decision_path
 from pen_hair_v1.safety_policy import evaluate_safety
 from pen_hair_v1.schema import (
     DecisionPath,
+    DecisionRationale,
     FrontendAdapter,
     FrontendEvaluationAdapter,
-    FrontendJourneyAdapter,
+    FrontendLazyAdapter,
     PenDecision,
     PenEvaluationResponse,
     PenIntakeRequest,
+    PenJourneyStageResponse,
+    PenLazyEvaluationResponse,
+    PenNormalizedIntake,
     PenTrace,
 )
 from pen_hair_v1.trace import build_trace_evidence, rules_evaluated
 from pen_hair_v1.validation import validate_intake
+from soficca_core.timing import (
+    STAGE_CONTRACT,
+    STAGE_JOURNEY,
+    STAGE_NORMALIZE,
+    STAGE_RATIONALE,
+    STAGE_REQUEST,
+    STAGE_RULES,
+    STAGE_SAFETY,
+    STAGE_TRACE,
+    STAGE_VALIDATE,
+    current_stage_timings,
+)
 
 
-def evaluate_pen_intake(payload: PenIntakeRequest) -> PenEvaluationResponse:
+def _evaluate_decision(
+    payload: PenIntakeRequest,
+) -> Tuple[PenNormalizedIntake, PenDecision, DecisionRationale, PenTrace]:
+    timings = current_stage_timings()
+    timings.mark(STAGE_REQUEST)
     validated = validate_intake(payload)
+    timings.mark(STAGE_VALIDATE)
     normalized = normalize_intake(validated)
+    timings.mark(STAGE_NORMALIZE)
 
     safety = evaluate_safety(normalized)
+    timings.mark(STAGE_SAFETY)
     selected = select_decision_path(normalized, safety)
     decision_status = (
         DECISION_STATUS_NEEDS_MORE_INFO
@@ -45,17 +76,56 @@ def evaluate_pen_intake(payload: PenIntakeRequest) -> PenEvaluationResponse:
         flags=safety["flags"],
         excluded_options=[DecisionPath(option) for option in selected["excluded_options"]],
     )
+    timings.mark(STAGE_RULES)
     decision_rationale = build_decision_rationale(decision, normalized)
+    timings.mark(STAGE_RATIONALE)
 
     trace = PenTrace(
         rules_evaluated=rules_evaluated(),
         rules_triggered=selected["rules_triggered"],
         trace_evidence=build_trace_evidence(normalized),
     )
+    timings.mark(STAGE_TRACE)
+    return normalized, decision, decision_rationale, trace
+
+
+def _journey_token(normalized: PenNormalizedIntake, decision: PenDecision, trace: PenTrace) -> str:
+    return encode_journey_token(
+        JourneyDecision(
+            decision_path=decision.decision_path.value,
+            decision_title=decision.title,
+            rules_triggered=tuple(trace.rules_triggered),
+            flags=tuple(decision.flags),
+            high_blood_pressure=normalized.high_blood_pressure,
+            cardiovascular_conditions=normalized.cardiovascular_conditions,
+            prior_treatment_use=normalized.prior_treatment_use,
+            had_side_effects=normalized.had_side_effects,
+            scalp_sensitivities=normalized.scalp_sensitivities,
+            routine_consistency=normalized.routine_consistency,
+            priority_factor=normalized.priority_factor,
+            treatment_preference=normalized.treatment_preference,
+        )
+    )
+
+
+def _evaluation_adapter(decision: PenDecision, trace: PenTrace, journey_token: str) -> FrontendEvaluationAdapter:
+    return FrontendEvaluationAdapter(
+        decision_path=decision.decision_path,
+        decision_title=decision.title,
+        decision_explanation=decision.explanation,
+        trace_evidence=trace.trace_evidence,
+        journey_token=journey_token,
+    )
+
+
+def evaluate_pen_intake(payload: PenIntakeRequest) -> PenEvaluationResponse:
+    normalized, decision, decision_rationale, trace = _evaluate_decision(payload)
+    timings = current_stage_timings()
+
     journey_views = build_journey_views(
         decision_title=decision.title,
         decision_path=decision.decision_path.value,
-        rules_triggered=selected["rules_triggered"],
+        rules_triggered=trace.rules_triggered,
         flags=decision.flags,
     )
 
@@ -66,20 +136,62 @@ def evaluate_pen_intake(payload: PenIntakeRequest) -> PenEvaluationResponse:
         trace=trace,
         journey_views=journey_views,
         frontend_adapter=FrontendAdapter(
-            evaluation=FrontendEvaluationAdapter(
-                decision_path=decision.decision_path,
-                decision_title=decision.title,
-                decision_explanation=decision.explanation,
-                trace_evidence=trace.trace_evidence,
-            ),
+            evaluation=_evaluation_adapter(decision, trace, _journey_token(normalized, decision, trace)),
             journey=build_frontend_journey_views(
                 decision_title=decision.title,
                 decision_path=decision.decision_path.value,
-                rules_triggered=selected["rules_triggered"],
+                rules_triggered=trace.rules_triggered,
                 flags=decision.flags,
                 trace_evidence=trace.trace_evidence,
                 priority_factor=normalized.priority_factor,
             ),
         ),
     )
-    return assert_valid_response(response)
+    timings.mark(STAGE_JOURNEY)
+    response = assert_valid_response(response)
+    timings.mark(STAGE_CONTRACT)
+    return response
+
+
+def evaluate_pen_intake_lazy(payload: PenIntakeRequest) -> PenLazyEvaluationResponse:
+    """Decision, rationale and trace only; journey stages are rendered later from the journey token."""
+    normalized, decision, decision_rationale, trace = _evaluate_decision(payload)
+    return PenLazyEvaluationResponse(
+        versions=build_versions(),
+        decision=decision,
+        decision_rationale=decision_rationale,
+        trace=trace,
+        frontend_adapter=FrontendLazyAdapter(
+            evaluation=_evaluation_adapter(decision, trace, _journey_token(normalized, decision, trace)),
+        ),
+    )
+
+
+def render_pen_journey_stage(stage_key: str, journey_token: str) -> PenJourneyStageResponse:
+    """Render one journey milestone from a token returned by evaluation.
+
+    Raises JourneyTokenError for malformed tokens and KeyError for unknown stages.
+    """
+    journey_decision = decode_journey_token(journey_token)
+    rules_triggered = list(journey_decision.rules_triggered)
+    flags = list(journey_decision.flags)
+    trace_evidence: Dict[str, Any] = journey_decision.trace_evidence()
+    return PenJourneyStageResponse(
+        stage=stage_key,
+        journey_view=build_journey_stage(
+            stage_key,
+            journey_decision.decision_title,
+            journey_decision.decision_path,
+            rules_triggered,
+            flags,
+        ),
+        frontend_view=build_frontend_journey_stage(
+            stage_key,
+            journey_decision.decision_title,
+            journey_decision.decision_path,
+            rules_triggered,
+            flags,
+            trace_evidence,
+            journey_decision.priority_factor,
+        ),
+    )
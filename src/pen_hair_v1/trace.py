@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 from pen_hair_v1.constants import (
     RULE_CARDIO_COMORBIDITY_MANUAL_REVIEW,
@@ -14,44 +16,89 @@ from pen_hair_v1.constants import (
     RULE_SUPPORT_PATH_SCALP_SENSITIVITY,
     RULE_SUPPORT_PATH_SIMPLER_ROUTINE_PREFERENCE,
 )
+from pen_hair_v1.fingerprint import DecisionFingerprint, decision_fingerprint, pack_signal_bits, signals_from_bits
 from pen_hair_v1.schema import PenNormalizedIntake
 
+TRACE_EVIDENCE_CACHE_SIZE = 1024
+
+
+TraceEvidence = Mapping[str, Mapping[str, str]]
+
+
+def copy_trace_evidence(evidence: TraceEvidence) -> Dict[str, Any]:
+    """A mutable copy of cached trace evidence, safe to hand to callers and models."""
+    return {name: dict(entry) for name, entry in evidence.items()}
+
 
 def build_trace_evidence(intake: PenNormalizedIntake) -> Dict[str, Any]:
-    return {
+    """Trace evidence for an intake (a fresh copy; the cached entry is read-only)."""
+    return copy_trace_evidence(trace_evidence_for_fingerprint(decision_fingerprint(intake)))
+
+
+def build_trace_evidence_from_signals(
+    *,
+    high_blood_pressure: bool,
+    cardiovascular_conditions: bool,
+    prior_treatment_use: bool,
+    had_side_effects: bool,
+    scalp_sensitivities: bool,
+    routine_consistency: str,
+    priority_factor: str,
+    treatment_preference: str,
+) -> Dict[str, Any]:
+    """Trace evidence from the decision-relevant intake signals only."""
+    bits = pack_signal_bits(
+        high_blood_pressure,
+        cardiovascular_conditions,
+        prior_treatment_use,
+        had_side_effects,
+        scalp_sensitivities,
+    )
+    return copy_trace_evidence(
+        trace_evidence_for_fingerprint((bits, routine_consistency, priority_factor, treatment_preference))
+    )
+
+
+@lru_cache(maxsize=TRACE_EVIDENCE_CACHE_SIZE)
+def trace_evidence_for_fingerprint(fingerprint: DecisionFingerprint) -> TraceEvidence:
+    """Cached, read-only trace evidence; use copy_trace_evidence() for a mutable dict."""
+    bits, routine_consistency, priority_factor, treatment_preference = fingerprint
+    signals = signals_from_bits(bits)
+    evidence = {
         "high_blood_pressure": {
-            "value": "true" if intake.high_blood_pressure else "false",
+            "value": "true" if signals["high_blood_pressure"] else "false",
             "reason": "Explicitly provided by intake payload.",
         },
         "cardiovascular_conditions": {
-            "value": "true" if intake.cardiovascular_conditions else "false",
+            "value": "true" if signals["cardiovascular_conditions"] else "false",
             "reason": "Explicit yes/no cardiovascular risk signal from intake payload.",
         },
         "prior_treatment_use": {
-            "value": "true" if intake.prior_treatment_use else "false",
+            "value": "true" if signals["prior_treatment_use"] else "false",
             "reason": "Used for deterministic side-effect safety branching.",
         },
         "had_side_effects": {
-            "value": "true" if intake.had_side_effects else "false",
+            "value": "true" if signals["had_side_effects"] else "false",
             "reason": "Used for deterministic side-effect safety branching.",
         },
         "scalp_sensitivities": {
-            "value": "true" if intake.scalp_sensitivities else "false",
+            "value": "true" if signals["scalp_sensitivities"] else "false",
             "reason": "Used for support-path selection.",
         },
         "routine_consistency": {
-            "value": intake.routine_consistency,
+            "value": routine_consistency,
             "reason": "Used for support-path or missing-info branching.",
         },
         "priority_factor": {
-            "value": intake.priority_factor,
+            "value": priority_factor,
             "reason": "Used for comfort-priority support branching.",
         },
         "treatment_preference": {
-            "value": intake.treatment_preference,
+            "value": treatment_preference,
             "reason": "Used for missing-info guardrail branching and simpler-routine support branching.",
         },
     }
+    return MappingProxyType({name: MappingProxyType(entry) for name, entry in evidence.items()})
 
 
 def rules_evaluated() -> List[str]:
@@ -11,6 +11,16 @@ from soficca_core.rules import (
     ALL_RULE_IDS,
 )
 from soficca_core.safety_policy import evaluate_safety, SAFETY_POLICY_VERSION, ALL_POLICY_RULE_IDS
+from soficca_core.timing import (
+    STAGE_CONTRACT,
+    STAGE_NORMALIZE,
+    STAGE_REQUEST,
+    STAGE_RULES,
+    STAGE_SAFETY,
+    STAGE_TRACE,
+    STAGE_VALIDATE,
+    current_stage_timings,
+)
 from soficca_core.trace import TraceBuilder
 from soficca_core.decision_contract import validate_report
 
@@ -57,10 +67,13 @@ def _build_base_report() -> Dict[str, Any]:
 
 def evaluate(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """Decision-first entrypoint. Deterministic and auditable."""
+    timings = current_stage_timings()
+    timings.mark(STAGE_REQUEST)
     base = _build_base_report()
 
     try:
         errors, cleaned = validate_input(input_data)
+        timings.mark(STAGE_VALIDATE)
         if errors:
             base["ok"] = False
             base["errors"] = errors
@@ -97,12 +110,15 @@ def evaluate(input_data: Dict[str, Any]) -> Dict[str, Any]:
                 contradiction=(key in conflict_fields),
             )
 
+        timings.mark(STAGE_TRACE)
+
         # Policy evaluation (always)
         safety, policy_trace = evaluate_safety(state)
         for pid in ALL_POLICY_RULE_IDS:
             tb.add_policy_evaluated(pid)
         for pid in policy_trace.get("triggered") or []:
             tb.add_policy_triggered(pid)
+        timings.mark(STAGE_SAFETY)
 
         base["safety"] = safety
 
@@ -185,7 +201,9 @@ def evaluate(input_data: Dict[str, Any]) -> Dict[str, Any]:
 
         # Apply deterministic rules
         signals = normalize(state)
+        timings.mark(STAGE_NORMALIZE)
         rules_decision = apply_rules(signals)
+        timings.mark(STAGE_RULES)
 
         triggered = list(rules_decision.get("rules_triggered") or [])
         for rid in triggered:
@@ -216,6 +234,9 @@ def evaluate(input_data: Dict[str, Any]) -> Dict[str, Any]:
         return base
 
 def _finalize(report: Dict[str, Any]) -> Dict[str, Any]:
+    timings = current_stage_timings()
+    timings.mark(STAGE_TRACE)
+
     # Ensure contract completeness: evaluated lists non-empty
     if not report["trace"]["policy_trace"]["evaluated"]:
         report["trace"]["policy_trace"]["evaluated"] = list(ALL_POLICY_RULE_IDS)
@@ -228,6 +249,7 @@ def _finalize(report: Dict[str, Any]) -> Dict[str, Any]:
         report["ok"] = False
         report["errors"] = report.get("errors") or []
         report["errors"].append(make_error("CONTRACT_VIOLATION", "Decision report violates v0.3 contract", meta={"problems": problems}))
+    timings.mark(STAGE_CONTRACT)
 
     # After assembling report
     decision = report.get("decision", {})
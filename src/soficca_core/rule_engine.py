@@ -0,0 +1,257 @@
+"""Declarative rulesets compiled into decision trees.
+
+A ruleset is an ordered list of rules. Each rule has a stable ID, a priority, a
+conjunction of conditions over a facts mapping, and outputs. Evaluation visits rules
+in (priority, declaration) order:
+
+- every matching rule contributes its outputs (tuple values are concatenated,
+  scalar values are first-wins) and, if `traced`, its ID to `rules_triggered`;
+- a matching `terminal` rule stops evaluation;
+- if nothing matched, the ruleset `fallback` rule applies.
+
+`compile_ruleset` turns this into a binary decision tree at load time. Each distinct
+condition is tested at most once per evaluation and leaves hold a precomputed,
+immutable `RuleOutcome`, so evaluation cost follows tree depth rather than rule count.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+MAX_COMPILED_NODES = 20000
+
+
+class RuleCompileError(ValueError):
+    """Raised when a ruleset is malformed or too large to compile."""
+
+
+# ── Conditions ────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class Is:
+    """facts[field] is value (identity, as used for True/False/None signals)."""
+
+    field: str
+    value: Any
+
+    def test(self, facts: Mapping[str, Any]) -> bool:
+        return facts.get(self.field) is self.value
+
+
+@dataclass(frozen=True)
+class In:
+    """facts[field] is one of values."""
+
+    field: str
+    values: FrozenSet[Any]
+
+    def test(self, facts: Mapping[str, Any]) -> bool:
+        return facts.get(self.field) in self.values
+
+
+@dataclass(frozen=True)
+class IntRange:
+    """facts[field] is an int within the inclusive bounds (None = unbounded)."""
+
+    field: str
+    minimum: Optional[int] = None
+    maximum: Optional[int] = None
+
+    def test(self, facts: Mapping[str, Any]) -> bool:
+        value = facts.get(self.field)
+        if not isinstance(value, int):
+            return False
+        if self.minimum is not None and value < self.minimum:
+            return False
+        if self.maximum is not None and value > self.maximum:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class Not:
+    condition: "Condition"
+
+    def test(self, facts: Mapping[str, Any]) -> bool:
+        return not self.condition.test(facts)
+
+
+@dataclass(frozen=True)
+class AnyOf:
+    conditions: Tuple["Condition", ...]
+
+    def test(self, facts: Mapping[str, Any]) -> bool:
+        return any(condition.test(facts) for condition in self.conditions)
+
+
+Condition = Union[Is, In, IntRange, Not, AnyOf]
+
+
+# ── Rules ─────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class Rule:
+    rule_id: str
+    when: Tuple[Condition, ...] = ()
+    outputs: Mapping[str, Any] = field(default_factory=dict)
+    priority: int = 0
+    terminal: bool = False
+    traced: bool = True
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    name: str
+    rules: Tuple[Rule, ...]
+    fallback: Optional[Rule] = None
+
+
+@dataclass(frozen=True)
+class RuleOutcome:
+    rules_triggered: Tuple[str, ...]
+    matched_rule_ids: Tuple[str, ...]
+    outputs: Mapping[str, Any]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.outputs.get(key, default)
+
+
+def _merge_outcome(matched: List[Rule]) -> RuleOutcome:
+    outputs: Dict[str, Any] = {}
+    for rule in matched:
+        for key, value in rule.outputs.items():
+            if isinstance(value, tuple):
+                outputs[key] = outputs.get(key, ()) + value
+            elif key not in outputs:
+                outputs[key] = value
+    return RuleOutcome(
+        rules_triggered=tuple(rule.rule_id for rule in matched if rule.traced),
+        matched_rule_ids=tuple(rule.rule_id for rule in matched),
+        outputs=MappingProxyType(outputs),
+    )
+
+
+# ── Compilation ───────────────────────────────────────────────────────
+
+
+class _Branch:
+    __slots__ = ("test", "if_true", "if_false")
+
+    def __init__(self, test: Callable[[Mapping[str, Any]], bool], if_true: "_Node", if_false: "_Node") -> None:
+        self.test = test
+        self.if_true = if_true
+        self.if_false = if_false
+
+
+_Node = Union[_Branch, RuleOutcome]
+
+
+def _implied(condition: Condition, value: bool, atoms: Tuple[Condition, ...]) -> Dict[Condition, bool]:
+    """Values of other atoms that follow from `condition` evaluating to `value`."""
+    known: Dict[Condition, bool] = {condition: value}
+    for atom in atoms:
+        if isinstance(atom, Not) and atom.condition == condition:
+            known[atom] = not value
+        elif isinstance(condition, Not) and condition.condition == atom:
+            known[atom] = not value
+        elif (
+            value
+            and isinstance(condition, Is)
+            and isinstance(atom, Is)
+            and atom.field == condition.field
+            and atom.value is not condition.value
+        ):
+            known[atom] = False
+    return known
+
+
+class CompiledRuleSet:
+    """A ruleset compiled into a decision tree; `evaluate` returns a shared RuleOutcome."""
+
+    def __init__(self, ruleset: RuleSet) -> None:
+        seen_ids = set()
+        for rule in ruleset.rules:
+            if rule.rule_id in seen_ids:
+                raise RuleCompileError(f"{ruleset.name}: duplicate rule id {rule.rule_id}")
+            seen_ids.add(rule.rule_id)
+
+        self.name = ruleset.name
+        self.rules: Tuple[Rule, ...] = tuple(
+            rule for _, rule in sorted(enumerate(ruleset.rules), key=lambda item: (item[1].priority, item[0]))
+        )
+        self.fallback = ruleset.fallback
+        self._atoms: Tuple[Condition, ...] = tuple(
+            dict.fromkeys(condition for rule in self.rules for condition in rule.when)
+        )
+        self._fallback_outcome = _merge_outcome([self.fallback] if self.fallback else [])
+        self._memo: Dict[Tuple[Any, ...], _Node] = {}
+        self._root = self._build({})
+        self.node_count = len(self._memo)
+        del self._memo
+
+    @property
+    def rule_ids(self) -> List[str]:
+        return [rule.rule_id for rule in self.rules]
+
+    def _build(self, known: Dict[Condition, bool]) -> _Node:
+        state: List[Tuple[int, Tuple[Condition, ...]]] = []
+        next_atom: Optional[Condition] = None
+        for index, rule in enumerate(self.rules):
+            pending: List[Condition] = []
+            for condition in rule.when:
+                value = known.get(condition)
+                if value is False:
+                    break
+                if value is None:
+                    pending.append(condition)
+            else:
+                state.append((index, tuple(pending)))
+                if pending and next_atom is None:
+                    next_atom = pending[0]
+                if not pending and rule.terminal:
+                    break
+
+        key = tuple(state)
+        node = self._memo.get(key)
+        if node is not None:
+            return node
+
+        if next_atom is None:
+            matched = [self.rules[index] for index, _ in state]
+            node = _merge_outcome(matched) if matched else self._fallback_outcome
+        else:
+            if len(self._memo) >= MAX_COMPILED_NODES:
+                raise RuleCompileError(f"{self.name}: decision tree exceeds {MAX_COMPILED_NODES} nodes")
+            node = _Branch(
+                next_atom.test,
+                self._build({**known, **_implied(next_atom, True, self._atoms)}),
+                self._build({**known, **_implied(next_atom, False, self._atoms)}),
+            )
+        self._memo[key] = node
+        return node
+
+    def evaluate(self, facts: Mapping[str, Any]) -> RuleOutcome:
+        node = self._root
+        while node.__class__ is _Branch:
+            node = node.if_true if node.test(facts) else node.if_false
+        return node  # type: ignore[return-value]
+
+    def evaluate_linear(self, facts: Mapping[str, Any]) -> RuleOutcome:
+        """Reference interpretation of the ruleset (rule by rule); used to check the compiler."""
+        matched: List[Rule] = []
+        for rule in self.rules:
+            if all(condition.test(facts) for condition in rule.when):
+                matched.append(rule)
+                if rule.terminal:
+                    break
+        if not matched:
+            return self._fallback_outcome
+        return _merge_outcome(matched)
+
+
+def compile_ruleset(ruleset: RuleSet) -> CompiledRuleSet:
+    return CompiledRuleSet(ruleset)
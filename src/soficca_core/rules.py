@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict
+
+from soficca_core.rule_engine import Is, Not, Rule, RuleSet, compile_ruleset
 
 PATH_MORE_QUESTIONS = "PATH_MORE_QUESTIONS"
 PATH_EVAL_FIRST = "PATH_EVAL_FIRST"
@@ -21,57 +23,107 @@ ALL_RULE_IDS = [
     RULE_PERSISTENT_MEDS_REQUIRES_EVAL_PARALLEL,
 ]
 
-def apply_rules(signals: Dict[str, Any]) -> Dict[str, Any]:
-    """Deterministic ruleset. Expects normalized signals."""
-    decision = {
-        "path": PATH_MORE_QUESTIONS,
-        "flags": [],
-        "reasons": [],
-        "recommendations": [],
-        "rules_evaluated": list(ALL_RULE_IDS),
-        "rules_triggered": [],
-    }
-
-    intermittent = signals.get("intermittent_pattern")
-    user_requests_meds = signals.get("user_requests_meds")
-    morning_reduced = signals.get("morning_erection_reduced") is True
+# Untraced rule IDs: they only add wording to a branch already traced above.
+RULE_INTERMITTENT_MEDS_REQUESTED_NOTE = "RULE_INTERMITTENT_MEDS_REQUESTED_NOTE_V1"
+RULE_PERSISTENT_MORNING_REDUCED_NOTE = "RULE_PERSISTENT_MORNING_REDUCED_NOTE_V1"
+RULE_NO_PATTERN_MORE_QUESTIONS = "RULE_NO_PATTERN_MORE_QUESTIONS_V1"
 
-    # Evaluate intermittent branch
-    if intermittent is True:
-        decision["rules_triggered"].append(RULE_INTERMITTENT_MEDS_OK)
-        decision["path"] = PATH_MEDS_OK
-        decision["reasons"].append("Symptoms appear intermittent.")
-        decision["recommendations"].append("Medication support can be considered (with appropriate authorization).")
+_INTERMITTENT = Is("intermittent_pattern", True)
+_PERSISTENT = Is("intermittent_pattern", False)
+_REQUESTS_MEDS = Is("user_requests_meds", True)
+_MORNING_REDUCED = Is("morning_erection_reduced", True)
 
-        if user_requests_meds is True:
-            decision["reasons"].append("User requested medication support.")
-            decision["recommendations"].append("Provide medication pathway options and screening questions.")
+_MORNING_REDUCED_REASON = "Reduced morning erections can be a physiological signal worth evaluating."
+_MEDS_PATHWAY_RECOMMENDATION = "Provide medication pathway options and screening questions."
 
-        if morning_reduced:
-            decision["rules_triggered"].append(RULE_MORNING_REDUCED_EVAL_PARALLEL)
-            decision["flags"].extend(["physiology_signal", "needs_eval_parallel"])
-            decision["reasons"].append("Reduced morning erections can be a physiological signal worth evaluating.")
-            decision["recommendations"].append("Recommend clinician evaluation in parallel with any medication support.")
+_RULESET = compile_ruleset(
+    RuleSet(
+        name="soficca_core",
+        rules=(
+            # Intermittent branch
+            Rule(
+                rule_id=RULE_INTERMITTENT_MEDS_OK,
+                priority=10,
+                when=(_INTERMITTENT,),
+                outputs={
+                    "path": PATH_MEDS_OK,
+                    "reasons": ("Symptoms appear intermittent.",),
+                    "recommendations": ("Medication support can be considered (with appropriate authorization).",),
+                },
+            ),
+            Rule(
+                rule_id=RULE_INTERMITTENT_MEDS_REQUESTED_NOTE,
+                priority=11,
+                when=(_INTERMITTENT, _REQUESTS_MEDS),
+                outputs={
+                    "reasons": ("User requested medication support.",),
+                    "recommendations": (_MEDS_PATHWAY_RECOMMENDATION,),
+                },
+                traced=False,
+            ),
+            Rule(
+                rule_id=RULE_MORNING_REDUCED_EVAL_PARALLEL,
+                priority=12,
+                when=(_INTERMITTENT, _MORNING_REDUCED),
+                outputs={
+                    "flags": ("physiology_signal", "needs_eval_parallel"),
+                    "reasons": (_MORNING_REDUCED_REASON,),
+                    "recommendations": ("Recommend clinician evaluation in parallel with any medication support.",),
+                },
+            ),
+            # Persistent branch
+            Rule(
+                rule_id=RULE_PERSISTENT_MEDS_REQUIRES_EVAL_PARALLEL,
+                priority=20,
+                when=(_PERSISTENT, _REQUESTS_MEDS),
+                outputs={
+                    "path": PATH_MEDS_OK,
+                    "flags": ("needs_eval_parallel",),
+                    "reasons": (
+                        "User requested medication support.",
+                        "Persistent pattern suggests clinician review should occur in parallel.",
+                    ),
+                    "recommendations": (
+                        _MEDS_PATHWAY_RECOMMENDATION,
+                        "Recommend clinician evaluation in parallel.",
+                    ),
+                },
+            ),
+            Rule(
+                rule_id=RULE_PERSISTENT_EVAL_FIRST,
+                priority=21,
+                when=(_PERSISTENT, Not(_REQUESTS_MEDS)),
+                outputs={
+                    "path": PATH_EVAL_FIRST,
+                    "flags": ("persistent_pattern",),
+                    "reasons": ("Symptoms seem consistent rather than intermittent.",),
+                    "recommendations": ("Recommend clinician evaluation before a medication-first approach.",),
+                },
+            ),
+            Rule(
+                rule_id=RULE_PERSISTENT_MORNING_REDUCED_NOTE,
+                priority=22,
+                when=(_PERSISTENT, _MORNING_REDUCED),
+                outputs={
+                    "flags": ("physiology_signal",),
+                    "reasons": (_MORNING_REDUCED_REASON,),
+                },
+                traced=False,
+            ),
+        ),
+        fallback=Rule(rule_id=RULE_NO_PATTERN_MORE_QUESTIONS, outputs={"path": PATH_MORE_QUESTIONS}, traced=False),
+    )
+)
 
-    # Evaluate persistent branch
-    elif intermittent is False:
-        if user_requests_meds is True:
-            decision["rules_triggered"].append(RULE_PERSISTENT_MEDS_REQUIRES_EVAL_PARALLEL)
-            decision["path"] = PATH_MEDS_OK
-            decision["flags"].append("needs_eval_parallel")
-            decision["reasons"].append("User requested medication support.")
-            decision["reasons"].append("Persistent pattern suggests clinician review should occur in parallel.")
-            decision["recommendations"].append("Provide medication pathway options and screening questions.")
-            decision["recommendations"].append("Recommend clinician evaluation in parallel.")
-        else:
-            decision["rules_triggered"].append(RULE_PERSISTENT_EVAL_FIRST)
-            decision["path"] = PATH_EVAL_FIRST
-            decision["flags"].append("persistent_pattern")
-            decision["reasons"].append("Symptoms seem consistent rather than intermittent.")
-            decision["recommendations"].append("Recommend clinician evaluation before a medication-first approach.")
 
-        if morning_reduced and "physiology_signal" not in decision["flags"]:
-            decision["flags"].append("physiology_signal")
-            decision["reasons"].append("Reduced morning erections can be a physiological signal worth evaluating.")
-
-    return decision
+def apply_rules(signals: Dict[str, Any]) -> Dict[str, Any]:
+    """Deterministic ruleset. Expects normalized signals."""
+    outcome = _RULESET.evaluate(signals)
+    return {
+        "path": outcome.outputs.get("path", PATH_MORE_QUESTIONS),
+        "flags": list(outcome.outputs.get("flags", ())),
+        "reasons": list(outcome.outputs.get("reasons", ())),
+        "recommendations": list(outcome.outputs.get("recommendations", ())),
+        "rules_evaluated": list(ALL_RULE_IDS),
+        "rules_triggered": list(outcome.rules_triggered),
+    }
@@ -0,0 +1,120 @@
+from cardio_triage_v1.pre_extraction import CONFIDENCE_FINDING, CONFIDENCE_LIST_NEGATION, pre_extract
+from cardio_triage_v1.validation import evaluate_readiness
+
+COMPLETE_EN = (
+    "58 yo F, chest tightness x 30 min, radiating to jaw and left arm. Denies dyspnea or syncope. "
+    "BP 145/90, HR 102. Prior MI. Takes aspirin and metoprolol."
+)
+COMPLETE_ES = (
+    "Paciente de 63 años con presión en el pecho desde hace 20 minutos, sin disnea ni síncope. "
+    "PA 130/85, FC 88. Sin irradiación. Sin antecedentes de infarto. Sin medicación."
+)
+
+
+def test_semi_structured_english_narrative_covers_core_fields() -> None:
+    result = pre_extract(COMPLETE_EN)
+
+    assert result.fields == {
+        "age": 58,
+        "systolic_bp": 145,
+        "heart_rate": 102,
+        "chest_pain_present": True,
+        "dyspnea": False,
+        "syncope": False,
+        "prior_mi": True,
+        "pain_duration_minutes": 30,
+        "pain_character": "tightness",
+        "pain_radiation": "multiple",
+        "current_meds_none": False,
+        "current_meds_summary": "aspirin, metoprolol",
+    }
+    assert result.language == "en"
+    assert result.covers_core_fields(0.9)
+    evidence = {hit.field: hit.source_text for hit in result.evidence}
+    assert evidence["syncope"] == "Denies dyspnea or syncope"
+    assert evidence["systolic_bp"] == "BP 145/90"
+
+
+def test_spanish_narrative_and_negations() -> None:
+    result = pre_extract(COMPLETE_ES)
+
+    assert result.language == "es"
+    assert result.fields["dyspnea"] is False
+    assert result.fields["syncope"] is False
+    assert result.fields["pain_radiation"] == "none"
+    assert result.fields["current_meds_none"] is True
+    assert result.covers_core_fields(0.9)
+
+
+def test_covered_fields_are_routable_by_the_engine() -> None:
+    fields = pre_extract(COMPLETE_ES).fields
+    report = evaluate_readiness({"state": fields, "context": {"source": "USER"}})
+    assert report["decision"]["required_fields"] == []
+
+
+def test_partial_narrative_reports_missing_core_fields() -> None:
+    result = pre_extract("64M, BP 122/80, HR 78, chest pressure 15 min, no syncope")
+
+    assert result.fields["age"] == 64
+    assert result.fields["pain_duration_minutes"] == 15
+    assert result.fields["syncope"] is False
+    assert "dyspnea" in result.missing_core_fields
+    assert not result.covers_core_fields(0.9)
+
+
+def test_vitals_are_not_read_as_durations_and_descriptors_need_chest_pain() -> None:
+    result = pre_extract("No chest pain. Mild dyspnea on exertion. BP 118/76 HR 70.")
+
+    assert result.fields == {"systolic_bp": 118, "heart_rate": 70, "chest_pain_present": False, "dyspnea": True}
+
+
+def test_post_negation_and_hours() -> None:
+    result = pre_extract(
+        "72 y/o M, chest pain 2 h, sharp, non-radiating; SOB: no; syncope - negative; CAD; no meds; "
+        "BP 150/95 mmHg; pulse 110 bpm"
+    )
+
+    assert result.fields["pain_duration_minutes"] == 120
+    assert result.fields["dyspnea"] is False
+    assert result.fields["syncope"] is False
+    assert result.fields["known_cad"] is True
+    assert result.covers_core_fields(0.9)
+
+
+def test_contradictory_mentions_are_dropped() -> None:
+    result = pre_extract("Syncope this morning. Later denies syncope. BP 120/80.")
+
+    assert "syncope" not in result.fields
+    assert result.conflicting_fields == ["syncope"]
+    assert not result.covers_core_fields(0.0)
+
+
+def test_severity_is_read_from_the_chest_pain_clause_only() -> None:
+    result = pre_extract("64M, chest pain for 2 hours. Mild shortness of breath. BP 130/80, HR 90.")
+    assert "pain_severity" not in result.fields
+    assert result.fields["dyspnea"] is True
+
+    assert pre_extract("Severe crushing chest pain, 9/10, since 1 hour. Mild nausea.").fields["pain_severity"] == "high"
+    assert pre_extract("Dolor torácico intenso desde hace 1 hora. Disnea leve.").fields["pain_severity"] == "high"
+
+
+def test_negation_stops_at_a_comma_unless_the_list_is_coordinated() -> None:
+    result = pre_extract("64M, BP 122/80, HR 78, chest pain, no syncope, dyspnea")
+    assert result.fields["syncope"] is False
+    assert result.fields["dyspnea"] is True
+
+    result = pre_extract("64M, BP 122/80, HR 78, chest pain, no dyspnea, syncope, prior MI")
+    assert result.fields["dyspnea"] is False
+    assert result.fields["syncope"] is True
+    assert result.fields["prior_mi"] is True
+
+    result = pre_extract("64M, BP 122/80, HR 78, chest pain, no dyspnea, syncope or diaphoresis")
+    confidence = {hit.field: hit.confidence for hit in result.evidence}
+    assert result.fields["syncope"] is False
+    assert confidence["dyspnea"] == CONFIDENCE_FINDING
+    assert confidence["syncope"] == confidence["diaphoresis"] == CONFIDENCE_LIST_NEGATION
+    assert not result.covers_core_fields(0.9)
+
+    result = pre_extract("Paciente de 63 años, dolor torácico, sin disnea, síncope ni sudoración. PA 130/85, FC 88.")
+    assert result.fields["syncope"] is False
+    assert not result.covers_core_fields(0.9)
@@ -7,3 +7,64 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_extraction_cache():
+    """Extraction results are cached in memory; keep each test's mocked provider authoritative."""
+    from api.extraction_cache import clear_extraction_caches
+
+    clear_extraction_caches()
+    yield
+    clear_extraction_caches()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_openai_resilience():
+    """The circuit breaker and hedge latencies are per process; start each test closed and uncalibrated."""
+    from api.circuit_breaker import reset_circuit_breakers
+    from api.openai_client import openai_latencies
+
+    reset_circuit_breakers()
+    openai_latencies().clear()
+    yield
+    reset_circuit_breakers()
+    openai_latencies().clear()
+
+
+@pytest.fixture
+def ai_output() -> Callable[..., Any]:
+    """Builder for model outputs (CardioAIRawOutput) returned by a patched `_call_openai`."""
+    from api.routers.cardio_extract_router import CardioAIRawOutput
+
+    def build(
+        fields: Optional[Dict[str, Any]] = None,
+        *,
+        evidence: Iterable[Any] = (),
+        missing: Iterable[str] = ("systolic_bp",),
+        summary: str = "The narrative reports chest pain.",
+        flags: Iterable[str] = ("requires_human_confirmation",),
+        pii: Iterable[str] = (),
+        confidence: float = 0.8,
+    ) -> CardioAIRawOutput:
+        return CardioAIRawOutput.model_validate({
+            "fields": {"age": 64, "chest_pain_present": True} if fields is None else fields,
+            "structured_clinical_summary": summary,
+            "missing_fields": list(missing),
+            "missing_information": {"required_for_routing": list(missing), "clinically_useful": [], "unconfirmed": []},
+            "completion_questions": [],
+            "possible_conflicts": [],
+            "field_evidence": list(evidence),
+            "extraction_quality_flags": list(flags),
+            "pii_warnings": list(pii),
+            "warnings": [],
+            "confidence": confidence,
+            "language_detected": "en",
+        })
+
+    return build
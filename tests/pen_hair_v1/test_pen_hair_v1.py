@@ -1,4 +1,6 @@
+import base64
 import importlib.util
+import json
 import sys
 from pathlib import Path
 
@@ -6,10 +8,23 @@ import pytest
 from pydantic import ValidationError
 
 from api.main import app
+from pen_hair_v1.constants import JOURNEY_STATES
 from pen_hair_v1.examples import canonical_hypertension_response_example
-from pen_hair_v1.request_adapter import map_frontend_intake_to_request
-from pen_hair_v1.schema import PenIntakeRequest
-from pen_hair_v1.service import evaluate_pen_intake
+from pen_hair_v1.journey import build_frontend_journey_views
+from pen_hair_v1.journey_templates import (
+    STAGE_TEXT_INDEX,
+    TREATMENT_DESCRIPTION_INDEX,
+    compile_stage_text_index,
+    compile_template,
+)
+from pen_hair_v1.journey_token import JOURNEY_TOKEN_KEY_ENV, JourneyTokenError, decode_journey_token
+from pen_hair_v1.request_adapter import (
+    iter_frontend_intakes_from_ndjson,
+    map_frontend_intake_to_request,
+    map_frontend_intakes_to_requests,
+)
+from pen_hair_v1.schema import DecisionPath, PenIntakeRequest, coerce_legacy_transport_payload
+from pen_hair_v1.service import evaluate_pen_intake, render_pen_journey_stage
 from tests.pen_hair_v1.golden_cases import get_pen_golden_cases
 
 
@@ -494,6 +509,73 @@ def test_frontend_intake_mapper_supports_camel_case() -> None:
     assert mapped.high_blood_pressure is True
 
 
+def _camel_case_payload() -> dict:
+    return {
+        "age": 34,
+        "norwoodStage": 3,
+        "lossNoticed": "last 12 months",
+        "lossAreas": ["temples"],
+        "mainGoal": "regrowth",
+        "highBloodPressure": True,
+        "cardiovascularConditions": ["", "arrhythmia"],
+        "currentMedication": None,
+        "priorTreatmentUse": False,
+        "whichTreatment": "  ",
+        "hadSideEffects": False,
+        "scalpSensitivities": False,
+        "treatmentPreference": "balanced",
+        "routineConsistency": "high",
+        "priorityFactor": "safety",
+        "baselinePhotosUploaded": True,
+    }
+
+
+def test_bulk_frontend_intake_mapping_matches_single_mapping() -> None:
+    import json
+
+    camel = _camel_case_payload()
+    original = dict(camel)
+    single = map_frontend_intake_to_request(camel)
+    assert camel == original
+    assert single.cardiovascular_conditions is True
+    assert single.current_medication is False
+    assert single.which_treatment is None
+
+    bulk = map_frontend_intakes_to_requests([camel, _valid_payload()])
+    assert [item.model_dump() for item in bulk] == [
+        single.model_dump(),
+        PenIntakeRequest.model_validate(_valid_payload()).model_dump(),
+    ]
+
+    lines = [json.dumps(camel), "", json.dumps(_valid_payload()).encode("utf-8")]
+    streamed = list(iter_frontend_intakes_from_ndjson(lines))
+    assert [item.model_dump() for item in streamed] == [item.model_dump() for item in bulk]
+
+    with pytest.raises(ValidationError):
+        map_frontend_intakes_to_requests([camel, {**camel, "unexpected": 1}])
+
+
+
+def test_frontend_intake_with_both_spellings_keeps_the_last_key() -> None:
+    import json
+
+    payload = {**_camel_case_payload(), "high_blood_pressure": False}
+    original = dict(payload)
+    assert map_frontend_intake_to_request(payload).high_blood_pressure is False
+    assert payload == original
+    reordered = {"high_blood_pressure": False, **_camel_case_payload()}
+    assert map_frontend_intake_to_request(reordered).high_blood_pressure is True
+    streamed = list(iter_frontend_intakes_from_ndjson([json.dumps(payload)]))
+    assert streamed[0].high_blood_pressure is False
+
+def test_legacy_transport_coercion_only_copies_when_needed() -> None:
+    payload = {**_valid_payload(), "which_treatment": None}
+    assert coerce_legacy_transport_payload(payload) is payload
+    coerced = coerce_legacy_transport_payload({**payload, "which_treatment": ""})
+    assert coerced is not payload
+    assert coerced["which_treatment"] is None
+
+
 def test_pen_evaluate_endpoint_returns_frontend_adapter() -> None:
     pytest.importorskip("httpx")
     from fastapi.testclient import TestClient
@@ -559,3 +641,134 @@ def test_pen_router_endpoints_available_from_main() -> None:
     route_paths = {route.path for route in api_main.app.routes}
     assert "/v1/pen/evaluate" in route_paths
     assert "/v1/pen/contract" in route_paths
+
+
+@pytest.mark.parametrize("case", get_pen_golden_cases(), ids=lambda case: case["name"])
+def test_journey_token_stage_matches_full_evaluation(case: dict) -> None:
+    request = PenIntakeRequest.model_validate(case["payload"])
+    response = evaluate_pen_intake(request)
+    token = response.frontend_adapter.evaluation.journey_token
+    assert token
+
+    for stage in ("month_0", "week_6", "month_3", "month_6"):
+        rendered = render_pen_journey_stage(stage, token)
+        assert rendered.journey_view == getattr(response.journey_views, stage)
+        assert rendered.frontend_view == getattr(response.frontend_adapter.journey, stage)
+
+
+def test_lazy_frontend_journey_renders_stages_on_demand() -> None:
+    request = PenIntakeRequest.model_validate(_valid_payload())
+    response = evaluate_pen_intake(request)
+    lazy = build_frontend_journey_views(
+        decision_title=response.decision.title,
+        decision_path=response.decision.decision_path.value,
+        rules_triggered=response.trace.rules_triggered,
+        flags=response.decision.flags,
+        trace_evidence=response.trace.trace_evidence,
+        priority_factor="safety",
+        lazy=True,
+    )
+
+    assert lazy.rendered_stages == []
+    assert lazy["week_6"] == response.frontend_adapter.journey.week_6
+    assert lazy.rendered_stages == ["week_6"]
+    assert lazy.to_adapter() == response.frontend_adapter.journey
+
+
+def test_pen_lazy_evaluate_and_journey_stage_endpoints() -> None:
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    client = TestClient(app)
+    lazy_response = client.post("/v1/pen/evaluate/lazy", json=_valid_payload())
+    assert lazy_response.status_code == 200
+    lazy_data = lazy_response.json()
+    assert "journey_views" not in lazy_data
+    assert "journey" not in lazy_data["frontend_adapter"]
+    token = lazy_data["frontend_adapter"]["evaluation"]["journey_token"]
+
+    full_data = client.post("/v1/pen/evaluate", json=_valid_payload()).json()
+    assert full_data["frontend_adapter"]["evaluation"]["journey_token"] == token
+
+    stage_response = client.get("/v1/pen/journey/month_3", params={"token": token})
+    assert stage_response.status_code == 200
+    stage_data = stage_response.json()
+    assert stage_data["stage"] == "month_3"
+    assert stage_data["journey_view"] == full_data["journey_views"]["month_3"]
+    assert stage_data["frontend_view"] == full_data["frontend_adapter"]["journey"]["month_3"]
+
+
+def test_pen_journey_endpoint_rejects_unknown_stage_and_bad_token() -> None:
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    client = TestClient(app)
+    token = evaluate_pen_intake(PenIntakeRequest.model_validate(_valid_payload())).frontend_adapter.evaluation.journey_token
+
+    assert client.get("/v1/pen/journey/year_2", params={"token": token}).status_code == 404
+    assert client.get("/v1/pen/journey/month_0", params={"token": "not-a-token"}).status_code == 422
+    with pytest.raises(JourneyTokenError):
+        decode_journey_token(token[:-4])
+
+
+def test_journey_token_rejects_forged_decisions(monkeypatch) -> None:
+    token = evaluate_pen_intake(PenIntakeRequest.model_validate(_valid_payload())).frontend_adapter.evaluation.journey_token
+    body, _, signature = token.partition(".")
+    payload = json.loads(base64.urlsafe_b64decode(body + "=" * (-len(body) % 4)))
+    payload[1] = (payload[1] + 1) % len(DecisionPath)
+    forged = base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii").rstrip("=")
+
+    with pytest.raises(JourneyTokenError, match="signature"):
+        decode_journey_token(f"{forged}.{signature}")
+    with pytest.raises(JourneyTokenError, match="signature"):
+        decode_journey_token(body)
+
+    monkeypatch.setenv(JOURNEY_TOKEN_KEY_ENV, "another-deployment")
+    with pytest.raises(JourneyTokenError, match="signature"):
+        decode_journey_token(token)
+
+
+def test_journey_templates_compile_to_dense_index() -> None:
+    for path in DecisionPath:
+        for stage_key in JOURNEY_STATES:
+            assert (path.value, stage_key, "") in STAGE_TEXT_INDEX
+    assert all(not template.fields for template in TREATMENT_DESCRIPTION_INDEX.values())
+    assert compile_template("{stage_key} trace").render({"stage_key": "week_6"}) == "week_6 trace"
+
+    with pytest.raises(ValueError):
+        compile_template("Hello {patient_name}")
+    with pytest.raises(ValueError):
+        compile_stage_text_index({("topical_treatment", "month_0", ""): ("a", "b")})
+
+
+def test_rationale_and_trace_evidence_are_cached_by_decision_fingerprint() -> None:
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    from pen_hair_v1.metrics import clear_decision_caches, decision_cache_metrics
+
+    clear_decision_caches()
+    first = evaluate_pen_intake(PenIntakeRequest.model_validate(_valid_payload()))
+    # Same decision signals, different non-decision fields.
+    second = evaluate_pen_intake(PenIntakeRequest.model_validate({**_valid_payload(), "age": 61, "main_goal": "maintain"}))
+    assert first.decision_rationale == second.decision_rationale
+    assert first.trace.trace_evidence == second.trace.trace_evidence
+
+    metrics = decision_cache_metrics()
+    assert metrics["decision_rationale"]["misses"] == 1
+    assert metrics["decision_rationale"]["hits"] == 1
+    assert metrics["trace_evidence"]["hit_rate"] > 0
+    with pytest.raises(ValidationError):
+        first.decision_rationale.primary_reason = "changed"
+    assert isinstance(first.decision_rationale.supporting_reasons, tuple)
+
+    # Responses get their own copy; mutating one must not leak into the cache.
+    first.trace.trace_evidence["high_blood_pressure"]["value"] = "tampered"
+    first.trace.trace_evidence.pop("priority_factor")
+    third = evaluate_pen_intake(PenIntakeRequest.model_validate(_valid_payload()))
+    assert third.trace.trace_evidence == second.trace.trace_evidence
+    assert third.trace.trace_evidence["high_blood_pressure"]["value"] != "tampered"
+
+    response = TestClient(app).get("/v1/pen/metrics")
+    assert response.status_code == 200
+    assert set(response.json()["caches"]) == {"decision_rationale", "trace_evidence"}
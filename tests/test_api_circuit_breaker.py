@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from api.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from api.deadlines import DEADLINE_ENV, deadline_after, deadline_scope, remaining_seconds
+from api.hedging import LatencyTracker, hedged
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock) -> CircuitBreaker:
+    return CircuitBreaker("test", window_seconds=10, min_calls=4, error_rate=0.5, open_seconds=5, clock=clock)
+
+
+def _calls(breaker: CircuitBreaker, outcomes: List[bool]) -> None:
+    for ok in outcomes:
+        breaker.release(breaker.acquire(), ok)
+
+
+def test_opens_once_enough_calls_fail_and_rejects_until_open_seconds_pass():
+    clock = _Clock()
+    breaker = _breaker(clock)
+    _calls(breaker, [True, False, True])
+    assert breaker.state == CLOSED  # too few calls to judge
+    _calls(breaker, [False])
+    assert breaker.state == OPEN
+
+    clock.now = 2.0
+    with pytest.raises(CircuitOpenError) as rejected:
+        breaker.acquire()
+    assert rejected.value.retry_after == pytest.approx(3.0)
+    assert breaker.rejected == 1
+
+
+def test_failures_outside_the_window_are_forgotten():
+    clock = _Clock()
+    breaker = _breaker(clock)
+    _calls(breaker, [False, False, False])
+    clock.now = 11.0
+    _calls(breaker, [True, True, True, False])
+    assert breaker.state == CLOSED
+    assert breaker.window_error_rate() == pytest.approx(0.25)
+
+
+def test_half_open_probe_closes_or_reopens_the_circuit():
+    clock = _Clock()
+    breaker = _breaker(clock)
+    _calls(breaker, [False] * 4)
+    clock.now = 5.0
+
+    probe = breaker.acquire()
+    assert probe and breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()  # one probe at a time
+    breaker.release(probe, False)
+    assert breaker.state == OPEN
+
+    clock.now = 10.0
+    breaker.release(breaker.acquire(), True)
+    assert breaker.state == CLOSED
+    assert breaker.transitions == {CLOSED: 1, HALF_OPEN: 2, OPEN: 2}
+
+
+def test_calls_without_a_verdict_are_not_counted():
+    clock = _Clock()
+    breaker = _breaker(clock)
+    _calls(breaker, [False] * 3)
+    for _ in range(5):
+        breaker.release(breaker.acquire(), None)
+    assert breaker.state == CLOSED
+
+
+def test_deadline_header_only_shortens_the_configured_budget(monkeypatch):
+    assert deadline_after(None) is None
+    monkeypatch.setenv(DEADLINE_ENV, "2")
+    with deadline_scope(deadline_after(500)):
+        assert 0.4 < remaining_seconds() <= 0.5
+    with deadline_scope(deadline_after(60_000)):
+        assert 1.9 < remaining_seconds() <= 2.0
+    assert remaining_seconds() is None
+
+
+def test_latency_quantile_needs_enough_samples():
+    latencies = LatencyTracker()
+    for ms in range(1, 21):
+        latencies.observe(ms / 1000)
+    assert latencies.quantile(0.95, min_samples=21) is None
+    assert latencies.quantile(0.95, min_samples=20) == pytest.approx(0.020)
+    assert latencies.quantile(0.5, min_samples=20) == pytest.approx(0.011)
+
+
+def _attempt(delay: float, result: str, fail: bool = False):
+    async def attempt() -> str:
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(result)
+        return result
+
+    return attempt
+
+
+@pytest.mark.parametrize(
+    "primary, secondary, may_hedge, expected, events",
+    [
+        (_attempt(0.0, "primary"), _attempt(0.0, "hedge"), True, "primary", []),
+        (_attempt(0.3, "primary"), _attempt(0.0, "hedge"), True, "hedge", ["launched", "won"]),
+        (_attempt(0.05, "primary"), _attempt(0.3, "hedge"), True, "primary", ["launched", "wasted"]),
+        (_attempt(0.05, "primary"), _attempt(0.0, "hedge"), False, "primary", ["skipped"]),
+        (_attempt(0.02, "primary", fail=True), _attempt(0.05, "hedge"), True, "hedge", ["launched", "won"]),
+    ],
+)
+def test_hedged_returns_the_first_success(primary, secondary, may_hedge, expected, events):
+    seen: List[str] = []
+    result = asyncio.run(hedged(primary, secondary, 0.01, lambda: may_hedge, seen.append))
+    assert result == expected
+    assert seen == events
+
+
+def test_hedged_raises_the_primary_error_when_all_attempts_fail():
+    with pytest.raises(RuntimeError, match="primary"):
+        asyncio.run(
+            hedged(_attempt(0.02, "primary", fail=True), _attempt(0.0, "hedge", fail=True), 0.01, lambda: True)
+        )
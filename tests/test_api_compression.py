@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from api import compression
+from api.compression import negotiate_encoding
+from api.static_assets import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, PrecompressedStaticFiles, build_static_assets
+
+
+def _client(app):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    return TestClient(app)
+
+
+def test_negotiate_encoding_respects_q_values_and_server_preference():
+    assert negotiate_encoding("gzip, deflate, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("gzip, deflate, br", ("gzip",)) == "gzip"
+    assert negotiate_encoding("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("gzip;q=0, *", ("gzip",)) is None
+    assert negotiate_encoding("*;q=0.1", ("br", "gzip")) == "br"
+    assert negotiate_encoding("identity", ("br", "gzip")) is None
+    assert negotiate_encoding(None, ("gzip",)) is None
+
+
+def test_large_json_is_gzipped_and_small_passes_through(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    from api.main import app
+
+    client = _client(app)
+    large = client.get("/v1/cardio/scenarios", headers={"Accept-Encoding": "gzip"})
+    assert large.status_code == 200
+    assert large.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in large.headers["vary"]
+    assert int(large.headers["content-length"]) < len(large.content)
+    assert "scenarios" in large.json()
+
+    small = client.get("/healthz", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert "Accept-Encoding" in small.headers["vary"]
+
+    identity = client.get("/v1/cardio/scenarios", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.json() == large.json()
+
+
+def test_compressed_body_gets_its_own_etag_and_revalidates(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    from api.main import app
+
+    client = _client(app)
+    identity = client.get("/v1/cardio/contract", headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/v1/cardio/contract", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"] == identity.headers["etag"][:-1] + '-gzip"'
+
+    revalidated = client.get(
+        "/v1/cardio/contract", headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == gzipped.headers["etag"]
+    plain = client.get(
+        "/v1/cardio/contract", headers={"Accept-Encoding": "identity", "If-None-Match": identity.headers["etag"]}
+    )
+    assert plain.status_code == 304
+    assert plain.headers["etag"] == identity.headers["etag"]
+
+
+def test_ndjson_stream_is_not_compressed():
+    from api.main import app
+
+    body = "\n".join(json.dumps({"state": {}, "context": {}}) for _ in range(200)) + "\n"
+    response = _client(app).post(
+        "/v1/evaluate/batch/stream",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson", "Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert len(response.text.splitlines()) == 200
+
+
+def test_built_demo_assets_are_hashed_and_served_precompressed(tmp_path):
+    from fastapi import FastAPI
+
+    from api.main import CARDIO_DEMO_DIR
+
+    output = tmp_path / "cardio-demo"
+    manifest = build_static_assets(CARDIO_DEMO_DIR, output)
+    main_js = manifest["js/main.js"]
+    assert main_js != "js/main.js" and (output / (main_js + ".gz")).is_file()
+    index = (output / "index.html").read_text(encoding="utf-8")
+    assert f'src="./{main_js}"' in index and f'href="./{manifest["styles.css"]}"' in index
+    assert f"./{manifest['js/dom.js'].split('/')[-1]}" in (output / main_js).read_text(encoding="utf-8")
+
+    app = FastAPI()
+    app.mount("/demo", PrecompressedStaticFiles(directory=output, html=True))
+    client = _client(app)
+
+    asset = client.get(f"/demo/{main_js}", headers={"Accept-Encoding": "gzip"})
+    assert asset.headers["content-encoding"] == "gzip"
+    assert asset.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert asset.headers["content-type"].startswith(("text/javascript", "application/javascript"))
+    assert asset.content == (output / main_js).read_bytes()
+    assert int(asset.headers["content-length"]) == len(gzip.compress(asset.content, compresslevel=9, mtime=0))
+
+    plain = client.get(f"/demo/{main_js}", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] != asset.headers["etag"]
+
+    page = client.get("/demo/", headers={"Accept-Encoding": "gzip"})
+    assert page.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    revalidated = client.get("/demo/", headers={"Accept-Encoding": "gzip", "If-None-Match": page.headers["etag"]})
+    assert revalidated.status_code == 304
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+from api.main import DECISION_REPORT_V0_3_SCHEMA, app
+from cardio_triage_v1.schema import CardioReport
+from pen_hair_v1.schema import PenEvaluationResponse
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/contract", DECISION_REPORT_V0_3_SCHEMA),
+        ("/v1/cardio/contract", CardioReport.model_json_schema()),
+        ("/v1/pen/contract", PenEvaluationResponse.model_json_schema()),
+    ],
+)
+def test_contract_endpoints_serve_etagged_schema_and_304(path, expected):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    client = TestClient(app)
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.json() == expected
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+    assert "max-age" in response.headers["cache-control"]
+
+    not_modified = client.get(path, headers={"If-None-Match": f'"stale", W/{etag}'})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    assert client.get(path, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_fixture_endpoints_serve_cached_files_and_pick_up_edits(tmp_path):
+    pytest.importorskip("httpx")
+    import json
+    import os
+
+    from fastapi.testclient import TestClient
+
+    from api.json_cache import FileBackedJSON
+    from api.main import EXAMPLES_DIR
+
+    client = TestClient(app)
+    manual = client.get("/v1/cardio/manual-requests")
+    assert manual.status_code == 200
+    assert manual.json() == json.loads((EXAMPLES_DIR / "cardio_v1_manual_requests.json").read_text(encoding="utf-8"))
+    assert client.get("/v1/cardio/manual-requests", headers={"If-None-Match": manual.headers["etag"]}).status_code == 304
+
+    assert client.get("/v1/cardio/scenarios").json()["scenarios"]
+    assert client.get("/v1/examples/missing_info").json()["context"] == {"source": "USER"}
+    assert client.get("/v1/examples/../requirements").status_code == 404
+    assert client.get("/v1/examples/unknown").status_code == 404
+
+    fixture_path = tmp_path / "fixture.json"
+    fixture_path.write_text('{"version": 1}', encoding="utf-8")
+    fixture = FileBackedJSON(fixture_path)
+    first = fixture.get()
+    assert fixture.get() is first
+
+    fixture_path.write_text('{"version": 22}', encoding="utf-8")
+    bumped_mtime_ns = os.stat(fixture_path).st_mtime_ns + 1_000_000
+    os.utime(fixture_path, ns=(bumped_mtime_ns, bumped_mtime_ns))
+    second = fixture.get()
+    assert second.payload == {"version": 22}
+    assert second.etag != first.etag
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import math
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+
+from api.encoding import FastJSONResponse, FastJSONRoute, encode_json
+from pen_hair_v1.examples import canonical_hypertension_request_example
+from pen_hair_v1.request_adapter import map_frontend_intake_to_request
+from pen_hair_v1.service import evaluate_pen_intake
+
+
+class _Item(BaseModel):
+    item_id: str = Field(alias="itemId")
+    created_at: datetime
+    payload: Dict[str, Any]
+
+
+def test_encode_json_matches_default_encoding():
+    item = _Item(itemId="a", created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), payload={"n": 1.5, "t": (1, 2)})
+    expected = jsonable_encoder(item)
+    assert json.loads(encode_json(item)) == expected
+    assert json.loads(encode_json({"item": item, "values": [1, None, "ñ"]})) == {"item": expected, "values": [1, None, "ñ"]}
+    assert json.loads(encode_json({"big": 2**70})) == {"big": 2**70}
+
+    response = evaluate_pen_intake(map_frontend_intake_to_request(canonical_hypertension_request_example()))
+    assert json.loads(encode_json(response)) == jsonable_encoder(response)
+
+
+def test_encode_json_encodes_decimals_as_numbers():
+    payload = {"price": Decimal("1.50"), "count": Decimal("3"), "nested": [Decimal("0.25")]}
+    assert encode_json(payload) == b'{"price":1.5,"count":3,"nested":[0.25]}'
+    assert json.loads(encode_json(payload)) == jsonable_encoder(payload)
+
+
+def test_encode_json_keeps_jsonable_encoder_output_for_plain_values():
+    payload = {"elapsed": timedelta(minutes=1, seconds=30), "raw": b"ok", "when": datetime(2026, 1, 2, 3, 4, 5)}
+    assert json.loads(encode_json(payload)) == jsonable_encoder(payload)
+    assert json.loads(encode_json(payload))["elapsed"] == 90.0
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_encode_json_rejects_non_finite_floats(value):
+    with pytest.raises(ValueError):
+        encode_json({"value": value})
+    with pytest.raises(ValueError):
+        encode_json({"items": [{"value": value}], "big": 2**70})
+    with pytest.raises(ValueError):
+        encode_json(_Item(itemId="a", created_at=datetime(2026, 1, 2, tzinfo=timezone.utc), payload={"n": value}))
+    assert encode_json({"value": None}) == b'{"value":null}'
+
+
+def _client():
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    router = APIRouter(route_class=FastJSONRoute, default_response_class=FastJSONResponse)
+
+    class Created(BaseModel):
+        item_id: str
+
+    @router.post("/created", response_model=Created, status_code=201)
+    def created() -> Created:
+        return Created(item_id="x")
+
+    @router.get("/filtered", response_model=Created)
+    def filtered() -> Dict[str, Any]:
+        return {"item_id": "x", "secret": "dropped by validation"}
+
+    @router.get("/plain")
+    async def plain() -> Dict[str, Any]:
+        return {"when": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_fast_route_keeps_status_codes_and_model_filtering():
+    client = _client()
+    created = client.post("/created")
+    assert created.status_code == 201 and created.json() == {"item_id": "x"}
+    assert client.get("/filtered").json() == {"item_id": "x"}
+    assert client.get("/plain").json() == jsonable_encoder({"when": datetime(2026, 1, 1, tzinfo=timezone.utc)})
+
+
+def test_pen_endpoint_output_unchanged():
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
+    request = canonical_hypertension_request_example()
+    response = TestClient(app).post("/v1/pen/evaluate", json=request)
+    expected = evaluate_pen_intake(map_frontend_intake_to_request(request))
+    assert response.json() == jsonable_encoder(expected)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+from api import engine_pool
+from api.main import app
+from soficca_core.engine import evaluate as evaluate_decision
+
+_ITEMS = [
+    {"state": {"frequency": "sometimes", "desire": "present", "stress": "high", "morning_erection": "normal", "wants_meds": True}, "context": {"source": "USER"}},
+    {"state": {"frequency": "daily", "desire": "low", "safety_flags": ["CHEST_PAIN"]}, "context": {"source": "USER", "recency_days": 0}},
+    {"state": {}, "context": {}},
+]
+
+
+@pytest.fixture
+def engine_pool_env(monkeypatch):
+    monkeypatch.setenv(engine_pool.ENGINE_WORKERS_ENV, "2")
+    monkeypatch.setenv(engine_pool.POOL_MIN_ITEMS_ENV, "4")
+    yield
+    engine_pool.shutdown_engine_pool()
+
+
+def test_small_batches_stay_inline(engine_pool_env):
+    assert engine_pool.run_engine_batch(engine_pool.evaluate_decision_items, _ITEMS) == [
+        evaluate_decision(item) for item in _ITEMS
+    ]
+    assert engine_pool._pool is None
+
+
+def test_large_batch_is_evaluated_in_worker_processes_in_order(engine_pool_env):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    items = _ITEMS * 7
+    with TestClient(app) as client:
+        assert engine_pool._pool is not None
+        response = client.post("/v1/evaluate/batch", json={"items": items})
+    assert response.status_code == 200
+    assert response.json()["results"] == [evaluate_decision(item) for item in items]
+    assert engine_pool._pool is None
+
+
+def test_startup_waits_for_every_worker(engine_pool_env, monkeypatch):
+    monkeypatch.setenv(engine_pool.ENGINE_WORKERS_ENV, "3")
+    engine_pool.start_engine_pool()
+    pool = engine_pool._pool
+    assert pool is not None
+    assert len(pool._processes) == 3
+
+
+def test_pool_is_disabled_by_default(monkeypatch):
+    monkeypatch.delenv(engine_pool.ENGINE_WORKERS_ENV, raising=False)
+    assert engine_pool.get_engine_pool() is None
+    with pytest.raises(RuntimeError):
+        monkeypatch.setenv(engine_pool.ENGINE_WORKERS_ENV, "many")
+        engine_pool.configured_workers()
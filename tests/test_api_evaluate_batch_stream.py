@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from api.main import app
+from api.ndjson import iter_ndjson_line_batches
+
+_ITEM = {
+    "state": {"frequency": "sometimes", "desire": "present", "stress": "high", "morning_erection": "normal", "wants_meds": True},
+    "context": {"source": "USER"},
+}
+
+
+def _collect(chunks, max_line_bytes=64):
+    async def _chunks():
+        for chunk in chunks:
+            yield chunk
+
+    async def _run():
+        return [batch async for batch in iter_ndjson_line_batches(_chunks(), max_line_bytes=max_line_bytes)]
+
+    return asyncio.run(_run())
+
+
+def test_ndjson_line_batches_handle_split_blank_and_oversized_lines():
+    batches = _collect([b'{"a":', b'1}\n\n{"b":2}\n' + b"x" * 40, b"y" * 40 + b'\n{"c":3}'])
+    assert batches == [
+        [(1, b'{"a":1}'), (3, b'{"b":2}')],
+        [(4, None)],
+        [(5, b'{"c":3}')],
+    ]
+
+
+def test_evaluate_batch_stream_emits_one_line_per_item_with_error_envelopes():
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    body = "\n".join([json.dumps(_ITEM), "", "{not json", json.dumps({"state": 5}), json.dumps(_ITEM)]) + "\n"
+    client = TestClient(app)
+    response = client.post("/v1/evaluate/batch/stream", content=body, headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["line"] for line in lines] == [1, 3, 4, 5]
+    assert lines[1]["error"]["code"] == "INVALID_JSON"
+    assert lines[2]["error"]["code"] == "INVALID_ITEM"
+    assert lines[2]["error"]["path"] == "$.state"
+
+    batch = client.post("/v1/evaluate/batch", json={"items": [_ITEM]}).json()["results"][0]
+    assert lines[0]["report"] == batch
+    assert lines[3]["report"] == batch
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routers.cardio_extract_router import (
+    BATCH_CONCURRENCY_ENV,
+    BATCH_ITEM_TIMEOUT_ENV,
+    BATCH_MAX_ITEMS_ENV,
+    CardioAIRawOutput,
+)
+
+client = TestClient(app)
+
+
+def _post_batch(items: List[Dict[str, Any]], **options: Any) -> List[Dict[str, Any]]:
+    response = client.post("/v1/cardio/pilot/extract/batch", json={"items": items, **options})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch_dedupes_identical_narratives_and_streams_as_items_complete(monkeypatch, ai_output):
+    monkeypatch.setenv(BATCH_CONCURRENCY_ENV, "2")
+    delays = {"slow": 0.2, "fast": 0.0, "medium": 0.05}
+    active = {"now": 0, "max": 0}
+    calls: List[str] = []
+
+    async def fake_call(case_text: str, model: str, extraction_id: str) -> CardioAIRawOutput:
+        calls.append(case_text)
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(delays[case_text.split()[0]])
+        active["now"] -= 1
+        return ai_output({"age": 40 + len(calls), "chest_pain_present": True})
+
+    items = [
+        {"id": "bed-1", "case_text": "slow chest pain"},
+        {"id": "bed-2", "case_text": "fast chest pain"},
+        {"id": "bed-3", "case_text": " fast   chest pain\n"},
+        {"id": "bed-4", "case_text": "medium chest pain"},
+    ]
+    with patch("api.routers.cardio_extract_router._call_openai", side_effect=fake_call):
+        lines = _post_batch(items)
+
+    assert sorted(calls) == ["fast chest pain", "medium chest pain", "slow chest pain"]
+    assert active["max"] == 2
+    # Completion order, not submission order; the duplicate follows its original.
+    assert [line.get("index") for line in lines[:-1]] == [1, 2, 3, 0]
+    assert [line["id"] for line in lines[:-1]] == ["bed-2", "bed-3", "bed-4", "bed-1"]
+    assert lines[1]["duplicate_of"] == 1
+    assert lines[1]["extraction"]["fields"] == lines[0]["extraction"]["fields"]
+    assert lines[1]["extraction"]["extraction_id"] != lines[0]["extraction"]["extraction_id"]
+    assert lines[-1] == {"summary": {"items": 4, "unique": 3, "succeeded": 4, "failed": 0}}
+
+
+def test_batch_reports_per_item_errors_and_timeouts_without_aborting(monkeypatch, ai_output):
+    monkeypatch.setenv(BATCH_ITEM_TIMEOUT_ENV, "0.05")
+
+    async def fake_call(case_text: str, model: str, extraction_id: str) -> CardioAIRawOutput:
+        if case_text.startswith("hang"):
+            await asyncio.sleep(5)
+        if case_text.startswith("broken"):
+            raise HTTPException(status_code=502, detail="OpenAI API error: Provider error")
+        return ai_output({"age": 58, "chest_pain_present": True})
+
+    items = [{"case_text": "hang chest pain"}, {"case_text": "broken chest pain"}, {"case_text": "ok chest pain"}]
+    with patch("api.routers.cardio_extract_router._call_openai", side_effect=fake_call):
+        lines = _post_batch(items)
+
+    by_index = {line["index"]: line for line in lines[:-1]}
+    assert by_index[0]["error"]["code"] == "ITEM_TIMEOUT"
+    assert by_index[0]["error"]["path"] == "$.items[0]"
+    assert by_index[1]["error"] == {
+        "code": "EXTRACTION_FAILED",
+        "message": "OpenAI API error: Provider error",
+        "path": "$.items[1]",
+        "meta": {"status_code": 502},
+    }
+    assert by_index[2]["extraction"]["fields"]["age"] == 58
+    assert lines[-1]["summary"] == {"items": 3, "unique": 3, "succeeded": 1, "failed": 2}
+
+
+def test_batch_rejects_oversized_and_empty_batches(monkeypatch):
+    monkeypatch.setenv(BATCH_MAX_ITEMS_ENV, "2")
+    items = [{"case_text": f"narrative {i}"} for i in range(3)]
+    response = client.post("/v1/cardio/pilot/extract/batch", json={"items": items})
+    assert response.status_code == 413
+    assert client.post("/v1/cardio/pilot/extract/batch", json={"items": []}).status_code == 422
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Tuple
+from unittest.mock import patch
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routers.cardio_extract_router import (
+    CardioAIRawOutput,
+    CardioMissingInformation,
+    CardioPilotExtractionFields,
+)
+
+client = TestClient(app)
+
+AI_OUTPUT = CardioAIRawOutput(
+    fields=CardioPilotExtractionFields(age=58, chest_pain_present=True),
+    structured_clinical_summary="The narrative reports chest pain; we recommend admission.",
+    missing_fields=["systolic_bp"],
+    missing_information=CardioMissingInformation(required_for_routing=["systolic_bp"], clinically_useful=[], unconfirmed=[]),
+    completion_questions=["What is the blood pressure?"],
+    possible_conflicts=[],
+    field_evidence=[],
+    extraction_quality_flags=["requires_human_confirmation"],
+    pii_warnings=[],
+    warnings=[],
+    confidence=0.8,
+    language_detected="en",
+)
+
+
+def _events(body: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    response = client.post("/v1/cardio/pilot/extract/stream", json=body)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    events = []
+    for frame in response.text.strip().split("\n\n"):
+        event, data = frame.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def test_stream_reports_stages_and_ends_with_the_extract_response():
+    async def fake_call(case_text: str, model: str, extraction_id: str, on_partial=None) -> CardioAIRawOutput:
+        await on_partial({"age": 58})
+        return AI_OUTPUT
+
+    body = {"case_text": "58-year-old, chest pain since this morning.", "language": "en"}
+    with patch("api.routers.cardio_extract_router._call_openai", side_effect=fake_call):
+        events = _events(body)
+        plain = client.post("/v1/cardio/pilot/extract", json=body)
+
+    assert [name for name, _ in events] == ["accepted", "pre_extraction", "partial", "safety", "result"]
+    assert events[1][1]["fields"]["age"] == 58
+    assert events[1][1]["covers_core_fields"] is False
+    assert events[2][1] == {"fields": {"age": 58}}
+    assert any("'recommend'" in warning for warning in events[3][1]["warnings"])
+    result = events[-1][1]
+    assert result["extraction_id"] == events[0][1]["extraction_id"]
+    # The cached /extract response carries the same body under its own extraction_id.
+    assert plain.headers["X-Soficca-Extraction-Cache"] == "hit"
+    assert {**result, "extraction_id": None} == {**plain.json(), "extraction_id": None}
+
+
+def test_stream_covered_by_pre_extractor_never_calls_the_model():
+    text = (
+        "72 y/o M, chest pain 2 h, sharp, non-radiating; SOB: no; syncope - negative; CAD; no meds; "
+        "BP 150/95 mmHg; pulse 110 bpm"
+    )
+    with patch("api.routers.cardio_extract_router._call_openai", side_effect=AssertionError("model called")):
+        events = _events({"case_text": text})
+
+    assert [name for name, _ in events] == ["accepted", "pre_extraction", "result"]
+    assert events[1][1]["covers_core_fields"] is True
+    assert events[-1][1]["extraction_source"] == "pre_extractor"
+
+
+def test_stream_reports_failures_as_an_error_event():
+    with patch(
+        "api.routers.cardio_extract_router._call_openai",
+        side_effect=HTTPException(status_code=504, detail="OpenAI request timed out after 30000ms. Try again."),
+    ):
+        events = _events({"case_text": "Narrative that times out.", "bypass_cache": True})
+
+    assert [name for name, _ in events][-1] == "error"
+    assert events[-1][1] == {
+        "code": "EXTRACTION_FAILED",
+        "message": "OpenAI request timed out after 30000ms. Try again.",
+        "path": "$",
+        "meta": {"status_code": 504},
+    }
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from api.extraction_cache import ExtractionCache, extraction_cache_key, prompt_fingerprint
+from api.main import app
+from api.routers.cardio_extract_router import (
+    EXTRACTION_CACHE_HEADER,
+    PROMPTS_FINGERPRINT,
+    CardioAIRawOutput,
+    CardioMissingInformation,
+    CardioPilotExtractionFields,
+)
+
+client = TestClient(app)
+
+AI_OUTPUT = CardioAIRawOutput(
+    fields=CardioPilotExtractionFields(age=58, chest_pain_present=True, systolic_bp=130),
+    structured_clinical_summary="The narrative reports chest pain.",
+    missing_fields=["heart_rate"],
+    missing_information=CardioMissingInformation(required_for_routing=["heart_rate"], clinically_useful=[], unconfirmed=[]),
+    completion_questions=["What is the heart rate?"],
+    possible_conflicts=[],
+    field_evidence=[],
+    extraction_quality_flags=["requires_human_confirmation"],
+    pii_warnings=[],
+    warnings=[],
+    confidence=0.8,
+    language_detected="en",
+)
+
+
+def test_key_ignores_whitespace_and_tracks_prompts_model_and_language():
+    key = extraction_cache_key("58yo,  chest pain\n BP 130/80", "gpt-4o-mini", "en", PROMPTS_FINGERPRINT)
+    assert key == extraction_cache_key(" 58yo, chest pain BP 130/80 ", "gpt-4o-mini", "en", PROMPTS_FINGERPRINT)
+    assert key != extraction_cache_key("58yo, chest pain BP 130/80", "gpt-4o", "en", PROMPTS_FINGERPRINT)
+    assert key != extraction_cache_key("58yo, chest pain BP 130/80", "gpt-4o-mini", "es", PROMPTS_FINGERPRINT)
+    edited = prompt_fingerprint("edited system instruction", "template")
+    assert key != extraction_cache_key("58yo, chest pain BP 130/80", "gpt-4o-mini", "en", edited)
+
+
+def test_repeat_extraction_is_served_from_cache_and_bypass_refreshes():
+    body = {"case_text": "58-year-old, chest pain, BP 130/80.", "language": "en"}
+    with patch("api.routers.cardio_extract_router._call_openai", return_value=AI_OUTPUT) as call:
+        first = client.post("/v1/cardio/pilot/extract", json=body)
+        second = client.post("/v1/cardio/pilot/extract", json={**body, "case_text": " 58-year-old,  chest pain, BP 130/80.\n"})
+        bypassed = client.post("/v1/cardio/pilot/extract", json={**body, "bypass_cache": True})
+
+    assert call.call_count == 2
+    assert first.headers[EXTRACTION_CACHE_HEADER] == "miss"
+    assert second.headers[EXTRACTION_CACHE_HEADER] == "hit"
+    assert bypassed.headers[EXTRACTION_CACHE_HEADER] == "bypass"
+    assert second.json()["extraction_id"] != first.json()["extraction_id"]
+    strip_id = lambda data: {k: v for k, v in data.items() if k != "extraction_id"}  # noqa: E731
+    assert strip_id(second.json()) == strip_id(first.json())
+
+    metrics = client.get("/v1/metrics").json()["extraction_cache"]["cardio_extract"]
+    assert metrics["hits"] >= 1
+
+
+def test_failed_extractions_are_not_cached():
+    from fastapi import HTTPException
+
+    body = {"case_text": "Narrative that fails first.", "language": "en"}
+    with patch(
+        "api.routers.cardio_extract_router._call_openai",
+        side_effect=[HTTPException(status_code=502, detail="OpenAI API error"), AI_OUTPUT],
+    ):
+        assert client.post("/v1/cardio/pilot/extract", json=body).status_code == 502
+        retry = client.post("/v1/cardio/pilot/extract", json=body)
+    assert retry.status_code == 200
+    assert retry.headers[EXTRACTION_CACHE_HEADER] == "miss"
+
+
+def test_memory_tier_is_lru_and_disk_tier_survives_restarts(tmp_path):
+    cache = ExtractionCache("test_lru", max_size=2, directory=tmp_path)
+    for key in ("a" * 64, "b" * 64, "c" * 64):
+        cache.put(key, {"key": key})
+    assert cache.metrics()["size"] == 2
+    assert cache.get("a" * 64) == {"key": "a" * 64}
+    assert cache.metrics()["disk_hits"] == 1
+
+    restarted = ExtractionCache("test_restart", max_size=2, directory=tmp_path)
+    value = restarted.get("c" * 64)
+    assert value == {"key": "c" * 64}
+    value["key"] = "mutated"
+    assert restarted.get("c" * 64) == {"key": "c" * 64}
+    assert restarted.get("d" * 64) is None
+    assert restarted.metrics() | {"hit_rate": None} == {
+        "hits": 1,
+        "disk_hits": 1,
+        "misses": 1,
+        "size": 1,
+        "max_size": 2,
+        "persistent": True,
+        "hit_rate": None,
+    }
+
+
+def test_disk_write_failures_are_logged_not_raised(tmp_path, monkeypatch, caplog):
+    blocked = tmp_path / "not-a-directory"
+    blocked.write_text("")
+    cache = ExtractionCache("test_unwritable", max_size=2, directory=blocked)
+    with caplog.at_level("WARNING", logger="soficca.extraction_cache"):
+        cache.put("a" * 64, {"key": "a"})
+    assert cache.get("a" * 64) == {"key": "a"}  # still served from memory
+    assert "extraction_cache_write_failed" in caplog.text
+
+    def disk_full(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(os, "replace", disk_full)
+    full = ExtractionCache("test_disk_full", max_size=2, directory=tmp_path / "cache")
+    full.put("b" * 64, {"key": "b"})
+    assert list((tmp_path / "cache").rglob("*.tmp")) == []
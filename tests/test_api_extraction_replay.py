@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.extraction_replay import (
+    ERROR_RATE_ENV,
+    LATENCY_ENV,
+    REPLAY_ENV,
+    REPLAY_WARNING,
+    SYNTHETIC_ENV,
+    parse_latency,
+    recording_key,
+)
+from api.main import app
+
+client = TestClient(app)
+
+RECORDED_TEXT = "Recorded narrative: 70-year-old with chest pain."
+
+
+@pytest.fixture
+def cassette(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, ai_output) -> Path:
+    path = tmp_path / "cassette.jsonl"
+
+    def _output(age: int) -> Dict[str, Any]:
+        return ai_output({"age": age, "chest_pain_present": True, "dyspnea": False}).model_dump(mode="json")
+
+    lines = [
+        {"key": recording_key(RECORDED_TEXT, "gpt-4o-mini"), "model": "gpt-4o-mini", "output": _output(70), "latency_s": 1.5},
+        {"key": "synthetic-1", "model": "synthetic", "output": _output(55)},
+    ]
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv(REPLAY_ENV, str(path))
+    monkeypatch.setenv(LATENCY_ENV, "fixed:0.01")
+    return path
+
+
+def test_latency_specs():
+    rng = random.Random(1)
+    assert parse_latency("0", rng)(None) == 0.0
+    assert parse_latency("fixed:2.5", rng)(None) == 2.5
+    assert all(1 <= parse_latency("uniform:1,4", rng)(None) <= 4 for _ in range(50))
+    samples = sorted(parse_latency("lognormal:3,0.5", rng)(None) for _ in range(2001))
+    assert 2.7 < samples[1000] < 3.3
+    assert parse_latency("recorded", rng)(1.5) == 1.5
+    with pytest.raises(ValueError):
+        parse_latency("gaussian:1", rng)
+
+
+def test_replay_serves_recorded_outputs_without_a_provider(cassette):
+    recorded = client.post("/v1/cardio/pilot/extract", json={"case_text": f"  {RECORDED_TEXT}\n"})
+    assert recorded.status_code == 200
+    assert recorded.json()["fields"]["age"] == 70
+    assert recorded.json()["warnings"][-1] == REPLAY_WARNING
+    assert recorded.json()["model"] == "replay:cassette.jsonl"
+
+
+def test_synthetic_replay_is_opt_in(cassette, monkeypatch):
+    monkeypatch.setenv(SYNTHETIC_ENV, "1")
+    body = {"case_text": "Unrecorded narrative with chest pain.", "bypass_cache": True}
+    first = client.post("/v1/cardio/pilot/extract", json=body).json()
+    second = client.post("/v1/cardio/pilot/extract", json=body).json()
+    assert first["fields"]["age"] in (55, 70)
+    assert second["fields"] == first["fields"]
+
+
+def test_replay_rejects_unrecorded_narratives_by_default(cassette):
+    resp = client.post("/v1/cardio/pilot/extract", json={"case_text": "Unrecorded narrative with chest pain."})
+    assert resp.status_code == 502
+    assert "replay cassette" in resp.json()["detail"]
+
+
+def test_replayed_results_never_reach_the_extraction_cache(cassette, monkeypatch):
+    first = client.post("/v1/cardio/pilot/extract", json={"case_text": RECORDED_TEXT})
+    second = client.post("/v1/cardio/pilot/extract", json={"case_text": RECORDED_TEXT})
+    assert first.headers["x-soficca-extraction-cache"] == second.headers["x-soficca-extraction-cache"] == "bypass"
+
+    monkeypatch.delenv(REPLAY_ENV)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    with patch("api.routers.cardio_extract_router._call_openai", side_effect=AssertionError("model called")):
+        with pytest.raises(AssertionError, match="model called"):
+            client.post("/v1/cardio/pilot/extract", json={"case_text": RECORDED_TEXT})
+
+
+def test_replay_streams_partial_fields(cassette):
+    resp = client.post("/v1/cardio/pilot/extract/stream", json={"case_text": RECORDED_TEXT})
+    partials = [
+        json.loads(frame.split("\n")[1].removeprefix("data: "))["fields"]
+        for frame in resp.text.strip().split("\n\n")
+        if frame.startswith("event: partial")
+    ]
+    assert partials == [{"age": 70}, {"age": 70, "chest_pain_present": True}, {"age": 70, "chest_pain_present": True, "dyspnea": False}]
+
+
+def test_injected_errors_fail_like_a_provider_500(cassette, monkeypatch):
+    monkeypatch.setenv(ERROR_RATE_ENV, "1")
+    response = client.post("/v1/cardio/pilot/extract", json={"case_text": RECORDED_TEXT})
+    assert response.status_code == 502
+    assert response.json()["detail"].startswith("OpenAI API error")
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from api.main import app
+from api.metrics import Counter, Histogram, MetricsRegistry
+
+
+def test_registry_sums_per_thread_shards_and_renders_histograms():
+    registry = MetricsRegistry()
+    counter = Counter(registry, "demo_total", "Demo counter.", ("kind",))
+    histogram = Histogram(registry, "demo_seconds", "Demo latency.", ("kind",), buckets=(0.1, 1.0))
+
+    def work():
+        for _ in range(1000):
+            counter.inc("a")
+        histogram.observe(0.1, "a")
+        histogram.observe(5.0, "a")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc('quote"d')
+
+    text = registry.render()
+    assert 'demo_total{kind="a"} 4000' in text
+    assert 'demo_total{kind="quote\\"d"} 1' in text
+    assert 'demo_seconds_bucket{kind="a",le="0.1"} 4' in text
+    assert 'demo_seconds_bucket{kind="a",le="1"} 4' in text
+    assert 'demo_seconds_bucket{kind="a",le="+Inf"} 8' in text
+    assert 'demo_seconds_count{kind="a"} 8' in text
+    assert 'demo_seconds_sum{kind="a"} 20.4' in text
+
+
+
+def test_shards_of_exited_threads_are_folded_and_dropped():
+    registry = MetricsRegistry()
+    counter = Counter(registry, "demo_total", "Demo counter.")
+    histogram = Histogram(registry, "demo_seconds", "Demo latency.", buckets=(1.0,))
+
+    def work():
+        counter.inc()
+        histogram.observe(0.5)
+
+    for _ in range(500):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    assert registry.shard_count() <= 1
+    text = registry.render()
+    assert "demo_total 500" in text
+    assert 'demo_seconds_bucket{le="1"} 500' in text
+    assert "demo_seconds_count 500" in text
+    counter.inc()
+    assert "demo_total 501" in registry.render()
+
+def test_metrics_endpoint_exposes_routes_decisions_rules_and_caches():
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    client = TestClient(app)
+    state = {"frequency": "sometimes", "desire": "present", "stress": "high", "morning_erection": "normal", "wants_meds": True}
+    assert client.post("/v1/evaluate", json={"state": state, "context": {}}).status_code == 200
+    assert client.post("/v1/evaluate", json={"state": {**state, "safety_flags": ["RED_FLAG_ACUTE_CARDIORESP"]}, "context": {}}).status_code == 200
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'soficca_http_request_duration_seconds_count{method="POST",route="/v1/evaluate",status="200"}' in text
+    assert 'soficca_http_requests_in_flight{method="GET"} 1' in text
+    assert 'soficca_decisions_total{engine="soficca_core",status="DECIDED"}' in text
+    assert 'soficca_decisions_total{engine="soficca_core",status="ESCALATED"}' in text
+    assert 'soficca_rule_triggers_total{engine="soficca_core",rule_id="' in text
+    assert 'soficca_policy_triggers_total{engine="soficca_core",policy_id="' in text
+    assert 'soficca_cache_hit_ratio{cache="trace_evidence"}' in text
+    assert 'soficca_single_flight_calls_total{group="evaluate"}' in text
+    assert "# TYPE soficca_single_flight_calls_total counter" in text
+    assert "# TYPE soficca_cache_hits_total counter" in text
+    assert "# TYPE soficca_cache_hit_ratio gauge" in text
@@ -0,0 +1,363 @@
+"""
+The extraction endpoint against a local stand-in for the OpenAI API.
+
+Exercises the real async client (no mocks): connection reuse across requests, the
+per-process concurrency limit, streamed completions behind the SSE endpoint, and the
+circuit breaker, deadline budgets and hedging against scripted latency and errors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+
+from api import openai_client
+from api.routers.cardio_extract_router import CardioAIRawOutput, _call_openai
+
+STUB_OUTPUT: Dict[str, Any] = {
+    "fields": {"age": 64, "chest_pain_present": True, "pain_severity": "high"},
+    "structured_clinical_summary": "The narrative reports chest pain.",
+    "missing_fields": ["systolic_bp"],
+    "missing_information": {"required_for_routing": ["systolic_bp"], "clinically_useful": [], "unconfirmed": []},
+    "completion_questions": ["What is the blood pressure?"],
+    "possible_conflicts": [],
+    "field_evidence": [{"field": "age", "value": "64", "source_text": "64-year-old", "confidence": 0.9}],
+    "extraction_quality_flags": ["requires_human_confirmation"],
+    "pii_warnings": [],
+    "warnings": [],
+    "confidence": 0.8,
+    "language_detected": "en",
+}
+
+
+class _StubOpenAI(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+        self.client_ports: List[int] = []
+        # (delay, status) for the next requests, in order; then `delay` and 200.
+        self.script: List[Tuple[float, int]] = []
+        self.stopping = threading.Event()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StubOpenAI
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        server = self.server
+        request = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))) or b"{}")
+        with server.lock:
+            server.requests += 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            server.client_ports.append(self.client_address[1])
+            delay, status = server.script.pop(0) if server.script else (server.delay, 200)
+        server.stopping.wait(delay)
+        with server.lock:
+            server.active -= 1
+        if status != 200:
+            self._send_error(status)
+            return
+        if request.get("stream"):
+            self._send_stream()
+            return
+        body = json.dumps(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": json.dumps(STUB_OUTPUT), "refusal": None},
+                    }
+                ],
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int) -> None:
+        body = json.dumps({"error": {"message": "stub failure", "type": "server_error"}}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self) -> None:
+        content = json.dumps(STUB_OUTPUT)
+        pieces = [content[i:i + 16] for i in range(0, len(content), 16)]
+        deltas = [{"role": "assistant", "content": ""}] + [{"content": piece} for piece in pieces] + [{}]
+        frames = []
+        for i, delta in enumerate(deltas):
+            chunk = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [{"index": 0, "delta": delta, "finish_reason": "stop" if i == len(deltas) - 1 else None}],
+            }
+            frames.append(f"data: {json.dumps(chunk)}\n\n")
+        body = ("".join(frames) + "data: [DONE]\n\n").encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, delay: float = 0.0) -> Iterator[_StubOpenAI]:
+    server = _StubOpenAI(delay)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-stub")
+    monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+    monkeypatch.setenv(openai_client.MAX_RETRIES_ENV, "0")
+    monkeypatch.setattr(openai_client, "_state", None)
+    try:
+        yield server
+    finally:
+        # Cut short calls abandoned by a deadline or a hedge, so no handler outlives the test.
+        server.stopping.set()
+        while server.active:
+            time.sleep(0.01)
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def stub_openai(monkeypatch: pytest.MonkeyPatch) -> Iterator[_StubOpenAI]:
+    yield from _serve(monkeypatch)
+
+
+@pytest.fixture
+def slow_stub_openai(monkeypatch: pytest.MonkeyPatch) -> Iterator[_StubOpenAI]:
+    yield from _serve(monkeypatch, delay=0.1)
+
+
+def test_extract_endpoint_reuses_pooled_connection(stub_openai):
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
+    with TestClient(app) as client:
+        for minutes in (5, 10, 15):
+            response = client.post(
+                "/v1/cardio/pilot/extract", json={"case_text": f"64-year-old with chest pain for {minutes} minutes."}
+            )
+            assert response.status_code == 200
+            assert response.json()["fields"]["age"] == 64
+
+    assert stub_openai.requests == 3
+    assert len(set(stub_openai.client_ports)) == 1
+
+
+def test_concurrent_calls_are_capped(slow_stub_openai, monkeypatch):
+    monkeypatch.setenv(openai_client.MAX_CONCURRENCY_ENV, "2")
+
+    async def run() -> List[CardioAIRawOutput]:
+        try:
+            return await asyncio.gather(*(_call_openai("chest pain", "gpt-4o-mini", f"EXT-{i}") for i in range(6)))
+        finally:
+            await openai_client.close_openai_client()
+
+    results = asyncio.run(run())
+    assert [result.fields.age for result in results] == [64] * 6
+    assert slow_stub_openai.requests == 6
+    assert slow_stub_openai.max_active == 2
+
+
+def test_replaced_clients_are_closed(monkeypatch):
+    monkeypatch.setattr(openai_client, "_state", None)
+
+    async def swap_keys() -> Tuple[Any, Any]:
+        first = openai_client.get_openai_client("sk-first")
+        second = openai_client.get_openai_client("sk-second")
+        await asyncio.sleep(0)
+        await asyncio.gather(*openai_client._closing)
+        return first, second
+
+    first, second = asyncio.run(swap_keys())
+    assert first.is_closed()
+    assert not second.is_closed()
+
+    # The loop that owned `second` is gone; a new loop still closes it.
+    async def from_a_new_loop() -> Any:
+        client = openai_client.get_openai_client("sk-second")
+        await asyncio.gather(*openai_client._closing)
+        return client
+
+    third = asyncio.run(from_a_new_loop())
+    assert second.is_closed()
+
+    # A client whose loop is still running is closed on that loop.
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        owned = asyncio.run_coroutine_threadsafe(from_a_new_loop(), other_loop).result(timeout=5)
+        assert third.is_closed()
+        asyncio.run(from_a_new_loop())
+        deadline = time.monotonic() + 5
+        while not owned.is_closed() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert owned.is_closed()
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(timeout=5)
+        other_loop.close()
+
+
+def _sse_events(text: str) -> List[Tuple[str, Dict[str, Any]]]:
+    events = []
+    for frame in text.strip().split("\n\n"):
+        event, data = frame.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def test_sse_endpoint_streams_partial_fields_from_a_streamed_completion(stub_openai):
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
+    with TestClient(app) as client:
+        response = client.post("/v1/cardio/pilot/extract/stream", json={"case_text": "64-year-old with chest pain."})
+        plain = client.post(
+            "/v1/cardio/pilot/extract", json={"case_text": "64-year-old with chest pain.", "bypass_cache": True}
+        )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(response.text)
+    names = [name for name, _ in events]
+    assert names[:2] == ["accepted", "pre_extraction"]
+    assert names[-2:] == ["safety", "result"]
+    partials = [data["fields"] for name, data in events if name == "partial"]
+    # Fields arrive one at a time, each only once it is complete.
+    assert partials == [{"age": 64}, {"age": 64, "chest_pain_present": True}]
+    result = events[-1][1]
+    assert result["extraction_id"] == events[0][1]["extraction_id"]
+    strip_id = lambda data: {k: v for k, v in data.items() if k != "extraction_id"}  # noqa: E731
+    assert strip_id(result) == strip_id(plain.json())
+
+
+def test_recorded_calls_replay_without_the_provider(stub_openai, monkeypatch, tmp_path):
+    from api.extraction_replay import REDACTED_TEXT, RECORD_ENV, REPLAY_ENV, REPLAY_WARNING, load_cassette
+
+    cassette = tmp_path / "cassette.jsonl"
+    monkeypatch.setenv(RECORD_ENV, str(cassette))
+
+    async def call() -> CardioAIRawOutput:
+        try:
+            return await _call_openai("64-year-old with chest pain.", "gpt-4o-mini", "EXT-REC")
+        finally:
+            await openai_client.close_openai_client()
+
+    recorded = asyncio.run(call())
+    (recording,) = load_cassette(cassette)
+    stored = CardioAIRawOutput.model_validate(recording.output)
+    assert stored.fields == CardioAIRawOutput.model_validate(STUB_OUTPUT).fields
+    assert stored.structured_clinical_summary == REDACTED_TEXT
+    assert [item.source_text for item in stored.field_evidence] == [REDACTED_TEXT]
+    # Neither the narrative nor the model's quotes of it reach the cassette.
+    assert "64-year-old" not in cassette.read_text(encoding="utf-8")
+
+    monkeypatch.delenv(RECORD_ENV)
+    monkeypatch.setenv(REPLAY_ENV, str(cassette))
+    replayed = asyncio.run(call())
+    assert stub_openai.requests == 1
+    assert replayed.fields == recorded.fields
+    assert replayed.warnings[-1] == REPLAY_WARNING
+
+
+def test_circuit_opens_after_provider_errors_and_then_fails_fast(stub_openai, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
+    monkeypatch.setenv(openai_client.BREAKER_MIN_CALLS_ENV, "4")
+    monkeypatch.setenv(openai_client.BREAKER_OPEN_ENV, "60")
+    stub_openai.script = [(0.0, 500)] * 4
+
+    with TestClient(app) as client:
+        failed = [
+            client.post("/v1/cardio/pilot/extract", json={"case_text": f"Chest pain for {minutes} minutes."})
+            for minutes in (5, 10, 15, 20)
+        ]
+        rejected = client.post("/v1/cardio/pilot/extract", json={"case_text": "Chest pain for 25 minutes."})
+        metrics = client.get("/metrics").text
+
+    assert [response.status_code for response in failed] == [502] * 4
+    assert rejected.status_code == 503
+    assert 0 < int(rejected.headers["retry-after"]) <= 60
+    assert stub_openai.requests == 4
+    assert 'soficca_circuit_breaker_state{breaker="openai",state="open"} 1' in metrics
+    assert 'soficca_openai_calls_rejected_total{reason="circuit_open"} 1' in metrics
+
+
+def test_deadline_header_cuts_a_slow_call_short(stub_openai):
+    from fastapi.testclient import TestClient
+
+    from api.circuit_breaker import circuit_breaker_metrics
+    from api.main import app
+
+    stub_openai.script = [(0.5, 200)]
+    with TestClient(app) as client:
+        started = time.monotonic()
+        response = client.post(
+            "/v1/cardio/pilot/extract",
+            json={"case_text": "Chest pain for 5 minutes."},
+            headers={"X-Soficca-Deadline-Ms": "100"},
+        )
+        elapsed = time.monotonic() - started
+
+    assert response.status_code == 504
+    assert "deadline" in response.json()["detail"]
+    assert elapsed < 0.4
+    # The client's budget says nothing about the provider's health.
+    assert circuit_breaker_metrics()["openai"]["window_calls"] == 0
+
+
+def test_slow_call_is_hedged_with_a_second_attempt(stub_openai, monkeypatch):
+    monkeypatch.setenv(openai_client.HEDGE_ENV, "1")
+    monkeypatch.setenv(openai_client.HEDGE_MIN_SAMPLES_ENV, "1")
+    openai_client.openai_latencies().observe(0.05)
+    stub_openai.script = [(1.0, 200)]
+
+    async def call() -> CardioAIRawOutput:
+        try:
+            return await _call_openai("64-year-old with chest pain.", "gpt-4o-mini", "EXT-HEDGE")
+        finally:
+            await openai_client.close_openai_client()
+
+    started = time.monotonic()
+    result = asyncio.run(call())
+    assert time.monotonic() - started < 0.6
+    assert result.fields.age == 64
+    assert stub_openai.requests == 2
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from api.phrase_matcher import PhraseMatch, PhraseMatcher
+
+
+def test_reports_every_occurrence_including_overlaps_case_insensitively():
+    matcher = PhraseMatcher(["route to", "route to emergency", "patient should", "should be treated"])
+    text = "ROUTE TO emergency. Patient should be treated; route to ED."
+    assert matcher.find_all(text) == [
+        PhraseMatch("route to emergency", 0, 18),
+        PhraseMatch("patient should", 20, 34),
+        PhraseMatch("should be treated", 28, 45),
+        PhraseMatch("route to", 47, 55),
+    ]
+    assert text[28:45].lower() == "should be treated"
+
+
+def test_offsets_refer_to_the_original_text_when_lowercasing_changes_length():
+    matcher = PhraseMatcher(["diagnóstico"])
+    text = "İİ DIAGNÓSTICO"
+    (match,) = matcher.find_all(text)
+    assert text[match.start:match.end] == "DIAGNÓSTICO"
+
+
+def test_large_phrase_sets_match_like_substring_search():
+    phrases = [f"phrase number {n} end" for n in range(600)] + ["recommend", "recomienda"]
+    matcher = PhraseMatcher(phrases)
+    text = "Nothing here. phrase number 599 end; se recomienda; recommended; phrase number 60 ends"
+    expected = sorted(
+        (PhraseMatch(p, i, i + len(p)) for p in phrases for i in range(len(text)) if text.lower().startswith(p, i)),
+        key=lambda m: m.start,
+    )
+    assert matcher.find_all(text) == expected
+    assert PhraseMatcher([]).find_all(text) == []
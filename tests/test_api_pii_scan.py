@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.pii_scan import PII_PRESCAN_ENV, mask_pii, scan_pii
+
+client = TestClient(app)
+
+NARRATIVE = "Mr. John Smith, 64, chest pressure for 20 minutes. Call his daughter on 555-123-4567."
+COVERED = (
+    "72 y/o M, chest pain 2 h, sharp, non-radiating; SOB: no; syncope - negative; CAD; no meds; "
+    "BP 150/95 mmHg; pulse 110 bpm; tel 612 345 678"
+)
+
+
+@pytest.mark.parametrize(
+    "text, warning, found",
+    [
+        ("Call her on 555-123-4567 tomorrow.", "possible_phone_detected", "555-123-4567"),
+        ("móvil +34 612 34 56 78", "possible_phone_detected", "+34 612 34 56 78"),
+        ("email juan.perez@gmail.com please", "possible_email_detected", "juan.perez@gmail.com"),
+        ("MRN 00123456, admitted", "possible_id_number_detected", "00123456"),
+        ("DNI: 12345678Z", "possible_id_number_detected", "12345678Z"),
+        ("SSN 123-45-6789", "possible_id_number_detected", "123-45-6789"),
+        ("Lives at 221B Baker Street, London", "possible_address_detected", "221B Baker Street"),
+        ("vive en calle Mayor 12, Madrid", "possible_address_detected", "Mayor 12"),
+        ("código postal 28013", "possible_address_detected", "28013"),
+        ("Sra. Pérez refiere dolor", "possible_name_detected", "Pérez"),
+        ("La paciente se llama Ana García", "possible_name_detected", "Ana García"),
+    ],
+)
+def test_identifiers_are_found_with_their_offsets(text, warning, found):
+    findings = scan_pii(text)
+    assert [(finding.warning, text[finding.start:finding.end]) for finding in findings] == [(warning, found)]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "BP 130 85 HR 92 RR 18 SpO2 98% temp 36.8, ECG at 10:45 on 2024-03-15",
+        "aspirin 300 mg, heparin 5000 units, troponin 0.045 ng/mL, on telemetry",
+        "Se cayó en la calle hace 3 días; dolor 8/10 desde las 04:00. Paciente: Varón de 64 años",
+        "MS patient lives at home with 2 kids; medical record of 3 episodes",
+        "Patient: Chest Pain since 2 hours",
+        "Paciente: Varón de 64 años con dolor torácico",
+        "Seen by Dr. Garcia in the ED; Dra. López reviewed the ECG",
+        "Vive en Madrid desde 2010, sin antecedentes",
+    ],
+)
+def test_clinical_shorthand_is_not_an_identifier(text):
+    assert scan_pii(text) == []
+
+
+def test_masking_keeps_offsets():
+    masked = mask_pii(NARRATIVE, scan_pii(NARRATIVE))
+    assert len(masked) == len(NARRATIVE)
+    assert "John" not in masked and "4567" not in masked
+    assert masked.startswith("Mr. [NAME]****, 64, chest pressure")
+
+
+def _output(ai_output, pii: List[str]):
+    evidence = [{"field": "chest_pain_present", "value": "true", "source_text": "chest pressure", "confidence": 0.9}]
+    return ai_output(summary="The narrative reports chest pressure.", evidence=evidence, missing=(), pii=pii)
+
+
+def test_prescan_warnings_lead_and_the_model_is_a_fallback(ai_output):
+    with patch(
+        "api.routers.cardio_extract_router._call_openai", return_value=_output(ai_output, ["possible_email_detected"])
+    ) as call:
+        data = client.post("/v1/cardio/pilot/extract", json={"case_text": NARRATIVE}).json()
+
+    assert call.call_args.args[0] == NARRATIVE
+    assert data["pii_warnings"] == ["possible_name_detected", "possible_phone_detected", "possible_email_detected"]
+    assert "possible_identifier_detected" in data["extraction_quality_flags"]
+
+
+def test_mask_mode_sends_placeholders_and_keeps_evidence_offsets(monkeypatch, ai_output):
+    monkeypatch.setenv(PII_PRESCAN_ENV, "mask")
+    with patch("api.routers.cardio_extract_router._call_openai", return_value=_output(ai_output, [])) as call:
+        data = client.post("/v1/cardio/pilot/extract", json={"case_text": NARRATIVE}).json()
+
+    sent = call.call_args.args[0]
+    assert len(sent) == len(NARRATIVE) and "Smith" not in sent and "555-123-4567" not in sent
+    assert data["pii_warnings"] == ["possible_name_detected", "possible_phone_detected"]
+    assert data["warnings"][-1].startswith("Possible identifiers (name, phone) were masked")
+    evidence = data["field_evidence"][0]
+    assert NARRATIVE[evidence["source_start"]:evidence["source_end"]] == "chest pressure"
+
+
+def test_block_mode_refuses_the_model_but_not_the_pre_extractor(monkeypatch):
+    monkeypatch.setenv(PII_PRESCAN_ENV, "block")
+    with patch("api.routers.cardio_extract_router._call_openai", side_effect=AssertionError("model called")):
+        blocked = client.post("/v1/cardio/pilot/extract", json={"case_text": NARRATIVE})
+        covered = client.post("/v1/cardio/pilot/extract", json={"case_text": COVERED})
+
+    assert blocked.status_code == 422
+    assert "(name, phone)" in blocked.json()["detail"]
+    assert covered.status_code == 200
+    assert covered.json()["extraction_source"] == "pre_extractor"
+    assert covered.json()["pii_warnings"] == ["possible_phone_detected"]
+    assert "possible_identifier_detected" in covered.json()["extraction_quality_flags"]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routers.cardio_extract_router import (
+    CardioAIRawOutput,
+    CardioMissingInformation,
+    CardioPilotExtractionFields,
+)
+from cardio_triage_v1.pre_extraction import PRE_EXTRACTOR_VERSION
+
+client = TestClient(app)
+
+COVERED = (
+    "72 y/o M, chest pain 2 h, sharp, non-radiating; SOB: no; syncope - negative; CAD; no meds; "
+    "BP 150/95 mmHg; pulse 110 bpm"
+)
+
+
+def test_covered_narrative_skips_the_model():
+    with patch("api.routers.cardio_extract_router._call_openai", side_effect=AssertionError("model called")):
+        resp = client.post("/v1/cardio/pilot/extract", json={"case_text": COVERED, "language": "en"})
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["extraction_source"] == "pre_extractor"
+    assert data["model"] == PRE_EXTRACTOR_VERSION
+    assert data["ai_role"] == "STRUCTURING_ONLY"
+    assert data["fields"]["systolic_bp"] == 150
+    assert data["fields"]["dyspnea"] is False
+    assert data["missing_information"]["required_for_routing"] == []
+    assert "requires_human_confirmation" in data["extraction_quality_flags"]
+    start = COVERED.index("SOB: no")
+    assert {
+        "field": "dyspnea",
+        "value": "false",
+        "source_text": "SOB: no",
+        "segment": None,
+        "source_start": start,
+        "source_end": start + len("SOB: no"),
+    } == {k: v for k, v in next(e for e in data["field_evidence"] if e["field"] == "dyspnea").items() if k != "confidence"}
+    assert data["confidence"] < 1.0
+
+
+def test_disabled_pre_extraction_always_calls_the_model(monkeypatch):
+    monkeypatch.setenv("SOFICCA_PRE_EXTRACTION", "0")
+    output = CardioAIRawOutput(
+        fields=CardioPilotExtractionFields(age=72),
+        structured_clinical_summary="The narrative reports chest pain.",
+        missing_fields=[],
+        missing_information=CardioMissingInformation(required_for_routing=[], clinically_useful=[], unconfirmed=[]),
+        completion_questions=[],
+        possible_conflicts=[],
+        field_evidence=[],
+        extraction_quality_flags=["requires_human_confirmation"],
+        pii_warnings=[],
+        warnings=[],
+        confidence=0.8,
+        language_detected="en",
+    )
+    with patch("api.routers.cardio_extract_router._call_openai", return_value=output) as call:
+        resp = client.post("/v1/cardio/pilot/extract", json={"case_text": COVERED})
+    assert call.call_count == 1
+    assert resp.json()["extraction_source"] == "ai"
+    assert resp.json()["fields"]["systolic_bp"] is None
+
+
+def test_partial_narrative_merges_hints_into_model_output():
+    output = CardioAIRawOutput(
+        fields=CardioPilotExtractionFields(age=64, chest_pain_present=True, heart_rate=80),
+        structured_clinical_summary="The narrative reports chest pressure.",
+        missing_fields=["systolic_bp", "syncope", "dyspnea"],
+        missing_information=CardioMissingInformation(
+            required_for_routing=["systolic_bp", "syncope", "dyspnea"], clinically_useful=[], unconfirmed=[]
+        ),
+        completion_questions=[],
+        possible_conflicts=[],
+        field_evidence=[],
+        extraction_quality_flags=["requires_human_confirmation"],
+        pii_warnings=[],
+        warnings=[],
+        confidence=0.8,
+        language_detected="en",
+    )
+    with patch("api.routers.cardio_extract_router._call_openai", return_value=output):
+        resp = client.post(
+            "/v1/cardio/pilot/extract",
+            json={"case_text": "64M, BP 122/80, HR 78, chest pressure 15 min, no syncope"},
+        )
+
+    data = resp.json()
+    assert data["extraction_source"] == "ai"
+    assert data["fields"]["systolic_bp"] == 122
+    assert data["fields"]["syncope"] is False
+    assert data["fields"]["heart_rate"] == 80  # the model's value is kept
+    assert data["missing_fields"] == ["dyspnea"]
+    assert data["missing_information"]["required_for_routing"] == ["dyspnea"]
+    assert any(e["field"] == "systolic_bp" and e["source_text"] == "BP 122/80" for e in data["field_evidence"])
+    assert any("heart_rate=78" in warning and "returned 80" in warning for warning in data["warnings"])
+
+
+def test_findings_after_a_negated_one_are_read_as_affirmed():
+    text = "64M, BP 122/80, HR 78, chest pressure 15 min, no radiation, denies dyspnea, fainted today, known CAD, no meds"
+    with patch("api.routers.cardio_extract_router._call_openai", side_effect=AssertionError("model called")):
+        resp = client.post("/v1/cardio/pilot/extract", json={"case_text": text})
+
+    data = resp.json()
+    assert data["extraction_source"] == "pre_extractor"
+    assert data["fields"]["dyspnea"] is False
+    assert data["fields"]["syncope"] is True
+    assert data["fields"]["known_cad"] is True
+
+
+def test_list_negation_neither_skips_the_model_nor_fills_its_nulls(ai_output):
+    text = "64M, BP 122/80, HR 78, chest pressure 15 min, no dyspnea, syncope or diaphoresis"
+    output = ai_output({"age": 64, "chest_pain_present": True}, missing=("systolic_bp", "syncope", "dyspnea"))
+    with patch("api.routers.cardio_extract_router._call_openai", return_value=output) as call:
+        resp = client.post("/v1/cardio/pilot/extract", json={"case_text": text})
+
+    assert call.call_count == 1
+    data = resp.json()
+    assert data["extraction_source"] == "ai"
+    assert data["fields"]["dyspnea"] is False  # negated directly, no comma
+    assert data["fields"]["syncope"] is None  # negated only through the list
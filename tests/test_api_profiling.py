@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pstats
+import time
+
+import pytest
+
+from api import profiling
+from api.main import app
+
+_ITEM = {
+    "state": {"frequency": "sometimes", "desire": "present", "stress": "high", "morning_erection": "normal", "wants_meds": True},
+    "context": {"source": "USER"},
+}
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv(profiling.ADMIN_TOKEN_ENV, "secret")
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV, str(tmp_path))
+    return TestClient(app)
+
+
+def test_profile_requires_admin_token(client):
+    assert client.post("/v1/evaluate?profile=1", json=_ITEM).status_code == 403
+    assert client.post("/v1/evaluate?profile=1", json=_ITEM, headers={"X-Admin-Token": "wrong"}).status_code == 403
+    plain = client.post("/v1/evaluate", json=_ITEM)
+    assert plain.status_code == 200 and "profile" not in plain.json()
+
+
+def test_inline_profile_wraps_report_with_top_frames(client):
+    plain = client.post("/v1/evaluate", json=_ITEM).json()
+    response = client.post("/v1/evaluate?profile=1", json=_ITEM, headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["response"] == plain
+    assert body["profile"]["top_frames"]
+    assert body["profile"]["total_ms"] > 0
+    assert all({"frame", "calls", "self_ms", "cumulative_ms"} == set(frame) for frame in body["profile"]["top_frames"])
+
+
+def test_file_profile_keeps_response_and_writes_pstats(client, tmp_path):
+    response = client.post(
+        "/v1/pen/evaluate",
+        json={"age": 34, "norwood_stage": 3, "loss_noticed": "Last 12 months", "loss_areas": ["crown"], "main_goal": "regrowth",
+              "high_blood_pressure": False, "cardiovascular_conditions": False, "current_medication": False,
+              "prior_treatment_use": False, "had_side_effects": False, "scalp_sensitivities": False,
+              "treatment_preference": "balanced", "routine_consistency": "high", "priority_factor": "safety",
+              "baseline_photos_uploaded": True},
+        headers={"X-Admin-Token": "secret", "X-Soficca-Profile": "file"},
+    )
+    assert response.status_code == 200
+    assert set(response.json()) == {"versions", "decision", "decision_rationale", "trace", "journey_views", "frontend_adapter"}
+    path = response.headers["x-soficca-profile-file"]
+    assert path.startswith(str(tmp_path))
+    assert pstats.Stats(path).total_calls > 0
+
+
+def test_stack_sampler_writes_folded_stacks(tmp_path):
+    sampler = profiling.StackSampler(hz=200, path=tmp_path / "stacks.folded")
+    sampler.start()
+    time.sleep(0.1)
+    sampler.stop()
+    lines = (tmp_path / "stacks.folded").read_text(encoding="utf-8").splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert "test_stack_sampler_writes_folded_stacks (test_api_profiling.py:" in stack
+    assert int(count) >= 1
+
+
+def test_admin_sampler_toggle(client):
+    assert client.get("/v1/admin/profiling/sampler").status_code == 403
+    headers = {"X-Admin-Token": "secret"}
+    started = client.post("/v1/admin/profiling/sampler", json={"enabled": True, "hz": 50}, headers=headers).json()
+    assert started["running"] is True and started["hz"] == 50
+    assert client.post("/v1/admin/profiling/sampler", json={"enabled": False}, headers=headers).json() == {"running": False}
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Dict, List
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.narrative_segments import SEGMENT_CHARS_ENV, SEGMENT_OVERLAP_ENV, split_narrative
+from api.routers.cardio_extract_router import (
+    CardioAIRawOutput,
+    CardioFieldEvidence,
+)
+
+client = TestClient(app)
+
+FILLER = "Transferred from the district clinic overnight with a detailed nursing handover attached. "
+NARRATIVE = (
+    "Page 1. 61-year-old man, chest pain since 04:00. "
+    + FILLER * 3
+    + "Page 2. He denies syncope. BP 150/90 on arrival. "
+    + FILLER * 3
+    + "Page 3. Repeat BP 120/80 after rest. Takes aspirin."
+)
+
+
+def _segment_output(ai_output: Callable[..., CardioAIRawOutput], text: str) -> CardioAIRawOutput:
+    fields: Dict = {}
+    evidence: List[CardioFieldEvidence] = []
+    if "Page 1" in text:
+        fields.update(age=61, chest_pain_present=True)
+        evidence.append(CardioFieldEvidence(field="age", value="61", source_text="61-year-old man", confidence=0.9))
+    if "denies syncope" in text:
+        fields["syncope"] = False
+        evidence.append(CardioFieldEvidence(field="syncope", value="false", source_text="denies syncope", confidence=0.9))
+    if "BP 150/90" in text:
+        fields["systolic_bp"] = 150
+    if "Repeat BP 120/80" in text:
+        fields["systolic_bp"] = 120 if "BP 150/90" not in text else 150
+        fields["current_meds_summary"] = "aspirin"
+    missing = [name for name in ("syncope", "systolic_bp", "dyspnea") if name not in fields]
+    return ai_output(
+        fields,
+        evidence=evidence,
+        missing=missing,
+        summary="The segment reports findings.",
+        flags=["requires_human_confirmation", "critical_missing_fields"],
+        confidence=0.8 if "age" in fields else 0.7,
+    )
+
+
+def test_split_covers_the_text_with_overlapping_sentence_aligned_segments():
+    segments = split_narrative(NARRATIVE, 200, 60)
+    assert len(segments) > 2
+    assert segments[0].start == 0 and segments[-1].end == len(NARRATIVE)
+    for previous, segment in zip(segments, segments[1:]):
+        assert segment.start < previous.end  # overlap
+        assert NARRATIVE[segment.start - 1].isspace()
+    assert all(segment.text == NARRATIVE[segment.start:segment.end] for segment in segments)
+    assert split_narrative(NARRATIVE, 0, 60)[0].text == NARRATIVE
+    assert len(split_narrative(NARRATIVE * 20, 200, 60, limit=4)) <= 4
+
+
+def test_long_narrative_is_extracted_in_parallel_segments_and_merged(monkeypatch, ai_output):
+    monkeypatch.setenv(SEGMENT_CHARS_ENV, "200")
+    monkeypatch.setenv(SEGMENT_OVERLAP_ENV, "60")
+    active = {"now": 0, "max": 0}
+    seen: List[str] = []
+
+    async def fake_call(case_text: str, model: str, extraction_id: str) -> CardioAIRawOutput:
+        seen.append(extraction_id)
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.05)
+        active["now"] -= 1
+        return _segment_output(ai_output, case_text)
+
+    with patch("api.routers.cardio_extract_router._call_openai", side_effect=fake_call):
+        resp = client.post("/v1/cardio/pilot/extract", json={"case_text": NARRATIVE})
+
+    segments = split_narrative(NARRATIVE, 200, 60)
+    assert resp.status_code == 200
+    assert len(seen) == len(segments)
+    assert active["max"] == len(segments)
+    assert all(extraction_id.rsplit("-", 1)[1].startswith("S") for extraction_id in seen)
+
+    data = resp.json()
+    fields = data["fields"]
+    assert fields["age"] == 61
+    assert fields["syncope"] is False  # one explicit denial beats silence elsewhere
+    assert fields["systolic_bp"] is None  # 150 vs 120: left for review
+    assert fields["current_meds_summary"] == "aspirin"
+    assert any(conflict.startswith("systolic_bp: narrative segments disagree") for conflict in data["possible_conflicts"])
+    assert data["missing_fields"] == ["systolic_bp", "dyspnea"]
+    assert data["missing_information"]["required_for_routing"] == ["systolic_bp", "dyspnea"]
+    assert "systolic_bp" in data["missing_information"]["unconfirmed"]
+    assert "contradictory_narrative" in data["extraction_quality_flags"]
+    assert data["confidence"] == 0.7
+
+    syncope = next(item for item in data["field_evidence"] if item["field"] == "syncope")
+    assert NARRATIVE[syncope["source_start"]:syncope["source_end"]] == "denies syncope"
+    segment = segments[syncope["segment"]]
+    assert segment.start <= syncope["source_start"] < segment.end
+    assert [item["field"] for item in data["field_evidence"]].count("age") == 1
+
+
+def test_short_narratives_use_a_single_call(monkeypatch, ai_output):
+    monkeypatch.setenv(SEGMENT_CHARS_ENV, "200")
+    with patch(
+        "api.routers.cardio_extract_router._call_openai", return_value=_segment_output(ai_output, "Page 1. 61-year-old man")
+    ) as call:
+        resp = client.post("/v1/cardio/pilot/extract", json={"case_text": "Page 1. 61-year-old man, chest pain."})
+    assert call.call_count == 1
+    evidence = resp.json()["field_evidence"][0]
+    assert (evidence["segment"], evidence["source_start"], evidence["source_end"]) == (None, 8, 23)
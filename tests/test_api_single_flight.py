@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.single_flight import SingleFlight, canonical_key
+
+
+def test_canonical_key_ignores_key_order():
+    assert canonical_key({"state": {"a": 1, "b": [1, 2]}, "context": {}}) == canonical_key(
+        {"context": {}, "state": {"b": [1, 2], "a": 1}}
+    )
+    assert canonical_key({"a": 1}) != canonical_key({"a": 2})
+
+
+def test_concurrent_identical_calls_share_one_evaluation():
+    flight = SingleFlight("test_share")
+    release = threading.Event()
+    executions = []
+
+    def evaluate(value):
+        executions.append(value)
+        release.wait(timeout=5)
+        return {"value": value}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(flight.run, "same", evaluate, 1)]
+        while flight.metrics()["in_flight"] == 0:
+            pass
+        futures += [executor.submit(flight.run, "same", evaluate, 1) for _ in range(3)]
+        while flight.metrics()["coalesced"] < 3:
+            pass
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert executions == [1]
+    assert all(result is results[0] for result in results)
+    assert flight.metrics() == {"calls": 4, "executions": 1, "coalesced": 3, "in_flight": 0}
+
+    # Nothing is cached after completion.
+    assert flight.run("same", evaluate, 2) == {"value": 2}
+    assert flight.metrics()["executions"] == 2
+
+
+def test_followers_receive_the_leader_exception():
+    flight = SingleFlight("test_error")
+    release = threading.Event()
+
+    def fail():
+        release.wait(timeout=5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.run, "k", fail)
+        while flight.metrics()["in_flight"] == 0:
+            pass
+        follower = executor.submit(flight.run, "k", fail)
+        while flight.metrics()["coalesced"] == 0:
+            pass
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match="boom"):
+                future.result(timeout=5)
+    assert flight.metrics()["in_flight"] == 0
+
+
+def test_metrics_endpoint_reports_engine_groups():
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
+    client = TestClient(app)
+    before = client.get("/v1/metrics").json()["single_flight"]["evaluate"]["calls"]
+    assert client.post("/v1/evaluate", json={"state": {}, "context": {}}).status_code == 200
+    groups = client.get("/v1/metrics").json()["single_flight"]
+    assert groups["evaluate"]["calls"] == before + 1
+    assert {"cardio_report", "pen_evaluate"} <= set(groups)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+
+from api.main import app
+from soficca_core.engine import evaluate as evaluate_decision
+from soficca_core.timing import DISABLED_STAGE_TIMINGS, current_stage_timings, record_stage_timings
+
+_DECIDED_STATE = {"frequency": "sometimes", "desire": "present", "stress": "high", "morning_erection": "normal", "wants_meds": True}
+
+
+def _server_timing_stages(header: str):
+    return [entry.split(";", 1)[0] for entry in header.split(", ")]
+
+
+def test_engines_record_nothing_outside_a_recording():
+    assert current_stage_timings() is DISABLED_STAGE_TIMINGS
+    evaluate_decision({"state": _DECIDED_STATE, "context": {}})
+
+
+def test_recording_collects_soficca_stages():
+    with record_stage_timings() as timings:
+        evaluate_decision({"state": _DECIDED_STATE, "context": {}})
+    assert list(timings.stages_ns) == ["request", "validate", "trace", "safety", "normalize", "rules", "contract"]
+    assert all(ns >= 0 for ns in timings.stages_ns.values())
+    assert current_stage_timings() is DISABLED_STAGE_TIMINGS
+
+
+def test_engine_endpoints_send_server_timing_and_log_line(caplog):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    from pen_hair_v1.examples import canonical_hypertension_request_example
+
+    client = TestClient(app)
+    with caplog.at_level(logging.INFO, logger="soficca.timing"):
+        evaluate = client.post("/v1/evaluate", json={"state": _DECIDED_STATE, "context": {}})
+    assert _server_timing_stages(evaluate.headers["server-timing"])[-2:] == ["response", "total"]
+    assert {"validate", "normalize", "safety", "rules", "trace", "contract"} <= set(
+        _server_timing_stages(evaluate.headers["server-timing"])
+    )
+    logged = json.loads(caplog.records[-1].getMessage())
+    assert logged["event"] == "stage_timings" and logged["path"] == "/v1/evaluate" and logged["status"] == 200
+    assert "rules" in logged["stages_ms"]
+
+    pen = client.post("/v1/pen/evaluate", json=canonical_hypertension_request_example())
+    assert {"validate", "normalize", "safety", "rules", "rationale", "journey", "contract"} <= set(
+        _server_timing_stages(pen.headers["server-timing"])
+    )
+
+    assert "server-timing" not in client.get("/healthz").headers
@@ -354,6 +354,38 @@ class TestSummarySafetyFilter:
         assert raw["structured_clinical_summary"] == original
         assert warnings == []
 
+    def test_spanish_decision_language_redacted(self):
+        raw = {
+            "structured_clinical_summary": "Se recomienda derivar al paciente a urgencias.",
+            "completion_questions": ["¿Desde cuándo tiene el dolor?", "¿El paciente debe acudir hoy?"],
+        }
+        warnings = sanitize_summary_and_questions(raw)
+        assert "redacted" in raw["structured_clinical_summary"].lower()
+        assert "'se recomienda' at 0, 'derivar al paciente' at 14" in warnings[0]
+        assert raw["completion_questions"] == ["¿Desde cuándo tiene el dolor?"]
+
+    def test_spanish_history_and_treatment_questions_kept(self):
+        original = "Varón de 64 años diagnosticado con diabetes hace 10 años, refiere dolor torácico opresivo."
+        questions = ["¿Le suelen administrar nitroglicerina?", "¿Le derivaron a cardiología antes?"]
+        raw = {"structured_clinical_summary": original, "completion_questions": list(questions)}
+        warnings = sanitize_summary_and_questions(raw)
+        assert raw["structured_clinical_summary"] == original
+        assert raw["completion_questions"] == questions
+        assert warnings == []
+
+    def test_every_matched_phrase_is_reported_with_offsets(self):
+        raw = {
+            "structured_clinical_summary": "Patient should be treated now; we recommend admission.",
+            "completion_questions": ["Route to cardiology? Advise the patient to rest."],
+        }
+        warnings = sanitize_summary_and_questions(raw)
+        assert warnings[0] == (
+            "structured_clinical_summary contained disallowed phrase 'patient should' at 0, "
+            "'should be treated' at 8, 'recommend' at 34 and was redacted."
+        )
+        assert "'route to' at 0, 'advise the patient' at 21" in warnings[1]
+        assert raw["completion_questions"] == []
+
 
 class TestOpenAIErrorHandling:
     """OpenAI errors return controlled HTTP responses, not 500 stack traces."""
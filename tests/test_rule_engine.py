@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+from cardio_triage_v1.rules import _ROUTING_RULESET
+from pen_hair_v1.rules import _PATH_RULESET
+from soficca_core.rule_engine import In, Is, IntRange, Rule, RuleCompileError, RuleSet, compile_ruleset
+from soficca_core.rules import _RULESET as SOFICCA_RULESET
+
+
+def _assert_tree_matches_linear(compiled, facts) -> None:
+    assert compiled.evaluate(facts) == compiled.evaluate_linear(facts)
+
+
+def test_soficca_ruleset_tree_matches_linear_for_all_signal_combinations():
+    values = [True, False, None]
+    for intermittent, meds, morning in itertools.product(values, repeat=3):
+        _assert_tree_matches_linear(
+            SOFICCA_RULESET,
+            {"intermittent_pattern": intermittent, "user_requests_meds": meds, "morning_erection_reduced": morning},
+        )
+
+
+def test_cardio_and_pen_rulesets_tree_matches_linear_on_random_facts():
+    rng = random.Random(7)
+    for _ in range(2000):
+        _assert_tree_matches_linear(
+            _ROUTING_RULESET,
+            {
+                "chest_pain_present": rng.choice([True, False, None]),
+                "exertional_chest_pain": rng.choice([True, False, None]),
+                "radiation_arm_or_jaw": rng.choice([True, False, None]),
+                "diaphoresis": rng.choice([True, False, None]),
+                "pain_severity": rng.choice(["mild", "moderate", "high", "severe", None]),
+                "cv_risk_factors_count": rng.choice([0, 1, 2, 3, None]),
+                "systolic_bp": rng.choice([85, 90, 99, 100, 140, None]),
+                "heart_rate": rng.choice([60, 100, 129, 130, None]),
+            },
+        )
+        _assert_tree_matches_linear(
+            _PATH_RULESET,
+            {
+                "cardiovascular_conditions": rng.random() < 0.2,
+                "prior_treatment_use": rng.random() < 0.5,
+                "had_side_effects": rng.random() < 0.5,
+                "scalp_sensitivities": rng.random() < 0.5,
+                "treatment_preference": rng.choice(["oral", "topical", "simple", "unknown", "balanced"]),
+                "routine_consistency": rng.choice(["high", "low", "unsure"]),
+                "priority_factor": rng.choice(["efficacy", "comfort", "safety", "n/a"]),
+                "oral_excluded": rng.random() < 0.5,
+            },
+        )
+
+
+def test_rule_priority_terminal_and_fallback_semantics():
+    compiled = compile_ruleset(
+        RuleSet(
+            name="example",
+            rules=(
+                Rule("RULE_LOW", priority=20, when=(In("tier", frozenset({"b"})),), outputs={"route": "low", "notes": ("low",)}),
+                Rule("RULE_HIGH", priority=10, when=(Is("flag", True),), outputs={"route": "high", "notes": ("high",)}),
+                Rule("RULE_STOP", priority=15, when=(IntRange("score", minimum=5),), outputs={"route": "stop"}, terminal=True),
+                Rule("RULE_NOTE", priority=30, when=(Is("flag", True),), outputs={"notes": ("note",)}, traced=False),
+            ),
+            fallback=Rule("RULE_DEFAULT", outputs={"route": "default"}),
+        )
+    )
+
+    assert compiled.rule_ids == ["RULE_HIGH", "RULE_STOP", "RULE_LOW", "RULE_NOTE"]
+
+    outcome = compiled.evaluate({"flag": True, "tier": "b"})
+    assert outcome.rules_triggered == ("RULE_HIGH", "RULE_LOW")
+    assert outcome.matched_rule_ids == ("RULE_HIGH", "RULE_LOW", "RULE_NOTE")
+    assert outcome.outputs["route"] == "high"
+    assert outcome.outputs["notes"] == ("high", "low", "note")
+
+    assert compiled.evaluate({"flag": True, "tier": "b", "score": 9}).rules_triggered == ("RULE_HIGH", "RULE_STOP")
+    assert compiled.evaluate({"score": True}).outputs["route"] == "default"
+    assert compiled.evaluate({}).rules_triggered == ("RULE_DEFAULT",)
+    with pytest.raises(TypeError):
+        compiled.evaluate({}).outputs["route"] = "changed"
+
+
+def test_duplicate_rule_ids_are_rejected():
+    with pytest.raises(RuleCompileError):
+        compile_ruleset(RuleSet(name="dup", rules=(Rule("RULE_A"), Rule("RULE_A"))))